@@ -4,46 +4,166 @@ from ConfigValidator.Config.Models.RunTableModel import RunTableModel
 from ConfigValidator.Config.Models.FactorModel import FactorModel
 from ConfigValidator.Config.Models.RunnerContext import RunnerContext
 from ConfigValidator.Config.Models.OperationType import OperationType
+from ConfigValidator.Config.Models.SchedulingStrategy import SchedulingStrategy
+from ConfigValidator.Config.Models.BaselineModel import BaselineModel, BaselineCorrection
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
-from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from os.path import dirname, realpath
 import re
 import os
+import hashlib
 import signal
 import pandas as pd
 import time
 import subprocess
 import shlex
+import sys
+
+# ================================ DEFINE YOUR SUITE HERE ================================
+
+# All script variants to measure, relative to this folder. Every entry becomes one treatment of the `script`
+# factor, so the whole suite runs as a single experiment with one consolidated run table.
+# A subset can be selected with the SCRIPTS environment variable (comma separated), e.g.
+#   SCRIPTS=original/dijkstra_origin.py,single_guideline/dijkstra_code.py python experiment-runner/ ...
+SCRIPTS_TO_RUN = [
+    "original/dijkstra_origin.py",
+    "single_guideline/dijkstra_code.py",
+    "single_guideline/dijkstra_multi.py",
+    "single_guideline/dijkstra_native.py",
+    "single_guideline/dijkstra_function.py",
+    "single_guideline/dijkstra_object.py",
+    "single_guideline/dijkstra_network.py",
+    "single_guideline/dijkstra_other.py",
+    "multiple_guideline/dijkstra_mixed.py",
+    "original/floyd_origin.py",
+    "single_guideline/floyd_code.py",
+    "single_guideline/floyd_function.py",
+    "single_guideline/floyd_multi.py",
+    "single_guideline/floyd_native.py",
+    "single_guideline/floyd_object.py",
+    "single_guideline/floyd_other.py",
+    "multiple_guideline/floyd_mixed.py",
+    "multiple_guideline/floyd_code_function.py",
+    "multiple_guideline/floyd_code_native.py",
+    "multiple_guideline/floyd_native_function.py",
+    "original/knapsack_origin.py",
+    "single_guideline/knapsack_code.py",
+    "single_guideline/knapsack_function.py",
+    "single_guideline/knapsack_native.py",
+    "single_guideline/knapsack_object.py",
+    "single_guideline/knapsack_other.py",
+    "multiple_guideline/knapsack_mixed.py",
+    "multiple_guideline/knapsack_code_function.py",
+    "multiple_guideline/knapsack_code_native.py",
+    "multiple_guideline/knapsack_native_function.py",
+    "original/edit_distance_origin.py",
+    "single_guideline/edit_distance_code.py",
+    "single_guideline/edit_distance_function.py",
+    "single_guideline/edit_distance_native.py",
+    "single_guideline/edit_distance_object.py",
+    "single_guideline/edit_distance_other.py",
+    "multiple_guideline/edit_distance_mixed.py",
+    "multiple_guideline/edit_distance_code_function.py",
+    "multiple_guideline/edit_distance_code_native.py",
+    "multiple_guideline/edit_distance_native_function.py",
+    "original/longest_common_subsequence_origin.py",
+    "single_guideline/longest_common_subsequence_code.py",
+    "single_guideline/longest_common_subsequence_function.py",
+    "single_guideline/longest_common_subsequence_native.py",
+    "single_guideline/longest_common_subsequence_object.py",
+    "single_guideline/longest_common_subsequence_other.py",
+    "multiple_guideline/longest_common_subsequence_mixed.py",
+    "original/matrix_chain_multiplication_origin.py",
+    "single_guideline/matrix_chain_multiplication_code.py",
+    "single_guideline/matrix_chain_multiplication_function.py",
+    "single_guideline/matrix_chain_multiplication_native.py",
+    "single_guideline/matrix_chain_multiplication_object.py",
+    "single_guideline/matrix_chain_multiplication_other.py",
+    "multiple_guideline/matrix_chain_multiplication_mixed.py",
+    "original/matrix_chain_order_origin.py",
+    "single_guideline/matrix_chain_order_code.py",
+    "single_guideline/matrix_chain_order_function.py",
+    "single_guideline/matrix_chain_order_native.py",
+    "single_guideline/matrix_chain_order_object.py",
+    "single_guideline/matrix_chain_order_other.py",
+    "multiple_guideline/matrix_chain_order_mixed.py",
+    "original/rod_cutting_origin.py",
+    "single_guideline/rod_cutting_code.py",
+    "single_guideline/rod_cutting_function.py",
+    "single_guideline/rod_cutting_native.py",
+    "single_guideline/rod_cutting_object.py",
+    "single_guideline/rod_cutting_other.py",
+    "multiple_guideline/rod_cutting_mixed.py",
+    "original/fibonacci_origin.py",
+    "single_guideline/fibonacci_code.py",
+    "single_guideline/fibonacci_native.py",
+    "single_guideline/fibonacci_object.py",
+    "single_guideline/fibonacci_other.py",
+    "multiple_guideline/fibonacci_mixed.py",
+    "multiple_guideline/fibonacci_code_func.py",
+    "multiple_guideline/fibonacci_code_native.py",
+    "multiple_guideline/fibonacci_native_function.py",
+    "original/levenshtein_distance_origin.py",
+    "single_guideline/levenshtein_distance_code.py",
+    "single_guideline/levenshtein_distance_function.py",
+    "single_guideline/levenshtein_distance_native.py",
+    "single_guideline/levenshtein_distance_object.py",
+    "single_guideline/levenshtein_distance_other.py",
+    "multiple_guideline/levenshtein_distance_mixed.py"
+]
+
+ALGORITHMS = [
+    "dijkstra",
+    "edit_distance",
+    "fibonacci",
+    "floyd",
+    "knapsack",
+    "levenshtein_distance",
+    "longest_common_subsequence",
+    "matrix_chain_multiplication",
+    "matrix_chain_order",
+    "rod_cutting",
+]
+
+
+def describe_script(script: str) -> Dict[str, str]:
+    """Derive the base algorithm and the applied optimization method(s) from a script path,
+    e.g. 'multiple_guideline/edit_distance_code_native.py' -> base_algo 'edit_distance', optimize_method 'code,native'"""
+    stem = Path(script).stem
+    base_algo = next((algo for algo in ALGORITHMS if stem.startswith(f"{algo}_")), "unknown")
+    methods = stem[len(base_algo) + 1:] if base_algo != "unknown" else stem
+    methods = "code_function" if methods == "code_func" else methods
+    return {'base_algo': base_algo, 'optimize_method': methods.replace("_", ",")}
 
 
 class RunnerConfig:
     ROOT_DIR = Path(dirname(realpath(__file__)))
 
     # ================================ USER SPECIFIC CONFIG ================================
-    
-    # MODIFICATION 1: Define ONLY ONE script to run for this experiment.
-    # To run a different script, change this line and run the experiment again.
-    SCRIPT_TO_RUN: str = os.getenv('SCRIPT_TO_RUN', 'bubble_sort.py')
-    # SCRIPT_TO_RUN: str = "quick_sort.py" # <-- Example for the next run
 
-    # Define how many times to repeat the experiment for the script above.
+    # The scripts measured in this experiment
+    SCRIPTS: List[str] = [script for script in os.getenv('SCRIPTS', ','.join(SCRIPTS_TO_RUN)).split(',') if script]
+
+    # Define how many times to repeat each script.
     REPETITIONS: int = 10
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    name: str = "" # This will be set dynamically below
+    # A subset of the suite is a different experiment: it gets its own name (and run table) instead of resuming,
+    # or being refused by, the run table of the whole suite
+    name:                       str             = "script_suite" if sorted(SCRIPTS) == sorted(SCRIPTS_TO_RUN) else \
+        f"script_suite_{hashlib.sha1(','.join(sorted(SCRIPTS)).encode()).hexdigest()[:8]}"
     results_output_path:        Path             = ROOT_DIR / 'experiments'
     operation_type:             OperationType   = OperationType.AUTO
     time_between_runs_in_ms:    int             = 1000
 
+    # Measure the overhead of EnergiBridge itself in idle baseline runs, e.g.
+    # BaselineModel({'cpu_energy_j': BaselineCorrection.AMOUNT, 'cpu_usage_percent': BaselineCorrection.LEVEL,
+    #                'memory_usage_mb': BaselineCorrection.LEVEL}, initial_runs=3, interval=20)
+    baseline:                   BaselineModel   = None
+
     def __init__(self):
         """Executes immediately after program start, on config load"""
 
-        # MODIFICATION 2: Generate a unique folder name for the single script being tested.
-        script_stem = Path(self.SCRIPT_TO_RUN).stem
-        self.name = f"{script_stem}_experiment_{self.timestamp}"
-
         EventSubscriptionController.subscribe_to_multiple_events([
             (RunnerEvents.BEFORE_EXPERIMENT, self.before_experiment),
             (RunnerEvents.BEFORE_RUN       , self.before_run       ),
@@ -56,56 +176,49 @@ class RunnerConfig:
             (RunnerEvents.AFTER_EXPERIMENT , self.after_experiment )
         ])
         self.run_table_model = None
-        self.all_run_data = []
         output.console_log("Custom config loaded")
-        output.console_log(f"Experiment name set to: {self.name}")
+        output.console_log(f"Running a suite of {len(self.SCRIPTS)} scripts")
 
     def create_run_table_model(self) -> RunTableModel:
         """Create and return the run_table model here."""
-        # MODIFICATION 3: Factors are now simpler as we are only running one script.
-        repetition_factor = FactorModel("repetition", list(range(1, self.REPETITIONS + 1)))
+        script_factor = FactorModel("script", self.SCRIPTS)
         sampling_factor = FactorModel("sampling", [200])
 
+        # Each repetition is a block running every script once, in a random order. Slow thermal and frequency
+        # drift is thereby spread evenly across the scripts instead of biasing whichever script runs last.
         self.run_table_model = RunTableModel(
-            factors=[repetition_factor, sampling_factor],
-            data_columns=['execution_time_ms', 'cpu_usage_percent', 'memory_usage_mb', 'cpu_energy_j']
+            factors=[script_factor, sampling_factor],
+            repetitions=self.REPETITIONS,
+            scheduling=SchedulingStrategy.RANDOMIZED_BLOCKS,
+            data_columns=['base_algo', 'optimize_method',
+                          'execution_time_ms', 'cpu_usage_percent', 'memory_usage_mb', 'cpu_energy_j']
         )
         return self.run_table_model
 
     def start_measurement(self, context: RunnerContext) -> None:
-            # MODIFICATION 4: The script path is now taken directly from the class variable.
-            script_to_run_path = self.ROOT_DIR / self.SCRIPT_TO_RUN
-            repetition_num = context.execute_run['repetition']
-            
-            output.console_log(f"Starting measurement for '{self.SCRIPT_TO_RUN}' (Repetition #{repetition_num})")
+            script = context.execute_run['script']
+            script_to_run_path = self.ROOT_DIR / script
+            output.console_log(f"Starting measurement for '{script}' ({context.execute_run['__run_id']})")
 
             script_output_path = context.run_dir / "execution_time.txt"
             sampling_interval = context.execute_run['sampling']
 
+            # A baseline run measures the idle system for as long as the runner waits, instead of the script
+            target_cmd = f'{sys.executable} {script_to_run_path} {script_output_path}'
+            if context.is_baseline:
+                target_cmd = f'sleep {self.baseline.duration_in_ms / 1000}'
+
             profiler_cmd = f'sudo energibridge \
                             --interval {sampling_interval} \
                             --output {context.run_dir / "energibridge.csv"} \
                             --summary \
-                            /home/pluxbox/Desktop/experiment-runner/venv/bin/python {script_to_run_path} {script_output_path}'
+                            {target_cmd}'
 
             energibridge_log = open(f'{context.run_dir}/energibridge.log', 'w')
             self.profiler = subprocess.Popen(shlex.split(profiler_cmd), stdout=energibridge_log)
-    
+
     def after_experiment(self) -> None:
-        """Saves the aggregated results into a single CSV inside the experiment's folder."""
-        if not self.all_run_data:
-            output.console_log("No data was collected, skipping CSV export.")
-            return
-
-        results_df = pd.DataFrame(self.all_run_data)
-        
-        # MODIFICATION 5: Simplified saving. No need to split files as this whole folder is for one script.
-        script_stem = Path(self.SCRIPT_TO_RUN).stem
-        output_filename = f"{script_stem}_final_results.csv"
-        output_file_path = self.experiment_path / output_filename
-        
-        results_df.to_csv(output_file_path, index=False)
-        output.console_log(f"✅ Experiment results successfully saved to: {output_file_path}")
+        output.console_log(f"Results of all scripts are stored in: {self.experiment_path / 'run_table.csv'}")
 
     # No changes needed for the methods below this line
     # ... (before_experiment, before_run, start_run, interact, etc.) ...
@@ -117,8 +230,7 @@ class RunnerConfig:
         pass
 
     def start_run(self, context: RunnerContext) -> None:
-            if not hasattr(self, 'experiment_path'):
-                self.experiment_path = context.experiment_path
+        pass
 
     def interact(self, context: RunnerContext) -> None:
         output.console_log("Waiting for the process to complete...")
@@ -126,17 +238,15 @@ class RunnerConfig:
         output.console_log("Process finished.")
 
     def stop_measurement(self, context: RunnerContext) -> None:
-        pass
+        # interact() is not called in baseline runs
+        if context.is_baseline:
+            self.profiler.wait()
 
     def stop_run(self, context: RunnerContext) -> None:
         pass
     
     def populate_run_data(self, context: RunnerContext) -> Optional[Dict[str, Any]]:
         try:
-            script_output_path = context.run_dir / "execution_time.txt"
-            with open(script_output_path, 'r') as f:
-                execution_time_ms = float(f.read().strip()) * 1000.0
-
             csv_path = context.run_dir / "energibridge.csv"
             df = pd.read_csv(csv_path, on_bad_lines='skip')
             df.dropna(inplace=True)
@@ -148,17 +258,22 @@ class RunnerConfig:
             cpu_energy = df['CPU_ENERGY (J)'].iloc[-1] - df['CPU_ENERGY (J)'].iloc[0]
 
             run_data = {
-                'execution_time_ms': round(execution_time_ms, 3),
                 'cpu_usage_percent': round(overall_avg_cpu_usage, 3),
                 'memory_usage_mb': round(avg_memory_usage_mb, 3),
                 'cpu_energy_j': round(cpu_energy, 3)
             }
-            
-            # We manually add the script name to the data for clarity in the final CSV
-            full_run_details = {**context.execute_run, **run_data}
-            full_run_details['script_name'] = self.SCRIPT_TO_RUN
-            self.all_run_data.append(full_run_details)
-            return run_data
+            if context.is_baseline:
+                return run_data  # No script was executed
+
+            script_output_path = context.run_dir / "execution_time.txt"
+            with open(script_output_path, 'r') as f:
+                execution_time_ms = float(f.read().strip()) * 1000.0
+
+            return {
+                **describe_script(context.execute_run['script']),
+                'execution_time_ms': round(execution_time_ms, 3),
+                **run_data
+            }
         except (FileNotFoundError, IndexError, KeyError, ValueError) as e:
             output.console_log(f"❌ Error processing {csv_path}: {type(e).__name__}: {e}")
             return None
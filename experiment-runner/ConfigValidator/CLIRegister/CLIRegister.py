@@ -1,12 +1,19 @@
 import os
+import json
 import uuid
+import socket
 import inspect
+import multiprocessing
 from typing import List
+from pathlib import Path
 from shutil import copyfile
 from tabulate import tabulate
 
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
+from ConfigValidator.Config.Validation.ConfigValidator import ConfigValidator
+from ConfigValidator.CustomErrors.BaseError import BaseError
 from ExperimentOrchestrator.Misc.BashHeaders import BashHeaders
+from ExperimentOrchestrator.Misc.ConfigLoading import load_config_module
 from ExperimentOrchestrator.Misc.PathValidation import is_path_exists_or_creatable_portable
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 from ConfigValidator.CustomErrors.CLIErrors import *
@@ -77,6 +84,169 @@ class Prepare:
     def execute(args=None) -> None:
         pass
 
+class Worker:
+    @staticmethod
+    def description_params() -> str:
+        return "<path_to_config.py> [worker_id]"
+
+    @staticmethod
+    def description_short() -> str:
+        return "Execute runs leased by a distributed experiment (see `distributed_lease_dir`)"
+
+    @staticmethod
+    def description_long() -> str:
+        output.console_log_bold("Worker executes the runs of a distributed experiment on this machine.\n"
+                                "Start the experiment as usual (python experiment-runner/ <path_to_config.py>) on "
+                                "the coordinating machine, and a worker on every measurement machine. All machines "
+                                "need access to the `distributed_lease_dir` of the config, e.g. on a network share.\n"
+                                "The worker_id defaults to <hostname>-<pid>. The worker stops once the experiment "
+                                "is completed.")
+
+    @staticmethod
+    def execute(args=None) -> None:
+        if args is None or len(args) not in [3, 4]:
+            raise CommandNotRecognisedError
+
+        config_path = args[2]
+        if not os.path.isfile(config_path):
+            raise InvalidConfigFileSpecifiedError(config_path)
+
+        multiprocessing.set_start_method('fork')
+        config_file = load_config_module(config_path)
+        if not hasattr(config_file, 'RunnerConfig'):
+            raise InvalidConfigFileSpecifiedError(config_path)
+
+        config = config_file.RunnerConfig()
+        ConfigValidator.validate_config(config)
+        if not config.distributed_lease_dir:
+            raise BaseError("The config does not define a distributed_lease_dir to receive runs from!")
+
+        from ExperimentOrchestrator.Distributed.DistributedWorker import serve_config
+
+        worker_id = args[3] if len(args) == 4 else f"{socket.gethostname()}-{os.getpid()}"
+        serve_config(config, worker_id)
+
+class Summary:
+    @staticmethod
+    def description_params() -> str:
+        return "<path_to_experiment_output_dir>"
+
+    @staticmethod
+    def description_short() -> str:
+        return "Show the live per-treatment aggregates of a running or completed experiment"
+
+    @staticmethod
+    def description_long() -> str:
+        output.console_log_bold("Summary shows the number of results, mean, standard deviation and median (p50) of "
+                                "every numeric data column, per treatment, as maintained in summary.json by a "
+                                "running or completed experiment. The experiment output dir is the `experiment_path` "
+                                "of the config (results_output_path / name).")
+
+    @staticmethod
+    def execute(args=None) -> None:
+        if args is None or len(args) != 3:
+            raise CommandNotRecognisedError
+
+        from ExperimentOrchestrator.Experiment.StreamingAggregates import read_summary
+
+        try:
+            summary = read_summary(Path(args[2]))
+        except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
+            raise SummaryNotFoundError(args[2])
+
+        rows = []
+        for treatment, aggregates in summary['treatments'].items():
+            levels = ', '.join(f"{factor}={level}" for factor, level in aggregates['factors'].items())
+            for column, aggregate in aggregates['columns'].items():
+                rows.append((treatment, levels, column, aggregate['count'], aggregate['mean'], aggregate['stdev'],
+                             aggregate['p50']))
+
+        print(tabulate(rows, ["Treatment", "Factors", "Column", "n", "Mean", "Stdev", "Median"], floatfmt=".4g"))
+        output.console_log_OK(f"{summary['runs_done']} runs done, last updated {summary['updated']}")
+
+class Collect:
+    @staticmethod
+    def description_params() -> str:
+        return "<path_to_experiments_dir> [output_file]"
+
+    @staticmethod
+    def description_short() -> str:
+        return "Combine the run tables of all experiments below a directory into one dataset"
+
+    @staticmethod
+    def description_long() -> str:
+        output.console_log_bold("Collect combines every run_table.csv below the given directory into one dataset, "
+                                "with the experiment name (the output folder without its timestamp) as first column. "
+                                "The output file defaults to all_run_tables_combined.parquet (or .csv without pyarrow) "
+                                "in the given directory; its extension selects the format.\n"
+                                "Parsed run tables are cached next to the output file, by file modification time and "
+                                "size, so collecting again only parses new or changed run tables. The collected files "
+                                "are listed in collect_manifest.json.")
+
+    @staticmethod
+    def execute(args=None) -> None:
+        if args is None or len(args) not in [3, 4]:
+            raise CommandNotRecognisedError
+
+        root = Path(args[2])
+        if not root.is_dir():
+            raise InvalidUserSpecifiedPathError(args[2])
+
+        from ExperimentOrchestrator.Analysis.RunTableCollector import RunTableCollector
+
+        collector = RunTableCollector(root, Path(args[3]) if len(args) == 4 else None)
+        manifest = collector.collect()
+        if not manifest['files']:
+            output.console_log_WARNING(f"No run_table.csv found in: {root}")
+            return
+        output.console_log_OK(f"Collected {len(manifest['files'])} run tables ({manifest['changed']} new or changed), "
+                              f"{manifest['rows']} rows, in: {collector.output_file}")
+
+class Analyze:
+    @staticmethod
+    def description_params() -> str:
+        return "<dataset> <metric> <treatment_column> <baseline> <pair_columns> [output_file]"
+
+    @staticmethod
+    def description_short() -> str:
+        return "Compare every treatment of a (collected) dataset to a baseline treatment"
+
+    @staticmethod
+    def description_long() -> str:
+        output.console_log_bold("Analyze computes, per level of the treatment column of a dataset (.csv or .parquet, "
+                                "e.g. made by `collect`), the N, mean, median and standard deviation of the metric, "
+                                "and compares it to the baseline level with a paired Wilcoxon signed-rank test and "
+                                "the rank-biserial correlation r, with a 95% bootstrap confidence interval.\n"
+                                "Runs are paired on the comma-separated pair columns (e.g. base_algo,repetition). "
+                                "Without repetition or treatment columns, they are derived from the __run_id of "
+                                "every run.\n"
+                                "The table is printed, and written to the output file if given.\n"
+                                "example: python experiment-runner/ analyze results.csv cpu_energy_j optimize_method "
+                                "origin base_algo,repetition table.csv")
+
+    @staticmethod
+    def execute(args=None) -> None:
+        if args is None or len(args) not in [7, 8]:
+            raise CommandNotRecognisedError
+
+        import pandas as pd
+        from ExperimentOrchestrator.Analysis.HypothesisTests import hypothesis_table
+
+        dataset = Path(args[2])
+        if not dataset.is_file():
+            raise InvalidUserSpecifiedPathError(args[2])
+        data = pd.read_parquet(dataset) if dataset.suffix == '.parquet' else pd.read_csv(dataset)
+
+        try:
+            table = hypothesis_table(data, args[3], args[4], args[5], args[6].split(','))
+        except ValueError as e:
+            raise BaseError(str(e))
+
+        print(tabulate(table, headers='keys', showindex=False, floatfmt=".4g"))
+        if len(args) == 8:
+            table.to_csv(args[7], index=False)
+            output.console_log_OK(f"Saved to: {args[7]}")
+
 class Help:
     @staticmethod
     def description_params() -> str:
@@ -106,6 +276,10 @@ class CLIRegister:
     register = {
         "config-create":    ConfigCreate,
         "prepare":          Prepare,
+        "worker":           Worker,
+        "summary":          Summary,
+        "collect":          Collect,
+        "analyze":          Analyze,
         "help":             Help
     }
 
@@ -0,0 +1,75 @@
+from enum import Enum, auto
+from typing import Dict, List, Optional, Union
+
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+
+class BaselineCorrection(Enum):
+    """A quantity accumulated during the measurement, e.g. energy in J or CPU time: the overhead is the rate of
+    the baseline runs (per second of measurement) times the length of the measurement window of the run."""
+    AMOUNT = auto()
+
+    """A level averaged over the measurement, e.g. power in W or CPU utilization: the overhead is the average
+    level of the baseline runs."""
+    LEVEL = auto()
+
+
+class BaselineModel:
+    def __init__(self,
+                 columns: Optional[Union[List[str], Dict[str, BaselineCorrection]]] = None,
+                 initial_runs: int = 3,
+                 interval: int = 0,
+                 duration_in_ms: int = 10000,
+                 history: int = 5
+                 ):
+        """Measure the overhead of the profilers themselves in idle baseline runs: the measurement is started and
+        stopped (START_MEASUREMENT, STOP_MEASUREMENT, POPULATE_RUN_DATA) as for any run, but nothing is run in
+        between for `duration_in_ms`. `initial_runs` baseline runs are executed when the experiment (re)starts,
+        and one after every `interval` runs (0 = only at the start), to follow any drift of the overhead.
+
+        For every data column in `columns` (all data columns by default, as AMOUNTs), a `<column>_net` column holds
+        its value minus the overhead, estimated from the last `history` baseline runs."""
+        if initial_runs < 0 or interval < 0:
+            raise BaseError("Baseline initial_runs and interval cannot be negative!")
+
+        if initial_runs == 0 and interval == 0:
+            raise BaseError("Baselines require initial_runs or an interval!")
+
+        if duration_in_ms <= 0 or history < 1:
+            raise BaseError("Baseline duration_in_ms and history must be positive!")
+
+        if isinstance(columns, list):
+            columns = {column: BaselineCorrection.AMOUNT for column in columns}
+        if columns is not None and not all(isinstance(correction, BaselineCorrection)
+                                           for correction in columns.values()):
+            raise BaseError("Baseline columns must map data columns to a BaselineCorrection!")
+
+        self.__columns = columns
+        self.__initial_runs = initial_runs
+        self.__interval = interval
+        self.__duration_in_ms = duration_in_ms
+        self.__history = history
+
+    @property
+    def columns(self) -> Optional[Dict[str, BaselineCorrection]]:
+        return self.__columns
+
+    @property
+    def initial_runs(self) -> int:
+        return self.__initial_runs
+
+    @property
+    def interval(self) -> int:
+        return self.__interval
+
+    @property
+    def duration_in_ms(self) -> int:
+        return self.__duration_in_ms
+
+    @property
+    def history(self) -> int:
+        return self.__history
+
+    def __str__(self):
+        return f"BaselineModel({self.__initial_runs} initial runs, every {self.__interval} runs, " \
+               f"{self.__duration_in_ms}ms)"
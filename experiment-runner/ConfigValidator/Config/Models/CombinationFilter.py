@@ -0,0 +1,203 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ExtendedTyping.Typing import SupportsStr
+
+# An excluded combination of treatment levels (every combination of the listed levels of the listed factors), or a
+# predicate on a row of factor levels, e.g. `lambda row: row['threads'] > row['cores']`, excluding the rows it holds for
+Exclusion = Union[Dict[FactorModel, List[SupportsStr]], Callable[[Mapping], bool]]
+
+
+class _Undecided(Exception):
+    """A predicate read a factor that is not assigned yet (deliberately not a KeyError, which `Mapping.get` and `in`
+    would swallow)"""
+
+
+class _PartialRow(Mapping):
+    """The factor levels of the first factors of a combination, as passed to predicates"""
+
+    def __init__(self, factor_names: List[str]):
+        self.__factor_names = factor_names
+        self.__positions = {name: i for i, name in enumerate(factor_names)}
+        self.levels: List[SupportsStr] = []
+
+    def __getitem__(self, factor_name: str) -> SupportsStr:
+        position = self.__positions[factor_name]
+        if position >= len(self.levels):
+            raise _Undecided(factor_name)
+        return self.levels[position]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__factor_names)
+
+    def __len__(self) -> int:
+        return len(self.__factor_names)
+
+
+class TreatmentRanges(Sequence):
+    """The included treatment numbers, stored as ranges of consecutive numbers; indexed by bisection"""
+
+    def __init__(self, ranges: Iterator[Tuple[int, int]]):
+        self.__starts = array('q')
+        self.__offsets = array('q')     # number of included treatments before each range
+        total = 0
+        for start, stop in ranges:
+            self.__starts.append(start)
+            self.__offsets.append(total)
+            total += stop - start
+        self.__len = total
+
+    @property
+    def nr_of_ranges(self) -> int:
+        return len(self.__starts)
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self.__len
+        if not 0 <= index < self.__len:
+            raise IndexError("treatment index out of range")
+        i = bisect_right(self.__offsets, index) - 1
+        return self.__starts[i] + index - self.__offsets[i]
+
+
+###     =========================================================
+###     |                                                       |
+###     |                    CombinationFilter                  |
+###     |       - Compiles the exclusions of a RunTableModel    |
+###     |         and enumerates the included treatments        |
+###     |       - Excluded combinations become one bitmask per  |
+###     |         factor level, of the exclusions it matches    |
+###     |       - Treatments are enumerated depth-first over    |
+###     |         the factors, so a decided prefix includes or  |
+###     |         excludes its whole subtree at once            |
+###     |                                                       |
+###     |       * Predicates are tried on every prefix; reading |
+###     |         an unassigned factor defers them to the next  |
+###     |         factor, so they must only depend on the row   |
+###     |                                                       |
+###     =========================================================
+class CombinationFilter:
+
+    def __init__(self, factors: List[FactorModel], exclusions: List[Exclusion]):
+        self.__factor_names = [factor.factor_name for factor in factors]
+        self.__levels = [factor.treatments for factor in factors]
+        self.__predicates: List[Callable[[Mapping], bool]] = []
+        self.__excludes_all = False
+
+        # matches[k][level]: the (dict) exclusions matching that level of factor k, i.e. excluding it or not
+        # constraining factor k; completes[k]: the exclusions constraining no factor after k
+        positions = {factor.factor_name: k for k, factor in enumerate(factors)}
+        self.__matches = [[0] * len(levels) for levels in self.__levels]
+        self.__completes = [0] * len(factors)
+
+        bit = 1
+        for exclusion in exclusions:
+            if callable(exclusion):
+                self.__predicates.append(exclusion)
+                continue
+            if not isinstance(exclusion, dict):
+                raise BaseError(f"An exclusion must be a dict of factors and levels or a predicate, not {exclusion!r}!")
+            if len(exclusion) == 0:
+                self.__excludes_all = True
+                continue
+
+            constrained = {}
+            for factor, excluded_levels in exclusion.items():
+                if factor.factor_name not in positions:
+                    raise BaseError(f"Excluded factor {factor.factor_name} is not a factor of the run table!")
+                constrained[positions[factor.factor_name]] = excluded_levels
+
+            for k, levels in enumerate(self.__levels):
+                for i, level in enumerate(levels):
+                    if k not in constrained or level in constrained[k]:
+                        self.__matches[k][i] |= bit
+            self.__completes[max(constrained)] |= bit
+            bit <<= 1
+        self.__all_exclusions = bit - 1
+
+    @property
+    def excludes_any(self) -> bool:
+        return self.__all_exclusions != 0 or len(self.__predicates) > 0 or self.__excludes_all
+
+    def included_ranges(self) -> Iterator[Tuple[int, int]]:
+        """The (start, stop) ranges of the (mixed-radix) numbers of the included combinations, in increasing
+        order and merged where consecutive"""
+        if self.__excludes_all or len(self.__levels) == 0:
+            if not self.__excludes_all and not any(predicate({}) for predicate in self.__predicates):
+                yield 0, 1
+            return
+
+        # Number of combinations in a subtree below factor k
+        spans = [1] * (len(self.__levels) + 1)
+        for k in reversed(range(len(self.__levels))):
+            spans[k] = spans[k + 1] * len(self.__levels[k])
+
+        row = _PartialRow(self.__factor_names)
+        pending_range = None
+
+        def visit(k: int, first: int, alive: int, predicates: List[Callable]) -> Iterator[Tuple[int, int]]:
+            matches, completes, levels, span = self.__matches[k], self.__completes[k], self.__levels[k], spans[k + 1]
+            for i, level in enumerate(levels):
+                matching = alive & matches[i]
+                if matching & completes:
+                    continue
+
+                undecided = []
+                excluded = False
+                if predicates:
+                    row.levels.append(level)
+                    for predicate in predicates:
+                        try:
+                            if predicate(row):
+                                excluded = True
+                                break
+                        except _Undecided:
+                            undecided.append(predicate)
+                    row.levels.pop()
+                if excluded:
+                    continue
+
+                start = first + i * span
+                if matching == 0 and not undecided:
+                    yield start, start + span
+                else:
+                    row.levels.append(level)
+                    yield from visit(k + 1, start, matching, undecided)
+                    row.levels.pop()
+
+        for start, stop in visit(0, 0, self.__all_exclusions, self.__predicates):
+            if pending_range is not None and pending_range[1] == start:
+                pending_range = (pending_range[0], stop)
+                continue
+            if pending_range is not None:
+                yield pending_range
+            pending_range = (start, stop)
+        if pending_range is not None:
+            yield pending_range
+
+    def excludes(self, point: Sequence) -> bool:
+        """Whether the combination of level indices `point` (one per factor) is excluded"""
+        if self.__excludes_all:
+            return True
+        alive = self.__all_exclusions
+        for k, i in enumerate(point):
+            alive &= self.__matches[k][i]
+            if alive & self.__completes[k]:
+                return True
+
+        row = _PartialRow(self.__factor_names)
+        row.levels = [levels[i] for levels, i in zip(self.__levels, point)]
+        return any(predicate(row) for predicate in self.__predicates)
+
+    def included_treatments(self) -> Optional[TreatmentRanges]:
+        """The numbers of the included combinations of factor levels, None if nothing is excluded"""
+        if not self.excludes_any:
+            return None
+        return TreatmentRanges(self.included_ranges())
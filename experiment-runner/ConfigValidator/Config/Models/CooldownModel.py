@@ -0,0 +1,79 @@
+from enum import Enum, auto
+from typing import Callable, Optional
+
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+
+class CooldownSensor(Enum):
+    """The highest CPU (package) temperature reported by the kernel, in degrees Celsius."""
+    CPU_TEMPERATURE = auto()
+
+    """The CPU package power, in Watt, sampled from the RAPL energy counters over one poll interval."""
+    PACKAGE_POWER = auto()
+
+    """A user supplied `read_sensor` callable, e.g. wrapping a DataSource plugin, returning a float."""
+    CUSTOM = auto()
+
+
+class CooldownModel:
+    def __init__(self,
+                 sensor: CooldownSensor = CooldownSensor.CPU_TEMPERATURE,
+                 min_wait_in_ms: int = 0,
+                 max_wait_in_ms: int = 60000,
+                 tolerance: float = 0.05,
+                 poll_interval_in_ms: int = 500,
+                 baseline_samples: int = 5,
+                 read_sensor: Optional[Callable[[], float]] = None
+                 ):
+        """Instead of waiting a fixed `time_between_runs_in_ms`, wait until the sensor reading is back within
+        `tolerance` (relative) of the idle baseline recorded at the start of the experiment,
+        but at least `min_wait_in_ms` and at most `max_wait_in_ms`."""
+        if sensor is CooldownSensor.CUSTOM and read_sensor is None:
+            raise BaseError("A read_sensor callable is required for CooldownSensor.CUSTOM!")
+
+        if min_wait_in_ms < 0 or max_wait_in_ms < min_wait_in_ms:
+            raise BaseError("Cooldown bounds must satisfy 0 <= min_wait_in_ms <= max_wait_in_ms!")
+
+        if poll_interval_in_ms <= 0 or baseline_samples < 1 or tolerance < 0:
+            raise BaseError("Cooldown poll_interval_in_ms and baseline_samples must be positive, "
+                            "and tolerance cannot be negative!")
+
+        self.__sensor = sensor
+        self.__min_wait_in_ms = min_wait_in_ms
+        self.__max_wait_in_ms = max_wait_in_ms
+        self.__tolerance = tolerance
+        self.__poll_interval_in_ms = poll_interval_in_ms
+        self.__baseline_samples = baseline_samples
+        self.__read_sensor = read_sensor
+
+    @property
+    def sensor(self) -> CooldownSensor:
+        return self.__sensor
+
+    @property
+    def min_wait_in_ms(self) -> int:
+        return self.__min_wait_in_ms
+
+    @property
+    def max_wait_in_ms(self) -> int:
+        return self.__max_wait_in_ms
+
+    @property
+    def tolerance(self) -> float:
+        return self.__tolerance
+
+    @property
+    def poll_interval_in_ms(self) -> int:
+        return self.__poll_interval_in_ms
+
+    @property
+    def baseline_samples(self) -> int:
+        return self.__baseline_samples
+
+    @property
+    def read_sensor(self) -> Optional[Callable[[], float]]:
+        return self.__read_sensor
+
+    def __str__(self):
+        return f"CooldownModel({self.__sensor.name}, {self.__min_wait_in_ms}-{self.__max_wait_in_ms}ms, " \
+               f"tolerance={self.__tolerance})"
@@ -0,0 +1,306 @@
+import itertools
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+
+# First rows of the cyclic Plackett-Burman designs whose number of runs is not a power of two
+PLACKETT_BURMAN_GENERATORS = {
+    12: "++-+++---+-",
+    20: "++--++++-+-+----++-",
+    24: "+++++-+-++--++--+-+----",
+}
+
+# Generators of the minimum aberration 2^(k-p) designs (Chen, Sun & Wu 1993) of up to 11 factors and p >= 2, as the
+# interactions of the base factors A, B, C, ... (skipping I) that generate the last p factors. For p = 1 the highest
+# order interaction is of minimum aberration.
+FACTOR_LETTERS = "ABCDEFGHJKL"
+MINIMUM_ABERRATION_GENERATORS = {
+    (5, 2): ["AB", "AC"],
+    (6, 2): ["ABC", "BCD"],
+    (6, 3): ["AB", "AC", "BC"],
+    (7, 2): ["ABCD", "ABDE"],
+    (7, 3): ["ABC", "BCD", "ACD"],
+    (7, 4): ["AB", "AC", "BC", "ABC"],
+    (8, 2): ["ABCD", "ABEF"],
+    (8, 3): ["ABC", "ABD", "BCDE"],
+    (8, 4): ["BCD", "ACD", "ABC", "ABD"],
+    (9, 2): ["ACDFG", "BCEFG"],
+    (9, 3): ["ABCD", "ACEF", "CDEF"],
+    (9, 4): ["BCDE", "ACDE", "ABDE", "ABCE"],
+    (9, 5): ["ABC", "BCD", "ACD", "ABD", "ABCD"],
+    (10, 3): ["ABCD", "ABEF", "ACEG"],
+    (10, 4): ["BCDF", "ACDF", "ABDE", "ABCE"],
+    (10, 5): ["ABCD", "ABCE", "ABDE", "ACDE", "BCDE"],
+    (10, 6): ["ABC", "BCD", "ACD", "ABD", "ABCD", "AB"],
+    (11, 4): ["ABCD", "ABEF", "ACEG", "BDFG"],
+    (11, 5): ["ABC", "ABD", "ABEF", "ACDE", "ACDF"],
+    (11, 6): ["ABC", "BCD", "CDE", "ACD", "ADE", "BDE"],
+    (11, 7): ["ABC", "BCD", "ACD", "ABD", "ABCD", "AB", "AC"],
+}
+
+# Sobol direction numbers (Joe & Kuo, new-joe-kuo-6.21201) of dimensions 2..21: the degree s and coefficients a of
+# the primitive polynomial, and the initial direction numbers m
+SOBOL_DIRECTION_NUMBERS = [
+    (1, 0, [1]),
+    (2, 1, [1, 3]),
+    (3, 1, [1, 3, 1]),
+    (3, 2, [1, 1, 1]),
+    (4, 1, [1, 1, 3, 3]),
+    (4, 4, [1, 3, 5, 13]),
+    (5, 2, [1, 1, 5, 5, 17]),
+    (5, 4, [1, 1, 5, 5, 5]),
+    (5, 7, [1, 1, 7, 11, 19]),
+    (5, 11, [1, 1, 5, 1, 1]),
+    (5, 13, [1, 1, 1, 3, 11]),
+    (5, 14, [1, 3, 5, 5, 31]),
+    (6, 1, [1, 3, 3, 9, 7, 49]),
+    (6, 13, [1, 1, 1, 15, 21, 21]),
+    (6, 16, [1, 3, 1, 13, 27, 49]),
+    (6, 19, [1, 1, 1, 15, 7, 5]),
+    (6, 22, [1, 3, 1, 15, 13, 25]),
+    (6, 25, [1, 1, 5, 5, 19, 61]),
+    (7, 1, [1, 3, 7, 11, 23, 15, 103]),
+    (7, 4, [1, 3, 7, 13, 13, 15, 69]),
+]
+SOBOL_BITS = 32
+
+
+class ExperimentalDesign(ABC):
+    """Selects the combinations of factor levels (treatments) of a run table, instead of all of them. Points are
+    tuples of level indices, one per factor; points that are excluded by `exclude_combinations`, or generated more
+    than once, are dropped."""
+
+    def validate(self, factors: List[FactorModel]):
+        """Raise a BaseError if the design cannot be generated for these factors"""
+        pass
+
+    @abstractmethod
+    def points(self, factors: List[FactorModel]) -> Iterator[Tuple[int, ...]]:
+        """The points of the design, as tuples of level indices of the factors"""
+        pass
+
+
+class _TwoLevelDesign(ExperimentalDesign):
+    def validate(self, factors: List[FactorModel]):
+        for factor in factors:
+            if len(factor.treatments) != 2:
+                raise BaseError(f"{type(self).__name__} requires two levels per factor, {factor.factor_name} has "
+                                f"{len(factor.treatments)}!")
+
+
+class FractionalFactorial(_TwoLevelDesign):
+    def __init__(self, fraction: int, generators: Optional[Dict[FactorModel, List[FactorModel]]] = None):
+        """A 2^(k-p) fractional factorial design of k two-level factors, with p = `fraction`. The first k - p
+        factors form a full factorial; each other factor is generated by the interaction (product, in -1/+1
+        coding) of base factors. By default, the last p factors are generated as in the minimum aberration design
+        of the tabulated ones (`MINIMUM_ABERRATION_GENERATORS`, up to 11 factors), e.g. E = ABC and F = BCD for a
+        2^(6-2) design of resolution IV; otherwise by the highest-order interactions of the base factors, e.g. E =
+        ABCD for a 2^(5-1) design. `generators` sets them explicitly instead, e.g. {e: [a, b, c]}. Every design must
+        be of resolution III or higher, so that no two main effects are aliased."""
+        if fraction < 0:
+            raise BaseError("The fraction of a fractional factorial design cannot be negative!")
+        if generators is not None and len(generators) != fraction:
+            raise BaseError(f"A 2^(k-{fraction}) design has {fraction} generated factors, not {len(generators)}!")
+
+        self.__fraction = fraction
+        self.__generators = generators
+
+    def __base_and_generators(self, factors: List[FactorModel]) -> Tuple[List[int], List[Tuple[int, List[int]]]]:
+        """The positions of the base factors, and of every generated factor together with its base factors"""
+        positions = {factor.factor_name: k for k, factor in enumerate(factors)}
+        if self.__generators is None:
+            nr_of_base = len(factors) - self.__fraction
+            if (len(factors), self.__fraction) in MINIMUM_ABERRATION_GENERATORS:
+                interactions = [[FACTOR_LETTERS.index(letter) for letter in word]
+                                for word in MINIMUM_ABERRATION_GENERATORS[len(factors), self.__fraction]]
+                return list(range(nr_of_base)), list(zip(range(nr_of_base, len(factors)), interactions))
+            interactions = [list(combination) for size in range(nr_of_base, 1, -1)
+                            for combination in itertools.combinations(range(nr_of_base), size)]
+            if len(interactions) < self.__fraction:
+                raise BaseError(f"{len(factors)} factors are too few for a 2^(k-{self.__fraction}) design!")
+            return list(range(nr_of_base)), list(zip(range(nr_of_base, len(factors)), interactions))
+
+        generated = []
+        for factor, base_factors in self.__generators.items():
+            if factor.factor_name not in positions or any(base.factor_name not in positions for base in base_factors):
+                raise BaseError(f"The generator of {factor.factor_name} uses a factor that is not in the run table!")
+            generated.append((positions[factor.factor_name], [positions[base.factor_name] for base in base_factors]))
+        generated_positions = {k for k, _ in generated}
+        base = [k for k in range(len(factors)) if k not in generated_positions]
+        if any(k in generated_positions for _, interaction in generated for k in interaction):
+            raise BaseError("Generated factors must be generated by base factors only!")
+        # A word of length one or two in the defining relation aliases a main effect with the mean or another one
+        interactions = [frozenset(interaction) for _, interaction in generated]
+        if any(len(interaction) < 2 for interaction in interactions) or len(set(interactions)) < len(interactions):
+            raise BaseError("Generators must be distinct interactions of at least two base factors, for a design of "
+                            "resolution III or higher!")
+        return base, generated
+
+    def defining_relation(self, factors: List[FactorModel]) -> List[Tuple[str, ...]]:
+        """The words of the defining relation (I = ...): every product of generator words, as the names of its
+        factors. Effects are aliased with their products with these words."""
+        _, generated = self.__base_and_generators(factors)
+        words = [frozenset(interaction) | {k} for k, interaction in generated]
+        relation = []
+        for size in range(1, len(words) + 1):
+            for combination in itertools.combinations(words, size):
+                word = frozenset()
+                for generator_word in combination:
+                    word ^= generator_word
+                relation.append(tuple(factors[k].factor_name for k in sorted(word)))
+        return sorted(relation, key=lambda word: (len(word), word))
+
+    def resolution(self, factors: List[FactorModel]) -> Optional[int]:
+        """The length of the shortest word of the defining relation (None for a full factorial)"""
+        relation = self.defining_relation(factors)
+        return len(relation[0]) if relation else None
+
+    def validate(self, factors: List[FactorModel]):
+        super().validate(factors)
+        if self.__fraction >= len(factors):
+            raise BaseError(f"A 2^(k-{self.__fraction}) design needs more than {self.__fraction} factors!")
+        self.__base_and_generators(factors)
+
+    def points(self, factors: List[FactorModel]) -> Iterator[Tuple[int, ...]]:
+        base, generated = self.__base_and_generators(factors)
+        point = [0] * len(factors)
+        for levels in itertools.product((0, 1), repeat=len(base)):
+            for k, level in zip(base, levels):
+                point[k] = level
+            for k, interaction in generated:
+                # The product of -1/+1 levels is +1 (level 1) for an even number of -1s (level 0)
+                point[k] = 1 - sum(1 - point[j] for j in interaction) % 2
+            yield tuple(point)
+
+
+class PlackettBurman(_TwoLevelDesign):
+    def __init__(self, runs: Optional[int] = None):
+        """A Plackett-Burman screening design of `runs` runs (by default the fewest for the number of factors):
+        main effects of up to runs - 1 two-level factors, from an orthogonal (Hadamard) matrix. Supported are 12,
+        20 and 24 runs, and any power of two."""
+        if runs is not None and not PlackettBurman.is_supported(runs):
+            raise BaseError(f"Plackett-Burman designs of {runs} runs are not supported!")
+        self.__runs = runs
+
+    @staticmethod
+    def is_supported(runs: int) -> bool:
+        return runs in PLACKETT_BURMAN_GENERATORS or (runs >= 4 and runs & (runs - 1) == 0)
+
+    def nr_of_runs(self, nr_of_factors: int) -> int:
+        if self.__runs is not None:
+            return self.__runs
+        runs = 4
+        while runs <= nr_of_factors or not PlackettBurman.is_supported(runs):
+            runs += 4
+        return runs
+
+    @staticmethod
+    def matrix(runs: int) -> List[List[int]]:
+        """The `runs` x (runs - 1) design matrix, in -1/+1 coding"""
+        if runs in PLACKETT_BURMAN_GENERATORS:
+            first = [1 if sign == '+' else -1 for sign in PLACKETT_BURMAN_GENERATORS[runs]]
+            return [first[-shift:] + first[:-shift] for shift in range(runs - 1)] + [[-1] * (runs - 1)]
+
+        # Sylvester's construction; the first column (all +1) is dropped
+        hadamard = [[1]]
+        while len(hadamard) < runs:
+            hadamard = [row + row for row in hadamard] + [row + [-x for x in row] for row in hadamard]
+        return [row[1:] for row in hadamard]
+
+    def validate(self, factors: List[FactorModel]):
+        super().validate(factors)
+        if self.nr_of_runs(len(factors)) <= len(factors):
+            raise BaseError(f"A Plackett-Burman design of {self.__runs} runs supports at most {self.__runs - 1} "
+                            f"factors!")
+
+    def points(self, factors: List[FactorModel]) -> Iterator[Tuple[int, ...]]:
+        for row in PlackettBurman.matrix(self.nr_of_runs(len(factors))):
+            yield tuple(1 if sign > 0 else 0 for sign in row[:len(factors)])
+
+
+class _SpaceFillingDesign(ExperimentalDesign):
+    """Samples points in the unit hypercube, and maps every coordinate to a level of a numeric factor: the level
+    range is split into equally wide parts, by the number of levels. Factors with many levels (e.g. `range(800,
+    3001, 10)`) are thereby sampled nearly continuously."""
+
+    def __init__(self, samples: int, seed: int = 0):
+        if samples < 1:
+            raise BaseError("A design requires at least one sample!")
+        self.samples = samples
+        # Fixed by default, so a restarted experiment regenerates the same design
+        self.seed = seed
+
+    def validate(self, factors: List[FactorModel]):
+        for factor in factors:
+            if not all(isinstance(level, (int, float)) and not isinstance(level, bool) for level in factor.treatments):
+                raise BaseError(f"{type(self).__name__} requires numeric factors, {factor.factor_name} is not!")
+
+    @abstractmethod
+    def unit_points(self, dimensions: int, rng: random.Random) -> Iterator[List[float]]:
+        """The sample points in the unit hypercube, of `dimensions` coordinates each"""
+        pass
+
+    def points(self, factors: List[FactorModel]) -> Iterator[Tuple[int, ...]]:
+        # Level indices in increasing order of the levels
+        ordered = [sorted(range(len(factor.treatments)), key=factor.treatments.__getitem__) for factor in factors]
+        rng = random.Random(self.seed)
+        for point in self.unit_points(len(factors), rng):
+            yield tuple(levels[min(int(u * len(levels)), len(levels) - 1)] for levels, u in zip(ordered, point))
+
+
+class LatinHypercube(_SpaceFillingDesign):
+    """A Latin hypercube sample of `samples` points: every factor's range is split into `samples` equally wide
+    strata, each of which is sampled exactly once"""
+
+    def unit_points(self, dimensions: int, rng: random.Random) -> Iterator[List[float]]:
+        n = self.samples
+        strata = [rng.sample(range(n), n) for _ in range(dimensions)]
+        for i in range(n):
+            yield [(strata[j][i] + rng.random()) / n for j in range(dimensions)]
+
+
+class SobolSequence(_SpaceFillingDesign):
+    def __init__(self, samples: int, scramble: bool = True, seed: int = 0):
+        """The first `samples` points of the Sobol low-discrepancy sequence (preferably a power of two, which
+        balances every factor), randomized by a digital shift if `scramble`. Supports up to 21 factors."""
+        super().__init__(samples, seed)
+        self.scramble = scramble
+
+    def validate(self, factors: List[FactorModel]):
+        super().validate(factors)
+        if len(factors) > len(SOBOL_DIRECTION_NUMBERS) + 1:
+            raise BaseError(f"Sobol sequences support at most {len(SOBOL_DIRECTION_NUMBERS) + 1} factors!")
+        if self.samples > 1 << SOBOL_BITS:
+            raise BaseError(f"Sobol sequences support at most 2^{SOBOL_BITS} samples!")
+
+    @staticmethod
+    def direction_numbers(dimension: int) -> List[int]:
+        """The direction numbers v_1..v_B of a dimension (0-based), scaled to SOBOL_BITS bits"""
+        if dimension == 0:
+            m = [1] * SOBOL_BITS
+        else:
+            s, a, m = SOBOL_DIRECTION_NUMBERS[dimension - 1]
+            m = list(m)
+            for i in range(s, SOBOL_BITS):
+                value = m[i - s] ^ (m[i - s] << s)
+                for k in range(1, s):
+                    if (a >> (s - 1 - k)) & 1:
+                        value ^= m[i - k] << k
+                m.append(value)
+        return [m[i] << (SOBOL_BITS - 1 - i) for i in range(SOBOL_BITS)]
+
+    def unit_points(self, dimensions: int, rng: random.Random) -> Iterator[List[float]]:
+        directions = [SobolSequence.direction_numbers(j) for j in range(dimensions)]
+        shifts = [rng.getrandbits(SOBOL_BITS) if self.scramble else 0 for _ in range(dimensions)]
+        scale = 1 / (1 << SOBOL_BITS)
+
+        # Gray code order: every next point flips the direction number of the lowest zero bit of the index
+        x = [0] * dimensions
+        for i in range(self.samples):
+            yield [(value ^ shift) * scale for value, shift in zip(x, shifts)]
+            bit = (~i & (i + 1)).bit_length() - 1
+            for j in range(dimensions):
+                x[j] ^= directions[j][bit]
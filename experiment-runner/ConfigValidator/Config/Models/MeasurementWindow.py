@@ -0,0 +1,148 @@
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ConfigValidator.Config.Models.TimeUnits import TIME_UNITS_IN_NS
+
+WINDOW_FILE = 'measurement_window.json'
+
+
+def _anchor() -> Tuple[int, int]:
+    """A (wall clock, monotonic) pair of timestamps in ns, read as close together as possible"""
+    before = time.perf_counter_ns()
+    wall = time.time_ns()
+    after = time.perf_counter_ns()
+    return wall, (before + after) // 2
+
+
+###     =========================================================
+###     |                                                       |
+###     |                   MeasurementWindow                   |
+###     |       - The moments the measurement of a run started  |
+###     |         (all START_MEASUREMENT hooks are done) and    |
+###     |         stopped (before the STOP_MEASUREMENT hooks),  |
+###     |         in wall clock and monotonic time              |
+###     |       - Clips the samples of any profiler to the      |
+###     |         window, so their startup and teardown are     |
+###     |         left out and profilers can be compared        |
+###     |                                                       |
+###     |       * Wall clock timestamps are in ns since the     |
+###     |         epoch (`time.time_ns`), monotonic ones are    |
+###     |         `time.perf_counter_ns`                        |
+###     |                                                       |
+###     =========================================================
+class MeasurementWindow:
+    def __init__(self, start_ns: Optional[int] = None, stop_ns: Optional[int] = None,
+                 start_perf_ns: Optional[int] = None, stop_perf_ns: Optional[int] = None):
+        self.start_ns = start_ns
+        self.stop_ns = stop_ns
+        self.start_perf_ns = start_perf_ns
+        self.stop_perf_ns = stop_perf_ns
+
+    def mark_start(self):
+        self.start_ns, self.start_perf_ns = _anchor()
+        self.stop_ns = self.stop_perf_ns = None
+
+    def mark_stop(self):
+        if self.start_ns is None:
+            raise RuntimeError("The measurement window was stopped before it was started")
+        self.stop_ns, self.stop_perf_ns = _anchor()
+
+    @property
+    def started(self) -> bool:
+        return self.start_ns is not None
+
+    @property
+    def stopped(self) -> bool:
+        return self.stop_ns is not None
+
+    @property
+    def duration_ns(self) -> Optional[int]:
+        """The length of the window by the monotonic clock (up to now, while it is open)"""
+        if not self.started:
+            return None
+        stop = self.stop_perf_ns if self.stopped else time.perf_counter_ns()
+        return stop - self.start_perf_ns
+
+    def to_wall_ns(self, perf_ns: int) -> int:
+        """The wall clock time of a `perf_counter_ns` timestamp of this run"""
+        if not self.started:
+            raise RuntimeError("The measurement window has not been started")
+        return self.start_ns + (perf_ns - self.start_perf_ns)
+
+    def bounds_ns(self) -> Tuple[int, int]:
+        """The (start, stop) of the window in wall clock ns, where an open window extends up to now"""
+        if not self.started:
+            raise RuntimeError("The measurement window has not been started")
+        return self.start_ns, self.stop_ns if self.stopped else self.start_ns + self.duration_ns
+
+    def contains(self, timestamps_ns, resolution: str = 'ns') -> np.ndarray:
+        """A mask of the wall clock timestamps (in ns) within the window. Timestamps in whole `resolution` units
+        (e.g. 's') may have been taken up to one unit later: a sample stamped 12:00:03 may be from 12:00:03.9."""
+        start, stop = self.bounds_ns()
+        timestamps_ns = np.asarray(timestamps_ns, dtype=np.int64)
+        return (timestamps_ns + TIME_UNITS_IN_NS[resolution] > start) & (timestamps_ns <= stop)
+
+    def clip(self, data, timestamp_column: Optional[str] = None, time_unit: str = 'ms',
+             origin_ns: Optional[int] = None, sample_interval: Optional[float] = None):
+        """The samples (rows) of a parsed log taken within the window, as a pandas DataFrame. `data` is a
+        DataFrame, or anything it can be constructed from (e.g. the result of a DataSource's `parse_log`).
+
+        Timestamps are numbers in `time_unit` since the epoch (e.g. the `Time` column of EnergiBridge in 'ms', the
+        `time.time_ns() // 1000` of NvidiaML in 'us') or local date times (e.g. of PicoCM3), whose resolution is
+        `time_unit` ('s' for PicoCM3). A log without timestamps (e.g. of ps) is sampled every `sample_interval`
+        (in `time_unit`) from `origin_ns`, the wall clock time of its first sample (e.g. `DataSource.started_at_ns`)."""
+        import pandas as pd
+
+        if time_unit not in TIME_UNITS_IN_NS:
+            raise ValueError(f"Unknown time unit {time_unit}, expected one of {list(TIME_UNITS_IN_NS)}")
+        unit_ns = TIME_UNITS_IN_NS[time_unit]
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+        if timestamp_column is not None:
+            timestamps_ns = _to_wall_ns(frame[timestamp_column], unit_ns)
+        elif origin_ns is not None and sample_interval is not None:
+            timestamps_ns = origin_ns + (np.arange(len(frame)) * sample_interval * unit_ns).astype(np.int64)
+        else:
+            raise ValueError("Samples can only be clipped by their timestamps, or by their sample interval from "
+                             "the time of the first sample")
+
+        return frame[self.contains(timestamps_ns, time_unit)]
+
+    def to_dict(self) -> Dict[str, Optional[int]]:
+        return {'start_ns': self.start_ns, 'stop_ns': self.stop_ns,
+                'start_perf_ns': self.start_perf_ns, 'stop_perf_ns': self.stop_perf_ns}
+
+    def write(self, directory: Path):
+        with open(Path(directory) / WINDOW_FILE, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @staticmethod
+    def read(directory: Path) -> Optional['MeasurementWindow']:
+        """The window of a finished run, written to its run directory, e.g. to clip its samples afterwards"""
+        try:
+            with open(Path(directory) / WINDOW_FILE) as f:
+                return MeasurementWindow(**json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def __repr__(self) -> str:
+        return f"MeasurementWindow({self.to_dict()})"
+
+
+def _to_wall_ns(timestamps, unit_ns: int) -> np.ndarray:
+    import pandas as pd
+
+    numeric = pd.to_numeric(timestamps, errors='coerce')
+    if numeric.notna().all():
+        return (numeric.to_numpy(np.float64) * unit_ns).astype(np.int64)
+
+    # Date times without a time zone are local time, as written by `datetime.now()`
+    date_times = pd.to_datetime(timestamps)
+    if date_times.dt.tz is None:
+        seconds = np.array([date_time.to_pydatetime().timestamp() for date_time in date_times])
+        return (seconds * 1e9).round().astype(np.int64)
+    return date_times.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy('datetime64[ns]').astype(np.int64)
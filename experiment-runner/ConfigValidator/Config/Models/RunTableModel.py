@@ -1,23 +1,32 @@
-import itertools
+import math
 import random
-from typing import Dict, List, Tuple
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ConfigValidator.CustomErrors.BaseError import BaseError
-from ExtendedTyping.Typing import SupportsStr
+from ProgressManager.RunTable.LazyRunTable import LazyRunTable, RandomPermutation
 from ProgressManager.RunTable.Models.RunProgress import RunProgress
+from ConfigValidator.Config.Models.CombinationFilter import CombinationFilter, Exclusion
+from ConfigValidator.Config.Models.ExperimentalDesign import ExperimentalDesign
 from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.SchedulingStrategy import SchedulingStrategy
+from ConfigValidator.Config.Models.StoppingRule import StoppingRule
 
 
 class RunTableModel:
     def __init__(self,
                  factors: List[FactorModel],
-                 exclude_combinations: List[Dict[FactorModel, List[SupportsStr]]] = None,
+                 exclude_combinations: List[Exclusion] = None,
                  repetitions: int = 1,
                  data_columns: List[str] = None,
-                 shuffle: bool = False
+                 shuffle: bool = False,
+                 scheduling: SchedulingStrategy = None,
+                 stopping_rule: StoppingRule = None,
+                 data_column_types: Dict[str, type] = None,
+                 design: ExperimentalDesign = None
                  ):
         if exclude_combinations is None:
-            exclude_combinations = {}
+            exclude_combinations = []
         if data_columns is None:
             data_columns = []
 
@@ -30,11 +39,38 @@ class RunTableModel:
         if len(set(data_columns)) != len(data_columns):
             raise BaseError("Duplicate data column detected!")
 
+        if data_column_types is None:
+            data_column_types = {}
+        for data_column, column_type in data_column_types.items():
+            if data_column not in data_columns:
+                raise BaseError(f"A type is declared for {data_column}, which is not a data column!")
+            if column_type not in (int, float, bool, str):
+                raise BaseError(f"The type of data column {data_column} must be one of int, float, bool or str!")
+
+        if stopping_rule is not None:
+            if stopping_rule.data_column not in data_columns:
+                raise BaseError(f"The stopping rule column {stopping_rule.data_column} is not a data column!")
+            if repetitions != 1:
+                raise BaseError("Use StoppingRule.min_repetitions instead of repetitions with a stopping rule!")
+            repetitions = stopping_rule.min_repetitions
+
+        if scheduling is None:
+            scheduling = SchedulingStrategy.SHUFFLE if shuffle else SchedulingStrategy.ROUND_ROBIN
+        elif shuffle and scheduling is not SchedulingStrategy.SHUFFLE:
+            raise BaseError("shuffle=True cannot be combined with another scheduling strategy!")
+
         self.__factors = factors
+        if design is not None:
+            design.validate(factors)
+
         self.__exclude_combinations = exclude_combinations
+        self.__combination_filter = CombinationFilter(factors, exclude_combinations)
         self.__repetitions = repetitions
         self.__data_columns = data_columns
-        self.__shuffle = shuffle
+        self.__scheduling = scheduling
+        self.__stopping_rule = stopping_rule
+        self.__data_column_types = data_column_types
+        self.__design = design
 
     def get_factors(self) -> List[FactorModel]:
         return self.__factors
@@ -42,57 +78,112 @@ class RunTableModel:
     def get_data_columns(self) -> List[str]:
         return self.__data_columns
 
-    def generate_experiment_run_table(self) -> List[Dict]:
-        def __filter_list(full_list: List[Tuple]):
-            if len(self.__exclude_combinations) == 0:
-                return full_list
-
-            to_remove_indices = []
-            for exclusion in self.__exclude_combinations:
-                # Construct the exclusion tuples
-                list_of_lists = []
-                indexes = []
-                for factor, treatment_list in exclusion.items():
-                    list_of_lists.append(treatment_list)
-                    indexes.append(self.__factors.index(factor))
-                exclude_combinations_list = list(itertools.product(*list_of_lists))
-
-                # Mark the exclusions in the full table
-                for idx, elem in enumerate(full_list):
-                    for exclude_combo in exclude_combinations_list:
-                        if all([exclude_combo[i] == elem[indexes[i]] for i in range(len(indexes))]):
-                            to_remove_indices.append(idx)
-
-            to_remove_indices.sort(reverse=True)
-            for idx in to_remove_indices:
-                del full_list[idx]
-            return full_list
-
-        list_of_lists = [factor.treatments for factor in self.__factors]
-        combinations_list = list(itertools.product(*list_of_lists))
-        filtered_list = __filter_list(combinations_list)
-
-        column_names = ['__run_id', '__done']  # Needed for experiment-runner functionality
-        for factor in self.__factors:
-            column_names.append(factor.factor_name)
-
-        if self.__data_columns:
-            for data_column in self.__data_columns:
-                column_names.append(data_column)
-
-        experiment_run_table = []
-        for j in range(self.__repetitions):
-            for i, combo in enumerate(filtered_list):
-                row_list = list(combo)
-                row_list.insert(0, f'run_{i}_repetition_{j}')  # __run_id
-                row_list.insert(1, RunProgress.TODO)  # __done
-
-                if self.__data_columns:
-                    for _ in self.__data_columns:
-                        row_list.append(" ")
-                experiment_run_table.append(dict(zip(column_names, row_list)))
-
-        if self.__shuffle:
-            random.shuffle(experiment_run_table)
-        return experiment_run_table
-
+    def get_data_column_types(self) -> Dict[str, type]:
+        """The declared types of (some of) the data columns, used by typed run table stores"""
+        return self.__data_column_types
+
+    def get_scheduling(self) -> SchedulingStrategy:
+        return self.__scheduling
+
+    def get_stopping_rule(self) -> StoppingRule:
+        return self.__stopping_rule
+
+    def get_design(self) -> Optional[ExperimentalDesign]:
+        return self.__design
+
+    @staticmethod
+    def split_run_id(run_id: str) -> Tuple[str, int]:
+        """Split a run id into the treatment (e.g. 'run_3') and the repetition number"""
+        treatment, repetition = run_id.rsplit('_repetition_', 1)
+        return treatment, int(repetition)
+
+    def generate_repetition(self, run: Dict, repetition: int) -> Dict:
+        """Create a new (TODO) repetition of the treatment of `run`"""
+        treatment, _ = RunTableModel.split_run_id(run['__run_id'])
+        new_run = {k: (" " if k in self.__data_columns else v) for k, v in run.items()}
+        new_run['__run_id'] = f'{treatment}_repetition_{repetition}'
+        new_run['__done'] = RunProgress.TODO
+        return new_run
+
+    @staticmethod
+    def williams_entry(nr_of_treatments: int, row: int, position: int) -> int:
+        """The treatment at `position` in `row` of `williams_design(nr_of_treatments)`, in constant time"""
+        if row >= nr_of_treatments:
+            # Mirrored rows (odd number of treatments only)
+            row, position = row - nr_of_treatments, nr_of_treatments - 1 - position
+
+        # The first row is 0, 1, n-1, 2, n-2, ..., every other row shifts it by one
+        if position == 0:
+            first = 0
+        elif position % 2 == 1:
+            first = (position + 1) // 2
+        else:
+            first = nr_of_treatments - position // 2
+        return (first + row) % nr_of_treatments
+
+    @staticmethod
+    def williams_design(nr_of_treatments: int) -> List[List[int]]:
+        """Rows of a Latin square balanced for first-order carry-over effects. For an odd number of treatments,
+        the mirrored rows are added as well, as balance then requires 2n rows."""
+        nr_of_rows = nr_of_treatments * (2 if nr_of_treatments % 2 == 1 else 1)
+        return [[RunTableModel.williams_entry(nr_of_treatments, row, position) for position in range(nr_of_treatments)]
+                for row in range(nr_of_rows)]
+
+    def __schedule(self, nr_of_treatments: int) -> Optional[Callable[[int], int]]:
+        """The order of the runs: maps a position in the run table to run number `repetition * nr_of_treatments +
+        treatment` (None keeps that order). Random orders are drawn from `random`, so seeding it makes them
+        reproducible."""
+        n, repetitions = nr_of_treatments, self.__repetitions
+
+        if self.__scheduling is SchedulingStrategy.SEQUENTIAL:
+            return lambda position: (position % repetitions) * n + position // repetitions
+
+        if self.__scheduling is SchedulingStrategy.RANDOMIZED_BLOCKS:
+            seed = random.getrandbits(64)
+            last_block = {}  # Runs are mostly visited in order, only the order of the current block is kept
+
+            def randomized_blocks(position: int) -> int:
+                block, index = divmod(position, n)
+                if block not in last_block:
+                    last_block.clear()
+                    last_block[block] = RandomPermutation(n, seed + block)
+                return block * n + last_block[block](index)
+            return randomized_blocks
+
+        if self.__scheduling is SchedulingStrategy.LATIN_SQUARE:
+            nr_of_rows = n * (2 if n % 2 == 1 else 1)
+            symbols = RandomPermutation(n)          # random treatment per symbol
+            rows = RandomPermutation(nr_of_rows)    # random order of the rows
+
+            def latin_square(position: int) -> int:
+                block, index = divmod(position, n)
+                return block * n + symbols(RunTableModel.williams_entry(n, rows(block % nr_of_rows), index))
+            return latin_square
+
+        if self.__scheduling is SchedulingStrategy.SHUFFLE:
+            return RandomPermutation(n * repetitions)
+        return None
+
+    def __design_treatments(self) -> array:
+        """The numbers of the distinct, included combinations of factor levels of the design, in design order"""
+        radices = [len(factor.treatments) for factor in self.__factors]
+        treatments, seen = array('q'), set()
+        for point in self.__design.points(self.__factors):
+            number = 0
+            for radix, i in zip(radices, point):
+                number = number * radix + i
+            if number not in seen and not self.__combination_filter.excludes(point):
+                seen.add(number)
+                treatments.append(number)
+        return treatments
+
+    def generate_experiment_run_table(self) -> LazyRunTable:
+        """The run table, computing its rows on demand (see `LazyRunTable`)"""
+        if self.__design is not None:
+            treatments = self.__design_treatments()
+        else:
+            treatments = self.__combination_filter.included_treatments()
+        nr_of_treatments = math.prod(len(factor.treatments) for factor in self.__factors) if treatments is None \
+            else len(treatments)
+        order = self.__schedule(nr_of_treatments) if nr_of_treatments > 0 else None
+        return LazyRunTable(self.__factors, self.__data_columns, self.__repetitions, treatments, order)
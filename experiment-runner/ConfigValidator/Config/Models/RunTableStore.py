@@ -0,0 +1,14 @@
+from enum import Enum, auto
+
+class RunTableStore(Enum):
+    """Store the run table in `run_table.csv`. Finished runs are appended to a journal, which is folded into the CSV
+    periodically."""
+    CSV = auto()
+
+    """Store the run table and metadata in a SQLite database (`run_table.db`), which can be queried while the
+    experiment runs. The run table is exported to `run_table.csv` periodically."""
+    SQLITE = auto()
+
+    """Store the run table in `run_table.parquet`, typed by the factor treatments and `RunTableModel.data_column_types`,
+    so values are read back exactly. The run table is exported to `run_table.csv` periodically. Requires pyarrow."""
+    PARQUET = auto()
@@ -1,9 +1,15 @@
 from pathlib import Path
 
+from ConfigValidator.Config.Models.MeasurementWindow import MeasurementWindow
+
 
 class RunnerContext:
 
-    def __init__(self, execute_run: dict, run_nr: int, run_dir: Path):
+    def __init__(self, execute_run: dict, run_nr: int, run_dir: Path, is_baseline: bool = False):
         self.execute_run = execute_run
         self.run_nr = run_nr
         self.run_dir = run_dir
+        # An idle baseline run only starts and stops the measurement (see `BaselineModel`)
+        self.is_baseline = is_baseline
+        # Started when all START_MEASUREMENT hooks are done, stopped before the STOP_MEASUREMENT hooks
+        self.measurement_window = MeasurementWindow()
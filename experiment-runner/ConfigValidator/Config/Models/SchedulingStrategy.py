@@ -0,0 +1,19 @@
+from enum import Enum, auto
+
+
+class SchedulingStrategy(Enum):
+    """Every repetition of a treatment finishes before the next treatment starts."""
+    SEQUENTIAL = auto()
+
+    """All treatments run once, in a fixed order, before the next repetition starts (the default)."""
+    ROUND_ROBIN = auto()
+
+    """Every repetition is a block containing each treatment once, in a random order per block."""
+    RANDOMIZED_BLOCKS = auto()
+
+    """Blocks follow the rows of a balanced (Williams) Latin square, so each treatment occupies every position
+    within a block equally often, and each treatment is preceded by every other treatment equally often."""
+    LATIN_SQUARE = auto()
+
+    """The whole run table is shuffled (equivalent to `shuffle=True`)."""
+    SHUFFLE = auto()
@@ -0,0 +1,48 @@
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+
+class StoppingRule:
+    def __init__(self,
+                 data_column: str,
+                 max_relative_ci_width: float = 0.05,
+                 confidence: float = 0.95,
+                 min_repetitions: int = 3,
+                 max_repetitions: int = 30
+                 ):
+        """Keep scheduling repetitions of a treatment until the confidence interval of the mean of `data_column`
+        is at most `max_relative_ci_width` wide (relative to the mean), or `max_repetitions` is reached.
+        Every treatment runs at least `min_repetitions` times."""
+        if not 0 < confidence < 1:
+            raise BaseError("The confidence level of a stopping rule must be between 0 and 1!")
+
+        if max_relative_ci_width <= 0:
+            raise BaseError("The target relative CI width of a stopping rule must be positive!")
+
+        if min_repetitions < 2 or max_repetitions < min_repetitions:
+            raise BaseError("A stopping rule requires 2 <= min_repetitions <= max_repetitions!")
+
+        self.__data_column = data_column
+        self.__max_relative_ci_width = max_relative_ci_width
+        self.__confidence = confidence
+        self.__min_repetitions = min_repetitions
+        self.__max_repetitions = max_repetitions
+
+    @property
+    def data_column(self) -> str:
+        return self.__data_column
+
+    @property
+    def max_relative_ci_width(self) -> float:
+        return self.__max_relative_ci_width
+
+    @property
+    def confidence(self) -> float:
+        return self.__confidence
+
+    @property
+    def min_repetitions(self) -> int:
+        return self.__min_repetitions
+
+    @property
+    def max_repetitions(self) -> int:
+        return self.__max_repetitions
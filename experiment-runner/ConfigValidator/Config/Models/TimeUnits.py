@@ -0,0 +1,2 @@
+# Time unit -> number of nanoseconds, shared by the sample store and the measurement window
+TIME_UNITS_IN_NS = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
@@ -4,6 +4,9 @@ from ConfigValidator.Config.Models.RunTableModel import RunTableModel
 from ConfigValidator.Config.Models.FactorModel import FactorModel
 from ConfigValidator.Config.Models.RunnerContext import RunnerContext
 from ConfigValidator.Config.Models.OperationType import OperationType
+from ConfigValidator.Config.Models.RunTableStore import RunTableStore
+from ConfigValidator.Config.Models.CooldownModel import CooldownModel, CooldownSensor
+from ConfigValidator.Config.Models.BaselineModel import BaselineModel, BaselineCorrection
 from ExtendedTyping.Typing import SupportsStr
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 
@@ -28,9 +31,70 @@ class RunnerConfig:
     operation_type:             OperationType   = OperationType.AUTO
 
     """The time Experiment Runner will wait after a run completes.
-    This can be essential to accommodate for cooldown periods on some systems."""
+    This can be essential to accommodate for cooldown periods on some systems.
+    With parallel runs, only the next run in the same slot waits, the other runs continue."""
     time_between_runs_in_ms:    int             = 1000
 
+    """Optionally replace the fixed `time_between_runs_in_ms` with an adaptive cooldown: after each run, wait until
+    a sensor (CPU temperature, package power or a custom reading) is back at the idle baseline recorded at the
+    start of the experiment. The actual waiting time before each run is stored in the `__cooldown_ms` column.
+    Requires sequential runs (`max_parallel_runs` = 1), as the sensor reads the whole system."""
+    cooldown:                   CooldownModel   = None
+
+    """Optionally measure the overhead of the profilers themselves in idle baseline runs, at the start of the
+    experiment and periodically in between runs (see BaselineModel). Baseline runs only start and stop the
+    measurement (`context.is_baseline` is set); a `<column>_net` column holds each data column minus the overhead.
+    Requires sequential runs (`max_parallel_runs` = 1, not distributed)."""
+    baseline:                   BaselineModel   = None
+
+    """The maximum number of runs Experiment Runner will execute at the same time. Each parallel run is pinned
+    to its own, disjoint set of CPUs. Runs that share a resource (see `get_run_resources`) are never executed
+    in parallel. Leave at 1 to execute all runs sequentially."""
+    max_parallel_runs:          int             = 1
+
+    """Execute runs in persistent worker processes, forked once before the first run, instead of forking
+    (twice) for every run. Reduces per-run overhead and noise for experiments with many short runs, at the cost
+    of state set by config hooks in a worker being visible to the next runs executed by that worker."""
+    use_worker_pool:            bool            = False
+
+    """Replace a pool worker with a fresh process after it executed this many runs (0 = never).
+    Workers are always replaced after a failed run."""
+    worker_recycle_after_runs:  int             = 0
+
+    """Distribute the runs over multiple (identical) measurement machines. When set, this process coordinates
+    the experiment: it leases the pending runs through this directory, which must be shared with all machines
+    (e.g. an NFS mount), to workers started with `python experiment-runner/ worker <config.py>`. All config hooks
+    are executed by the workers. Results are stored in the run table of the coordinator; run directories are
+    created by the worker executing the run, under its own `results_output_path`."""
+    distributed_lease_dir:      Path            = None
+
+    """A run leased to a worker that did not renew its lease for this long (e.g. because the worker crashed or
+    lost its connection) is returned to the queue and will be executed by another worker."""
+    lease_timeout_in_ms:        int             = 60000
+
+    """Terminate a run that takes longer than this (0 = no timeout). The run is asked to stop first (its
+    started DataSources are stopped), everything it started is killed a few seconds later."""
+    run_timeout_in_ms:          int             = 0
+
+    """The number of times a run is attempted before it is marked as FAILED (1 = no retries). Runs that time out,
+    raise an error or crash are retried at the end of the queue. With a timeout or retries configured, the number
+    of attempts and the reason of the last failure are stored in the `__attempts` and `__error` columns."""
+    max_run_attempts:           int             = 1
+
+    """How the run table is stored: RunTableStore.CSV, SQLITE or PARQUET (see RunTableStore). All of them end up
+    in `run_table.csv`. The SQLite database can additionally be queried while the experiment runs, the (typed)
+    Parquet file reads back values with their own type."""
+    run_table_store:            RunTableStore   = RunTableStore.CSV
+
+    """Finished runs are appended to a journal next to `run_table.csv`, which is folded into the CSV after
+    this many runs (0 = only once the experiment completed). Reading the run table always includes the journal.
+    The SQLite store exports its run table to the CSV at the same moments."""
+    run_table_compaction_interval: int           = 100
+
+    """Flush every journal entry (or SQLite transaction) to disk, so no finished run is lost when the machine crashes.
+    Disable for experiments with many short runs, if losing the last few results on a crash is acceptable."""
+    run_table_journal_fsync:    bool            = True
+
     # Dynamic configurations can be one-time satisfied here before the program takes the config as-is
     # e.g. Setting some variable based on some criteria
     def __init__(self):
@@ -61,11 +125,17 @@ class RunnerConfig:
             exclude_combinations=[
                 {factor1: ['example_treatment1']},                   # all runs having treatment "example_treatment1" will be excluded
                 {factor1: ['example_treatment2'], factor2: [True]},  # all runs having the combination ("example_treatment2", True) will be excluded
+                # lambda row: row['example_factor1'] == 'example_treatment3' and not row['example_factor2'],  # predicates exclude the rows they hold for
             ],
             data_columns=['avg_cpu', 'avg_mem']
         )
         return self.run_table_model
 
+    def get_run_resources(self, variation: Dict) -> List[str]:
+        """Return the names of the exclusive resources (e.g. measurement devices such as 'rapl-package' or 'gpu0')
+        the given run needs. Runs sharing a resource are serialized when `max_parallel_runs` > 1."""
+        return []
+
     def before_experiment(self) -> None:
         """Perform any activity required before starting the experiment here
         Invoked only once during the lifetime of the program."""
@@ -86,7 +156,11 @@ class RunnerConfig:
         output.console_log("Config.start_run() called!")
 
     def start_measurement(self, context: RunnerContext) -> None:
-        """Perform any activity required for starting measurements."""
+        """Perform any activity required for starting measurements.
+        All run hooks can also be declared as `async def`. They are then awaited on one event loop per run,
+        e.g. to start the target and several DataSources concurrently (see `DataSource.start_concurrently`).
+        In a baseline run (`context.is_baseline`) only the measurement hooks are called: `context.execute_run` has
+        the factor levels of the next run, but no target should be started, so the idle system is measured."""
         output.console_log("Config.start_measurement() called!")
 
     def interact(self, context: RunnerContext) -> None:
@@ -108,7 +182,8 @@ class RunnerConfig:
     def populate_run_data(self, context: RunnerContext) -> Optional[Dict[str, SupportsStr]]:
         """Parse and process any measurement data here.
         You can also store the raw measurement data under `context.run_dir`
-        Returns a dictionary with keys `self.run_table_model.data_columns` and their values populated"""
+        Returns a dictionary with keys `self.run_table_model.data_columns` and their values populated
+        (in a baseline run, only the values measured while idle)"""
 
         output.console_log("Config.populate_run_data() called!")
         return None
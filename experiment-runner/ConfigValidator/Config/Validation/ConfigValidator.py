@@ -1,5 +1,6 @@
 from pathlib import Path
 from tabulate import tabulate
+import importlib.util
 import os
 import subprocess
 import platform
@@ -8,6 +9,10 @@ from ExperimentOrchestrator.Misc.DictConversion import class_to_dict
 from ExperimentOrchestrator.Misc.PathValidation import is_path_exists_or_creatable_portable
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
 from ConfigValidator.Config.Models.OperationType import OperationType
+from ConfigValidator.Config.Models.RunTableStore import RunTableStore
+from ConfigValidator.Config.Models.CooldownModel import CooldownModel
+from ConfigValidator.Config.Models.BaselineModel import BaselineModel
+from ExperimentOrchestrator.Experiment.CooldownController import CooldownController
 from ConfigValidator.CustomErrors.ConfigErrors import (ConfigInvalidError, ConfigAttributeInvalidError)
 
 class ConfigValidator:
@@ -67,6 +72,19 @@ class ConfigValidator:
             ConfigValidator \
                     .config_values_or_exception_dict["EnergiBridge"] = f"Exception durring EnergiBridge test:\n{e}"
         
+    # Verifies that the sensor used for the adaptive cooldown can be read on this system
+    @staticmethod
+    def __validate_cooldown(config):
+        if not isinstance(config.cooldown, CooldownModel):
+            return
+
+        try:
+            CooldownController(config.cooldown).read()
+        except Exception as e:
+            ConfigValidator.error_found = True
+            ConfigValidator \
+                    .config_values_or_exception_dict["cooldown"] = f"Cooldown sensor could not be read:\n{e}"
+
     @staticmethod
     def validate_config(config: RunnerConfig):
 
@@ -79,6 +97,45 @@ class ConfigValidator:
         if not hasattr(config, "self_measure"):
             config.self_measure = False
 
+        if not hasattr(config, "max_parallel_runs"):
+            config.max_parallel_runs = 1
+
+        if not hasattr(config, "cooldown"):
+            config.cooldown = None
+
+        if not hasattr(config, "baseline"):
+            config.baseline = None
+
+        if not hasattr(config, "get_run_resources"):
+            config.get_run_resources = None
+
+        if not hasattr(config, "use_worker_pool"):
+            config.use_worker_pool = False
+
+        if not hasattr(config, "worker_recycle_after_runs"):
+            config.worker_recycle_after_runs = 0
+
+        if not hasattr(config, "run_timeout_in_ms"):
+            config.run_timeout_in_ms = 0
+
+        if not hasattr(config, "max_run_attempts"):
+            config.max_run_attempts = 1
+
+        if not hasattr(config, "run_table_store"):
+            config.run_table_store = RunTableStore.CSV
+
+        if not hasattr(config, "run_table_compaction_interval"):
+            config.run_table_compaction_interval = 100
+
+        if not hasattr(config, "run_table_journal_fsync"):
+            config.run_table_journal_fsync = True
+
+        if not hasattr(config, "distributed_lease_dir"):
+            config.distributed_lease_dir = None
+
+        if not hasattr(config, "lease_timeout_in_ms"):
+            config.lease_timeout_in_ms = 60000
+
         if config.self_measure:
             if not hasattr(config, "self_measure_bin"):
                 config.self_measure_bin = "/usr/local/bin/energibridge" # This is spesific to linux, might work for osx as well
@@ -98,6 +155,84 @@ class ConfigValidator:
                                 (lambda a, b: not isinstance(a, b))
                             )
 
+        # cooldown
+        ConfigValidator.__check_expression('cooldown', config.cooldown, CooldownModel,
+                                (lambda a, b: a is not None and not isinstance(a, b))
+                            )
+        ConfigValidator.__validate_cooldown(config)
+
+        # cooldown, runs executed in parallel keep on heating up the system
+        ConfigValidator.__check_expression('cooldown', config.cooldown,
+                                "None when runs are executed in parallel",
+                                (lambda a, b: a is not None and config.max_parallel_runs != 1)
+                            )
+
+        # max_parallel_runs
+        ConfigValidator.__check_expression('max_parallel_runs', config.max_parallel_runs,
+                                f"int between 1 and the number of available CPUs ({len(os.sched_getaffinity(0))})",
+                                (lambda a, b: not isinstance(a, int) or not 1 <= a <= len(os.sched_getaffinity(0)))
+                            )
+        ConfigValidator.__check_expression('max_parallel_runs', config.max_parallel_runs,
+                                "1 when using OperationType.SEMI",
+                                (lambda a, b: config.operation_type is OperationType.SEMI and a != 1)
+                            )
+
+        # baseline runs
+        ConfigValidator.__check_expression('baseline', config.baseline, BaselineModel,
+                                (lambda a, b: a is not None and not isinstance(a, b))
+                            )
+        ConfigValidator.__check_expression('baseline', config.baseline,
+                                "None when runs are executed in parallel or distributed",
+                                (lambda a, b: a is not None and
+                                              (config.max_parallel_runs != 1 or config.distributed_lease_dir is not None))
+                            )
+
+        # worker pool
+        ConfigValidator.__check_expression('use_worker_pool', config.use_worker_pool, bool,
+                                (lambda a, b: not isinstance(a, b))
+                            )
+        ConfigValidator.__check_expression('worker_recycle_after_runs', config.worker_recycle_after_runs, "int >= 0",
+                                (lambda a, b: not isinstance(a, int) or a < 0)
+                            )
+
+        # watchdog and retries
+        ConfigValidator.__check_expression('run_timeout_in_ms', config.run_timeout_in_ms, "int >= 0",
+                                (lambda a, b: not isinstance(a, int) or a < 0)
+                            )
+        ConfigValidator.__check_expression('max_run_attempts', config.max_run_attempts, "int >= 1",
+                                (lambda a, b: not isinstance(a, int) or a < 1)
+                            )
+
+        # run table journal
+        ConfigValidator.__check_expression('run_table_store', config.run_table_store, RunTableStore,
+                                (lambda a, b: not isinstance(a, b))
+                            )
+        ConfigValidator.__check_expression('run_table_store', config.run_table_store,
+                                "not RunTableStore.PARQUET without pyarrow installed",
+                                (lambda a, b: a is RunTableStore.PARQUET and importlib.util.find_spec('pyarrow') is None)
+                            )
+        ConfigValidator.__check_expression('run_table_compaction_interval', config.run_table_compaction_interval,
+                                "int >= 0",
+                                (lambda a, b: not isinstance(a, int) or a < 0)
+                            )
+        ConfigValidator.__check_expression('run_table_journal_fsync', config.run_table_journal_fsync, bool,
+                                (lambda a, b: not isinstance(a, b))
+                            )
+
+        # distributed execution
+        ConfigValidator.__check_expression('distributed_lease_dir', config.distributed_lease_dir,
+                                "Path that is valid and writable",
+                                (lambda a, b: a is not None and
+                                              (not isinstance(a, Path) or not is_path_exists_or_creatable_portable(str(a))))
+                            )
+        ConfigValidator.__check_expression('distributed_lease_dir', config.distributed_lease_dir,
+                                "None when using OperationType.SEMI",
+                                (lambda a, b: a is not None and config.operation_type is OperationType.SEMI)
+                            )
+        ConfigValidator.__check_expression('lease_timeout_in_ms', config.lease_timeout_in_ms, "int > 0",
+                                (lambda a, b: not isinstance(a, int) or a <= 0)
+                            )
+
         # Results output path
         ConfigValidator.__check_expression("results_output_path", 
                             config.results_output_path,
@@ -11,4 +11,12 @@ class InvalidUserSpecifiedPathError(BaseError):
 
 class InvalidConfigTypeSpecifiedError(BaseError):
     def __init__(self):
-        super().__init__("The specified config type did not match.")
\ No newline at end of file
+        super().__init__("The specified config type did not match.")
+
+class InvalidConfigFileSpecifiedError(BaseError):
+    def __init__(self, path):
+        super().__init__(f"The specified config file does not exist or does not define a RunnerConfig class:\n{path}")
+
+class SummaryNotFoundError(BaseError):
+    def __init__(self, path):
+        super().__init__(f"No summary.json found in the specified experiment output folder:\n{path}")
@@ -1,12 +1,85 @@
-from typing import Callable, List, Tuple
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter_ns
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 from EventManager.Models.RunnerEvents import RunnerEvents
 
+# The subscription of the config hooks (see `subscribe_to_single_event`)
+CONFIG_SUBSCRIPTION = 'config'
+
+
+class EventSubscription:
+    def __init__(self, callback: Callable, priority: int, concurrent: bool, key: Hashable, name: str, order: int):
+        self.callback = callback
+        self.priority = priority
+        self.concurrent = concurrent
+        self.key = key
+        self.name = name
+        self.order = order
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.callback)
+
+    def invoke(self, runner_context):
+        if runner_context:
+            return self.callback(runner_context)
+        else:
+            return self.callback()
+
+
+###     =========================================================
+###     |                                                       |
+###     |              EventSubscriptionController              |
+###     |       - Any number of subscribers per event, called   |
+###     |         by decreasing priority, then in the order     |
+###     |         they subscribed                               |
+###     |       - Adjacent concurrent subscribers of the same   |
+###     |         priority are called together (in threads, or  |
+###     |         gathered when they are `async def`)           |
+###     |       - The duration of every subscriber is recorded  |
+###     |         per event (`get_timings`)                     |
+###     |                                                       |
+###     |       * Subscribing again with the same key replaces  |
+###     |         the subscription, e.g. the config hooks of a  |
+###     |         config that is loaded again                   |
+###     |                                                       |
+###     =========================================================
 class EventSubscriptionController:
-    __call_back_register: dict = dict()
+    __call_back_register: Dict[RunnerEvents, List[EventSubscription]] = dict()
+    __timings: Dict[RunnerEvents, Dict[str, int]] = dict()
+    __subscriptions = 0
+
+    @staticmethod
+    def subscribe(event: RunnerEvents, callback: Callable, priority: int = 0, concurrent: bool = False,
+                  key: Optional[Hashable] = None):
+        """Call `callback` whenever `event` is raised. Subscribers with a higher priority are called first.
+        A subscription is identified by its `key` (the callback by default): subscribing with the same key again
+        replaces it, and `unsubscribe` removes it. The return value of `raise_event` is the result of the only
+        subscriber; with several subscribers, the dicts they return are merged in order (e.g. the data of
+        POPULATE_RUN_DATA), otherwise the last result that is not None is returned."""
+        key = callback if key is None else key
+        name = key if isinstance(key, str) else getattr(callback, '__qualname__', repr(callback))
+        EventSubscriptionController.__subscriptions += 1
+        subscription = EventSubscription(callback, priority, concurrent, key, name,
+                                         EventSubscriptionController.__subscriptions)
+
+        # The register is never changed in place, so an event being raised keeps its subscribers
+        subscriptions = [s for s in EventSubscriptionController.__call_back_register.get(event, []) if s.key != key]
+        subscriptions.append(subscription)
+        subscriptions.sort(key=lambda s: (-s.priority, s.order))
+        EventSubscriptionController.__call_back_register[event] = subscriptions
+
+    @staticmethod
+    def unsubscribe(event: RunnerEvents, key: Hashable):
+        subscriptions = EventSubscriptionController.__call_back_register.get(event, [])
+        EventSubscriptionController.__call_back_register[event] = [s for s in subscriptions if s.key != key]
 
     @staticmethod
     def subscribe_to_single_event(event: RunnerEvents, callback_method: Callable):
-            EventSubscriptionController.__call_back_register[event] = callback_method
+        """Subscribe the config hook of an event, replacing the previous one"""
+        EventSubscriptionController.subscribe(event, callback_method, key=CONFIG_SUBSCRIPTION)
 
     @staticmethod
     def subscribe_to_multiple_events(subscriptions: List[Tuple[RunnerEvents, Callable]]):
@@ -15,20 +88,110 @@ class EventSubscriptionController:
             EventSubscriptionController.subscribe_to_single_event(event, callback)
 
     @staticmethod
-    def raise_event(event: RunnerEvents, runner_context=None):
+    def __batches(event: RunnerEvents) -> List[List[EventSubscription]]:
+        batches = []
+        for subscription in EventSubscriptionController.__call_back_register.get(event, []):
+            previous = batches[-1][0] if batches else None
+            if subscription.concurrent and previous and previous.concurrent and \
+                    previous.priority == subscription.priority:
+                batches[-1].append(subscription)
+            else:
+                batches.append([subscription])
+        return batches
+
+    @staticmethod
+    def __combine(results: List):
+        if len(results) == 1:
+            return results[0]
+
+        dicts = [result for result in results if isinstance(result, dict)]
+        if dicts:
+            combined = {}
+            for result in dicts:
+                combined.update(result)
+            return combined
+        results = [result for result in results if result is not None]
+        return results[-1] if results else None
+
+    @staticmethod
+    def __call(subscription: EventSubscription, runner_context, timings: Dict[str, int]):
+        started = perf_counter_ns()
         try:
-            event_callback = EventSubscriptionController.__call_back_register[event]
-        except KeyError:
-            return None
+            result = subscription.invoke(runner_context)
+            # An `async def` callback raised outside of an event loop (e.g. before_experiment)
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+            return result
+        finally:
+            timings[subscription.name] = perf_counter_ns() - started
 
-        if runner_context:
-            return event_callback(runner_context)
-        else:
-            return event_callback()
+    @staticmethod
+    async def __call_async(subscription: EventSubscription, runner_context, timings: Dict[str, int]):
+        if not subscription.is_async:
+            return EventSubscriptionController.__call(subscription, runner_context, timings)
+
+        started = perf_counter_ns()
+        try:
+            return await subscription.invoke(runner_context)
+        finally:
+            timings[subscription.name] = perf_counter_ns() - started
+
+    @staticmethod
+    async def __gather(batch: List[EventSubscription], runner_context, timings: Dict[str, int]) -> List:
+        call, call_async = EventSubscriptionController.__call, EventSubscriptionController.__call_async
+        return await asyncio.gather(*(call_async(s, runner_context, timings) if s.is_async else
+                                      asyncio.to_thread(call, s, runner_context, timings) for s in batch))
+
+    @staticmethod
+    def raise_event(event: RunnerEvents, runner_context=None):
+        timings, results = {}, []
+        for batch in EventSubscriptionController.__batches(event):
+            if len(batch) == 1:
+                results.append(EventSubscriptionController.__call(batch[0], runner_context, timings))
+            elif any(subscription.is_async for subscription in batch):
+                results += asyncio.run(EventSubscriptionController.__gather(batch, runner_context, timings))
+            else:
+                with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+                    results += executor.map(lambda s: EventSubscriptionController.__call(s, runner_context, timings),
+                                            batch)
+
+        EventSubscriptionController.__timings[event] = timings
+        return EventSubscriptionController.__combine(results) if results else None
+
+    @staticmethod
+    async def raise_event_async(event: RunnerEvents, runner_context=None):
+        """Raise the event from within an event loop: `async def` callbacks are awaited, so other tasks
+        (e.g. started by a previous callback) keep running while they wait."""
+        timings, results = {}, []
+        for batch in EventSubscriptionController.__batches(event):
+            if len(batch) == 1:
+                results.append(await EventSubscriptionController.__call_async(batch[0], runner_context, timings))
+            else:
+                results += await EventSubscriptionController.__gather(batch, runner_context, timings)
+
+        EventSubscriptionController.__timings[event] = timings
+        return EventSubscriptionController.__combine(results) if results else None
+
+    @staticmethod
+    def is_async_event(event: RunnerEvents) -> bool:
+        return any(subscription.is_async
+                   for subscription in EventSubscriptionController.__call_back_register.get(event, []))
 
     @staticmethod
     def get_event_callback(event: RunnerEvents):
-        try:
-            return EventSubscriptionController.__call_back_register[event]
-        except KeyError:
-            return None
+        """The config hook of the event (or its first subscriber, without one)"""
+        subscriptions = EventSubscriptionController.__call_back_register.get(event, [])
+        for subscription in subscriptions:
+            if subscription.key == CONFIG_SUBSCRIPTION:
+                return subscription.callback
+        return subscriptions[0].callback if subscriptions else None
+
+    @staticmethod
+    def get_subscribers(event: RunnerEvents) -> List[EventSubscription]:
+        """The subscriptions of an event, in the order they are called"""
+        return list(EventSubscriptionController.__call_back_register.get(event, []))
+
+    @staticmethod
+    def get_timings(event: RunnerEvents) -> Dict[str, int]:
+        """The duration in ns of every subscriber of the event, the last time it was raised (in this process)"""
+        return dict(EventSubscriptionController.__timings.get(event, {}))
@@ -0,0 +1,168 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+
+# Up to this number of (non-zero) differences without ties, Wilcoxon p-values are computed exactly (as SciPy does)
+EXACT_WILCOXON_MAX_N = 50
+# Comparisons with fewer pairs are not tested
+MIN_PAIRS = 3
+# Columns derived from the `__run_id` of every run, when a dataset does not have them
+RUN_ID_COLUMNS = ['treatment', 'repetition']
+
+
+class SignedRanks:
+    """The signed ranks of the non-zero paired differences (x - y), as used by the Wilcoxon signed-rank test"""
+
+    def __init__(self, differences: np.ndarray):
+        differences = np.asarray(differences, dtype=np.float64)
+        self.differences = differences[~np.isnan(differences) & (differences != 0)]
+        self.n = len(self.differences)
+
+        # Group equal absolute differences (ties), in increasing order
+        self.magnitudes, self.groups, self.tie_counts = np.unique(np.abs(self.differences),
+                                                                  return_inverse=True, return_counts=True)
+        self.signs = np.sign(self.differences)
+        # Average rank of every tie group
+        self.group_ranks = np.cumsum(self.tie_counts) - (self.tie_counts - 1) / 2
+
+    @property
+    def has_ties(self) -> bool:
+        return len(self.tie_counts) < self.n
+
+    @property
+    def total(self) -> float:
+        """The sum of all ranks, n(n + 1) / 2"""
+        return self.n * (self.n + 1) / 2
+
+    @property
+    def positive_rank_sum(self) -> float:
+        """W+, the sum of the ranks of the positive differences"""
+        return float(self.group_ranks[self.groups][self.signs > 0].sum())
+
+    def rank_biserial(self) -> float:
+        """The matched-pairs rank-biserial correlation (W+ - W-) / (W+ + W-); positive when x > y"""
+        return (2 * self.positive_rank_sum - self.total) / self.total
+
+    def bootstrap_rank_biserial(self, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+        """The rank-biserial correlation of `n_resamples` resamples (with replacement) of the differences.
+        All resamples are ranked at once: the rank of a tie group in a resample follows from the cumulative
+        number of resampled differences in the smaller groups, so no resample needs to be sorted."""
+        n, n_groups = self.n, len(self.magnitudes)
+        # Count the negative and positive differences per tie group and resample in one go: cell (resample,
+        # group, positive) is at index (resample * n_groups + group) * 2 + positive
+        cells = (self.groups * 2 + (self.signs > 0))[rng.integers(0, n, size=(n_resamples, n))]
+        cells += (np.arange(n_resamples) * 2 * n_groups)[:, np.newaxis]
+        negative, positive = np.bincount(cells.ravel(), minlength=n_resamples * n_groups * 2).reshape(-1, 2).T
+
+        counts = (negative + positive).reshape(n_resamples, n_groups)
+        sign_sums = (positive - negative).reshape(n_resamples, n_groups)
+        ranks = np.cumsum(counts, axis=1) - (counts - 1) / 2
+        return (sign_sums * ranks).sum(axis=1) / self.total
+
+    def wilcoxon_p_value(self) -> float:
+        """Two-sided p-value of the Wilcoxon signed-rank test (zero differences discarded). Exact for small samples
+        without ties, otherwise the normal approximation with tie correction."""
+        n = self.n
+        positive = self.positive_rank_sum
+        statistic = min(positive, self.total - positive)
+
+        if n <= EXACT_WILCOXON_MAX_N and not self.has_ties:
+            # Number of sign assignments per rank sum W+, built up one rank at a time
+            frequencies = np.zeros(int(self.total) + 1, dtype=np.int64)
+            frequencies[0] = 1
+            for rank in range(1, n + 1):
+                frequencies[rank:] = frequencies[rank:] + frequencies[:-rank]
+            p_value = 2 * frequencies[:int(statistic) + 1].sum() / 2.0 ** n
+        else:
+            variance = n * (n + 1) * (2 * n + 1) / 24 - (self.tie_counts ** 3 - self.tie_counts).sum() / 48
+            z = (statistic - self.total / 2) / math.sqrt(variance)
+            p_value = math.erfc(abs(z) / math.sqrt(2))
+        return min(1.0, float(p_value))
+
+
+def _compare(differences: np.ndarray, n_bootstrap: int, confidence: float, seed: np.random.SeedSequence) -> Dict:
+    ranks = SignedRanks(differences)
+    if ranks.n < MIN_PAIRS:
+        return {'N_pairs': ranks.n, 'p_value': np.nan, 'rank_biserial_r': np.nan, 'ci_low': np.nan, 'ci_high': np.nan}
+
+    resampled = ranks.bootstrap_rank_biserial(n_bootstrap, np.random.default_rng(seed))
+    alpha = (1 - confidence) / 2
+    ci_low, ci_high = np.quantile(resampled, [alpha, 1 - alpha])
+    return {'N_pairs': ranks.n, 'p_value': ranks.wilcoxon_p_value(), 'rank_biserial_r': ranks.rank_biserial(),
+            'ci_low': float(ci_low), 'ci_high': float(ci_high)}
+
+
+def compare_paired(differences: Sequence[np.ndarray], n_bootstrap: int = 2000, confidence: float = 0.95,
+                   seed: int = 0, max_workers: Optional[int] = None) -> List[Dict]:
+    """Wilcoxon signed-rank test and rank-biserial correlation, with a percentile bootstrap confidence interval,
+    of every array of paired differences. Comparisons are spread over a pool of `max_workers` processes
+    (all CPUs by default, none if 1). Every comparison has its own random stream, derived from `seed`,
+    so the results do not depend on the number of processes."""
+    seeds = np.random.SeedSequence(seed).spawn(len(differences))
+    arguments = [differences, [n_bootstrap] * len(differences), [confidence] * len(differences), seeds]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(differences) < 2:
+        return list(map(_compare, *arguments))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, math.ceil(len(differences) / (max_workers * 4)))
+        return list(executor.map(_compare, *arguments, chunksize=chunksize))
+
+
+def _split_run_id(run_id) -> tuple:
+    try:
+        return RunTableModel.split_run_id(str(run_id))
+    except ValueError:
+        return None, None
+
+
+def with_run_id_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """The dataset with the treatment (e.g. 'run_3') and repetition of every run, as encoded in its `__run_id`,
+    as columns (if the dataset has no columns of that name)"""
+    missing = [column for column in RUN_ID_COLUMNS if column not in data.columns]
+    if '__run_id' not in data.columns or not missing:
+        return data
+
+    treatments, repetitions = zip(*map(_split_run_id, data['__run_id'])) if len(data) else ((), ())
+    derived = {'treatment': list(treatments), 'repetition': pd.array(repetitions, dtype='Int64')}
+    return data.assign(**{column: derived[column] for column in missing})
+
+
+def hypothesis_table(data: pd.DataFrame, metric: str, treatment_column: str, baseline: str,
+                     pair_columns: List[str], n_bootstrap: int = 2000, confidence: float = 0.95, seed: int = 0,
+                     max_workers: Optional[int] = None) -> pd.DataFrame:
+    """Per treatment (level of `treatment_column`): N, mean, median and standard deviation of `metric`, and the
+    paired comparison with the `baseline` treatment. Runs are paired on `pair_columns` (e.g. the algorithm and
+    repetition, derived from the `__run_id` of run tables); multiple runs of a treatment in one pair are reduced
+    to their median."""
+    data = with_run_id_columns(data)
+    missing = [column for column in [metric, treatment_column, *pair_columns] if column not in data.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+    data = data.assign(**{metric: pd.to_numeric(data[metric], errors='coerce')})
+    table = (data.groupby(treatment_column)[metric].agg(['count', 'mean', 'median', 'std'])
+             .rename(columns={'count': 'N'}))
+
+    pairs = data.pivot_table(index=pair_columns, columns=treatment_column, values=metric, aggfunc='median')
+    if baseline not in pairs.columns:
+        raise ValueError(f"No runs of the baseline treatment {baseline!r}")
+    treatments = [treatment for treatment in pairs.columns if treatment != baseline]
+    differences = [(pairs[treatment] - pairs[baseline]).dropna().to_numpy() for treatment in treatments]
+
+    results = pd.DataFrame(compare_paired(differences, n_bootstrap, confidence, seed, max_workers),
+                           index=pd.Index(treatments, name=treatment_column),
+                           columns=['N_pairs', 'p_value', 'rank_biserial_r', 'ci_low', 'ci_high'])
+    ci_column = f"r_{round(confidence * 100)}%CI"
+    results[ci_column] = [f"[{low:.3f}, {high:.3f}]" if not np.isnan(low) else 'n/a'
+                          for low, high in zip(results['ci_low'], results['ci_high'])]
+    results = results.drop(columns=['ci_low', 'ci_high'])
+
+    return table.join(results, how='left').reset_index()
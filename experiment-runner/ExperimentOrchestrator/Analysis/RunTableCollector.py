@@ -0,0 +1,145 @@
+import hashlib
+import importlib.util
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ProgressManager.Output.OutputProcedure import OutputProcedure as output
+
+RUN_TABLE_FILE = 'run_table.csv'
+MANIFEST_FILE = 'collect_manifest.json'
+CACHE_DIRECTORY = '.collect_cache'
+
+# Experiment output folders are named <experiment_name>_<YYYYmmdd>_<HHMMSS>
+TIMESTAMP_SUFFIX = re.compile(r'_\d{8}_\d{6}$')
+
+
+def experiment_name_of(folder_name: str) -> str:
+    """The experiment name of an output folder, without its timestamp suffix (if any)"""
+    return TIMESTAMP_SUFFIX.sub('', folder_name)
+
+
+###     =========================================================
+###     |                                                       |
+###     |                   RunTableCollector                   |
+###     |       - Combine the run tables of all experiments     |
+###     |         below a folder into one dataset, with the     |
+###     |         experiment name as first column               |
+###     |       - Run tables are parsed in parallel, and cached |
+###     |         by file mtime and size: re-collecting only    |
+###     |         parses new or changed run tables              |
+###     |       - The collected files are listed in a manifest  |
+###     |                                                       |
+###     =========================================================
+class RunTableCollector:
+
+    def __init__(self, root: Path, output_file: Optional[Path] = None, max_workers: Optional[int] = None):
+        self.root = Path(root)
+        if output_file is None:
+            # Columnar output when pyarrow is available
+            extension = 'parquet' if importlib.util.find_spec('pyarrow') else 'csv'
+            output_file = self.root / f'all_run_tables_combined.{extension}'
+        self.output_file = Path(output_file)
+        self.manifest_path = self.output_file.parent / MANIFEST_FILE
+        self.cache_path = self.output_file.parent / CACHE_DIRECTORY
+        self.max_workers = max_workers
+
+    def __read_manifest(self) -> Dict:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'files': {}}
+
+    def __cache_file(self, relative_path: str) -> Path:
+        return self.cache_path / (hashlib.sha1(relative_path.encode()).hexdigest() + '.pkl')
+
+    def __load(self, run_table: Path, entry: Dict, cached: bool) -> Tuple[Path, Optional[pd.DataFrame], str]:
+        relative_path = run_table.relative_to(self.root).as_posix()
+        try:
+            if cached:
+                try:
+                    return run_table, pd.read_pickle(self.__cache_file(relative_path)), ''
+                except Exception:
+                    pass                                                    # Cache was removed or is corrupt, parse again
+
+            frame = pd.read_csv(run_table)
+            frame.insert(0, 'experiment_name', entry['experiment_name'])
+            frame.to_pickle(self.__cache_file(relative_path))
+            return run_table, frame, ''
+        except Exception as e:
+            return run_table, None, str(e)
+
+    def collect(self) -> Dict:
+        """Collect the run tables and (re)write the combined dataset, unless no run table was added, changed or
+        removed since the last collect. Returns the manifest, with the number of (re)parsed run tables."""
+        previous = self.__read_manifest()
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+
+        run_tables = sorted(self.root.rglob(RUN_TABLE_FILE))
+        files: Dict[str, Dict] = {}
+        jobs: List[Tuple[Path, Dict, bool]] = []
+        for run_table in run_tables:
+            relative_path = run_table.relative_to(self.root).as_posix()
+            stat = run_table.stat()
+            entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                     'experiment_name': experiment_name_of(run_table.parent.name)}
+            known = previous['files'].get(relative_path)
+            cached = known is not None and known['mtime_ns'] == entry['mtime_ns'] and known['size'] == entry['size']
+            files[relative_path] = entry
+            jobs.append((run_table, entry, cached))
+
+        changed = sum(not cached for _, _, cached in jobs)
+        removed = set(previous['files']) - set(files)
+        for relative_path in removed:
+            self.__cache_file(relative_path).unlink(missing_ok=True)
+
+        if not changed and not removed and self.output_file.exists() and previous.get('output') == self.output_file.name:
+            return {**previous, 'changed': 0}                               # The combined dataset is up to date
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda job: self.__load(*job), jobs))
+
+        frames = []
+        for run_table, frame, error in results:
+            relative_path = run_table.relative_to(self.root).as_posix()
+            if frame is None:
+                output.console_log_WARNING(f"Skipped {run_table}: {error}")
+                del files[relative_path]
+                continue
+            files[relative_path]['rows'] = len(frame)
+            frames.append(frame)
+
+        manifest = {
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'output': self.output_file.name,
+            'rows': sum(len(frame) for frame in frames),
+            'files': files
+        }
+        self.__write_combined(frames)
+
+        tmp = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+        manifest['changed'] = changed
+        return manifest
+
+    def __write_combined(self, frames: List[pd.DataFrame]):
+        combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['experiment_name'])
+        tmp = self.output_file.with_name(self.output_file.name + '.tmp')
+        if self.output_file.suffix == '.parquet':
+            # Columns that differ in type between run tables (e.g. numbers and errors) are stored as strings
+            for column in combined.columns[combined.dtypes == object]:
+                combined[column] = combined[column].astype('string')
+            combined.to_parquet(tmp, index=False)
+        else:
+            combined.to_csv(tmp, index=False)
+        os.replace(tmp, self.output_file)
@@ -0,0 +1,103 @@
+import os
+import sys
+import signal
+import traceback
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from typing import Any, Callable, Optional, Set
+
+import dill
+
+from ExperimentOrchestrator.Architecture.WorkerPool import WorkerDiedError, kill_process_group
+
+# Time a run gets to clean up (stop its DataSources and hooks) after it was terminated, before it is killed
+KILL_GRACE_PERIOD_IN_MS = 5000
+
+
+class RunTimeoutError(Exception):
+    pass
+
+
+class RunFailedError(Exception):
+    """Carries the (name, value, traceback) error tuple of a run that failed in another process"""
+    def __init__(self, error: tuple):
+        super().__init__(f"{error[0]}: {error[1]}")
+        self.error = error
+
+
+class RunTerminatedError(Exception):
+    """Raised inside a run when the watchdog terminates it, so the run can clean up while unwinding"""
+    pass
+
+
+def _process_group_main(conn, execute: Callable[[], Any], cpu_set: Optional[Set[int]]):
+    # Everything the run starts (the run itself, targets, profilers) inherits the process group and cpuset
+    os.setpgrp()
+    if cpu_set:
+        os.sched_setaffinity(0, cpu_set)
+
+    # The run (in a child process) handles the termination; wait for it to report back instead of leaving early
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    try:
+        result = execute()
+        error = None
+    except Exception:
+        ex_type, ex_value, tb = sys.exc_info()
+        error = ex_type.__name__, str(ex_value), ''.join(traceback.format_tb(tb))
+        result = None
+
+    conn.send_bytes(dill.dumps((result, error)))
+
+
+class RunProcess:
+    """Executes `execute()` in a new process, leading its own process group, so a hung run and everything it
+    started can be terminated as a whole. Mirrors the `sentinel` / `join()` / `result` / `error` of a `PoolTask`."""
+
+    def __init__(self, execute: Callable[[], Any], cpu_set: Optional[Set[int]] = None):
+        self.__conn, child_conn = Pipe(duplex=False)
+        self.__process = Process(target=_process_group_main, args=[child_conn, execute, cpu_set])
+        self.__process.start()
+        child_conn.close()  # A dying run is seen as EOF
+
+        self.__joined = False
+        self.terminated = False
+        self.result: Any = None
+        self.error: Optional[tuple] = None
+
+    @property
+    def sentinel(self):
+        # Readable once the result is sent, or the process died. Waiting on the process itself could deadlock
+        # on a result larger than the pipe buffer.
+        return self.__conn
+
+    def join(self):
+        if self.__joined:
+            return self.result
+
+        try:
+            self.result, self.error = dill.loads(self.__conn.recv_bytes())
+        except (EOFError, OSError):
+            self.__process.join()
+            self.error = WorkerDiedError.__name__, f"run process exited with code {self.__process.exitcode}", ''
+
+        self.__process.join()
+        self.__conn.close()
+        self.__joined = True
+        return self.result
+
+    def terminate(self):
+        """Ask the run to stop (SIGTERM to its process group)"""
+        self.terminated = True
+        kill_process_group(self.__process.pid, signal.SIGTERM)
+
+    def kill(self):
+        kill_process_group(self.__process.pid, signal.SIGKILL)
+
+    def wait(self, timeout_in_ms: int = 0, kill_grace_period_in_ms: int = KILL_GRACE_PERIOD_IN_MS):
+        """Block until the run is done, terminating it after `timeout_in_ms` (0 = never)"""
+        if timeout_in_ms and not wait([self.sentinel], timeout_in_ms / 1000):
+            self.terminate()
+            if not wait([self.sentinel], kill_grace_period_in_ms / 1000):
+                self.kill()
+        return self.join()
@@ -0,0 +1,167 @@
+import os
+import sys
+import signal
+import traceback
+from multiprocessing import Pipe, Process
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+import dill
+
+
+class WorkerDiedError(Exception):
+    pass
+
+
+def kill_process_group(pgid: int, sig: int):
+    try:
+        os.killpg(pgid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass  # already exited
+
+
+def _worker_main(conn, execute_task: Callable, cpu_set: Optional[Set[int]], parent_pid: int):
+    # Lead a process group, so a hung task and everything it started can be terminated as a whole
+    os.setpgrp()
+    if cpu_set:
+        os.sched_setaffinity(0, cpu_set)
+
+    while True:
+        # Periodically check if the experiment process is still alive, so orphaned workers do not linger
+        while not conn.poll(1.0):
+            if os.getppid() != parent_pid:
+                return
+
+        try:
+            task = dill.loads(conn.recv_bytes())
+        except EOFError:
+            return
+
+        if task is None:
+            return
+
+        try:
+            result = execute_task(task)
+            error = None
+        except Exception:
+            ex_type, ex_value, tb = sys.exc_info()
+            error = ex_type.__name__, str(ex_value), ''.join(traceback.format_tb(tb))
+            result = None
+
+        conn.send_bytes(dill.dumps((result, error)))
+
+
+class _Worker:
+    def __init__(self, execute_task: Callable, cpu_set: Optional[Set[int]]):
+        self.conn, child_conn = Pipe()
+        self.process = Process(target=_worker_main, args=[child_conn, execute_task, cpu_set, os.getpid()])
+        self.process.start()
+        child_conn.close()  # Only the worker may hold the other end, so a dying worker is seen as EOF
+        self.tasks_done = 0
+
+    def stop(self):
+        try:
+            self.conn.send_bytes(dill.dumps(None))
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(5)
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class PoolTask:
+    """Handle of a task submitted to a `WorkerPool`. Can be passed to `multiprocessing.connection.wait`
+    through its `sentinel`, and `join()` blocks until the result (or error) is available."""
+
+    def __init__(self, pool: 'WorkerPool', key: Hashable, worker: _Worker):
+        self.__pool = pool
+        self.__key = key
+        self.__worker = worker
+        self.__joined = False
+        self.terminated = False
+        self.result: Any = None
+        self.error: Optional[tuple] = None
+
+    @property
+    def sentinel(self):
+        return self.__worker.conn
+
+    def join(self):
+        if self.__joined:
+            return self.result
+
+        try:
+            self.result, self.error = dill.loads(self.__worker.conn.recv_bytes())
+        except (EOFError, OSError):
+            self.error = WorkerDiedError.__name__, f"worker exited with code {self.__worker.process.exitcode}", ''
+
+        self.__joined = True
+        self.__pool._task_done(self.__key, self.__worker, failed=self.error is not None)
+        return self.result
+
+    def terminate(self):
+        """Ask the task to stop (SIGTERM to the process group of its worker). The worker is replaced afterwards."""
+        self.terminated = True
+        kill_process_group(self.__worker.process.pid, signal.SIGTERM)
+
+    def kill(self):
+        kill_process_group(self.__worker.process.pid, signal.SIGKILL)
+
+
+###     =========================================================
+###     |                                                       |
+###     |                      WorkerPool                       |
+###     |       - Pre-fork persistent (optionally pinned)       |
+###     |         worker processes once                         |
+###     |       - Hand tasks to a specific worker               |
+###     |       - Recycle workers after N tasks or on failure   |
+###     |                                                       |
+###     |       * Tasks and results are serialized with dill,   |
+###     |         so arbitrary treatment objects are supported  |
+###     |                                                       |
+###     =========================================================
+class WorkerPool:
+
+    def __init__(self, execute_task: Callable[[Any], Any], recycle_after_tasks: int = 0):
+        """`execute_task` is invoked inside a worker for every submitted task. A `recycle_after_tasks` of 0
+        keeps workers alive for the whole lifetime of the pool (unless they fail)."""
+        self.__execute_task = execute_task
+        self.__recycle_after_tasks = recycle_after_tasks
+        self.__cpu_sets: Dict[Hashable, Optional[Set[int]]] = {}
+        self.__workers: Dict[Hashable, _Worker] = {}
+
+    @staticmethod
+    def key_of(cpu_set: Optional[Set[int]]) -> Hashable:
+        return frozenset(cpu_set) if cpu_set else None
+
+    def start_worker(self, cpu_set: Optional[Set[int]] = None):
+        key = WorkerPool.key_of(cpu_set)
+        self.__cpu_sets[key] = cpu_set
+        if key not in self.__workers:
+            self.__workers[key] = _Worker(self.__execute_task, cpu_set)
+
+    def submit(self, task: Any, cpu_set: Optional[Set[int]] = None) -> PoolTask:
+        key = WorkerPool.key_of(cpu_set)
+        self.start_worker(cpu_set)  # (Re)spawns the worker if it was recycled
+
+        worker = self.__workers[key]
+        worker.conn.send_bytes(dill.dumps(task))
+        return PoolTask(self, key, worker)
+
+    def _task_done(self, key: Hashable, worker: _Worker, failed: bool):
+        worker.tasks_done += 1
+
+        if failed or (self.__recycle_after_tasks and worker.tasks_done >= self.__recycle_after_tasks):
+            worker.stop()
+            if self.__workers.get(key) is worker:
+                del self.__workers[key]
+
+            # Replace it right away, so the fork does not happen on the critical path of the next task
+            self.start_worker(self.__cpu_sets[key])
+
+    def shutdown(self):
+        for worker in self.__workers.values():
+            worker.stop()
+        self.__workers.clear()
@@ -0,0 +1,70 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ExperimentOrchestrator.Distributed.LeaseDirectory import LeaseDirectory
+from ProgressManager.Output.OutputProcedure import OutputProcedure as output
+
+
+class LeasedRun:
+    """Outcome of a run executed by a worker node. Mirrors the `result` / `error` of a `PoolTask`."""
+
+    def __init__(self, worker_id: str, result: Optional[Dict], error: Optional[tuple]):
+        self.worker_id = worker_id
+        self.result: Any = result
+        self.error: Optional[tuple] = error
+
+
+###     =========================================================
+###     |                                                       |
+###     |                 DistributedCoordinator                |
+###     |       - Lease the pending runs to worker nodes        |
+###     |         through a LeaseDirectory                      |
+###     |       - Hand back results as they come in             |
+###     |       - Return runs of crashed workers to the queue   |
+###     |                                                       |
+###     =========================================================
+class DistributedCoordinator:
+
+    def __init__(self, lease_dir: LeaseDirectory, lease_timeout_in_ms: int, poll_interval_in_ms: int = 500):
+        self.lease_dir = lease_dir
+        self.lease_timeout_in_ms = lease_timeout_in_ms
+        self.poll_interval_in_ms = poll_interval_in_ms
+
+    def run(self,
+            pending: List[Tuple[int, Dict]],
+            total_runs: Callable[[], int],
+            on_run_finished: Callable[[int, Dict, LeasedRun], Optional[List[Tuple[int, Dict]]]],
+            on_run_offered: Optional[Callable[[Dict], None]] = None):
+        """Offer all `pending` (run_nr, run) tuples to the workers and block until each of them is finished.
+        Runs returned by `on_run_finished` (e.g. retries) are offered as well. `on_run_offered` is called
+        with each run right before it is offered."""
+        self.lease_dir.reset()
+        outstanding: Dict[str, Tuple[int, Dict]] = {}
+
+        def offer(runs: List[Tuple[int, Dict]]):
+            for run_nr, run in runs:
+                if on_run_offered:
+                    on_run_offered(run)
+                outstanding[run['__run_id']] = (run_nr, run)
+                self.lease_dir.offer(run['__run_id'], (run_nr, total_runs(), run))
+
+        try:
+            offer(pending)
+            while outstanding:
+                for run_id, result, error, worker_id in self.lease_dir.collect():
+                    if run_id not in outstanding:
+                        # A worker that lost its lease finished after all, the run was already completed elsewhere
+                        output.console_log_WARNING(f"Ignoring duplicate result of {run_id} from worker {worker_id}")
+                        continue
+
+                    run_nr, run = outstanding.pop(run_id)
+                    output.console_log_OK(f"Run {run_id} finished on worker {worker_id}")
+                    offer(on_run_finished(run_nr, run, LeasedRun(worker_id, result, error)) or [])
+
+                for run_id in self.lease_dir.requeue_expired(self.lease_timeout_in_ms):
+                    output.console_log_WARNING(f"Lease of {run_id} expired, returning it to the queue")
+
+                if outstanding:
+                    time.sleep(self.poll_interval_in_ms / 1000)
+        finally:
+            self.lease_dir.close()
@@ -0,0 +1,139 @@
+import sys
+import time
+import threading
+import traceback
+from typing import Callable, Dict, Optional
+
+from ConfigValidator.Config.RunnerConfig import RunnerConfig
+from EventManager.Models.RunnerEvents import RunnerEvents
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from ExperimentOrchestrator.Architecture.RunProcess import RunProcess, RunFailedError, RunTimeoutError
+from ExperimentOrchestrator.Distributed.LeaseDirectory import LeaseDirectory
+from ExperimentOrchestrator.Experiment.CooldownController import CooldownController
+from ExperimentOrchestrator.Experiment.ExperimentController import pause_between_runs
+from ExperimentOrchestrator.Experiment.Run.RunController import RunController
+from ProgressManager.Output.OutputProcedure import OutputProcedure as output
+
+
+###     =========================================================
+###     |                                                       |
+###     |                   DistributedWorker                   |
+###     |       - Claim runs from a LeaseDirectory, one at a    |
+###     |         time, and execute them on this node           |
+###     |       - Keep the lease alive while a run executes     |
+###     |       - Stop once the coordinator closes the          |
+###     |         directory                                     |
+###     |                                                       |
+###     =========================================================
+class DistributedWorker:
+
+    def __init__(self,
+                 lease_dir: LeaseDirectory,
+                 worker_id: str,
+                 execute_run: Callable[[int, int, Dict], Dict],
+                 lease_timeout_in_ms: int,
+                 after_run: Optional[Callable[[], None]] = None,
+                 poll_interval_in_ms: int = 500):
+        """`execute_run(run_nr, total_runs, run)` performs a run and returns the updated run data,
+        `after_run()` is called after each run, once its result has been handed back (e.g. to cool down)."""
+        self.lease_dir = lease_dir
+        self.worker_id = worker_id
+        self.execute_run = execute_run
+        self.lease_timeout_in_ms = lease_timeout_in_ms
+        self.after_run = after_run
+        self.poll_interval_in_ms = poll_interval_in_ms
+        self.runs_done = 0
+
+    def __keep_lease_alive(self, lease, run_id: str, finished: threading.Event):
+        while not finished.wait(self.lease_timeout_in_ms / 4000):
+            if not LeaseDirectory.heartbeat(lease):
+                output.console_log_WARNING(f"Lost the lease of {run_id}, it may be executed by another worker")
+                return
+
+    def __is_completed(self, stale_session: Optional[str]) -> bool:
+        closed = self.lease_dir.closed_session()
+        return closed is not None and closed != stale_session and closed == self.lease_dir.current_session()
+
+    def serve(self):
+        """Execute runs until the current session is closed. A session that was already closed when the worker
+        started (a previous experiment) is ignored, so workers can be started before or during an experiment."""
+        stale_session = self.lease_dir.closed_session()
+
+        while True:
+            claimed = self.lease_dir.claim(self.worker_id)
+            if claimed is None:
+                if self.__is_completed(stale_session):
+                    return
+                time.sleep(self.poll_interval_in_ms / 1000)
+                continue
+
+            run_id, (run_nr, total_runs, run), lease = claimed
+            finished = threading.Event()
+            heartbeat = threading.Thread(target=self.__keep_lease_alive, args=[lease, run_id, finished], daemon=True)
+            heartbeat.start()
+
+            try:
+                result = self.execute_run(run_nr, total_runs, run)
+                error = None
+            except RunFailedError as e:
+                error = e.error  # Keep the original error of the run process
+                result = None
+            except Exception:
+                ex_type, ex_value, tb = sys.exc_info()
+                error = ex_type.__name__, str(ex_value), ''.join(traceback.format_tb(tb))
+                result = None
+                output.console_log_FAIL(f"Run {run_id} failed: {error[0]}: {error[1]}")
+            finally:
+                finished.set()
+                heartbeat.join()
+
+            self.lease_dir.complete(run_id, lease, self.worker_id, result, error)
+            self.runs_done += 1
+
+            if self.after_run:
+                self.after_run()
+
+
+def serve_config(config: RunnerConfig, worker_id: str):
+    """Execute runs of the (validated) config, leased by the coordinator of its `distributed_lease_dir`,
+    until the coordinator completes the experiment. All config hooks are executed on this node."""
+    config.create_run_table_model()  # Config hooks may rely on the run table model
+    cooldown_controller = CooldownController(config.cooldown) if config.cooldown else None
+    last_cooldown_ms = 0
+
+    def execute_run(run_nr: int, total_runs: int, run: Dict) -> Dict:
+        output.console_log_WARNING("Calling before_run config hook")
+        EventSubscriptionController.raise_event(RunnerEvents.BEFORE_RUN)
+
+        if cooldown_controller:
+            run['__cooldown_ms'] = last_cooldown_ms
+
+        run_controller = RunController(run, config, run_nr, total_runs)
+        handle = RunProcess(lambda: run_controller.do_run(persist=False))
+        handle.wait(config.run_timeout_in_ms)
+
+        if handle.terminated:
+            raise RunTimeoutError(f"exceeded the run timeout of {config.run_timeout_in_ms}ms")
+        if handle.error:
+            raise RunFailedError(handle.error)
+        return handle.result
+
+    def after_run():
+        nonlocal last_cooldown_ms
+        last_cooldown_ms = pause_between_runs(config, cooldown_controller)
+
+    if cooldown_controller:
+        baseline = cooldown_controller.record_baseline()
+        output.console_log_WARNING(f"Recorded idle {config.cooldown.sensor.name} baseline: {baseline:.2f}")
+
+    output.console_log_WARNING("Calling before_experiment config hook")
+    EventSubscriptionController.raise_event(RunnerEvents.BEFORE_EXPERIMENT)
+
+    output.console_log_OK(f"Worker {worker_id} waiting for runs in {config.distributed_lease_dir}")
+    worker = DistributedWorker(LeaseDirectory(config.distributed_lease_dir), worker_id, execute_run,
+                               config.lease_timeout_in_ms, after_run)
+    worker.serve()
+    output.console_log_OK(f"Experiment completed, worker {worker_id} executed {worker.runs_done} runs")
+
+    output.console_log_WARNING("Calling after_experiment config hook")
+    EventSubscriptionController.raise_event(RunnerEvents.AFTER_EXPERIMENT)
@@ -0,0 +1,156 @@
+import os
+import uuid
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import dill
+
+
+###     =========================================================
+###     |                                                       |
+###     |                     LeaseDirectory                    |
+###     |       - Shared-filesystem protocol between one        |
+###     |         coordinator and any number of workers         |
+###     |                                                       |
+###     |       pending/<order>.<task>.task  offered tasks      |
+###     |       leased/<task>.<worker>.task  claimed tasks,     |
+###     |                                    mtime = heartbeat  |
+###     |       results/<task>.result        finished tasks     |
+###     |       SESSION                      token of the       |
+###     |                                    current experiment |
+###     |       STOP                         token of a session |
+###     |                                    without more tasks |
+###     |                                                       |
+###     |       * Every state change is an atomic rename, so    |
+###     |         exactly one worker can claim a task           |
+###     |       * Lease ages are measured against the clock of  |
+###     |         the file system, so the clocks of the nodes   |
+###     |         do not need to be in sync                     |
+###     |                                                       |
+###     =========================================================
+class LeaseDirectory:
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.pending_dir = self.path / 'pending'
+        self.leased_dir = self.path / 'leased'
+        self.results_dir = self.path / 'results'
+        self.session_file = self.path / 'SESSION'
+        self.stop_file = self.path / 'STOP'
+        self.session: Optional[str] = None  # of the coordinator
+        self.__offered = 0
+
+        for directory in [self.pending_dir, self.leased_dir, self.results_dir]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def __write_atomic(self, destination: Path, obj: Any):
+        tmp = destination.parent / f".{destination.name}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(dill.dumps(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, destination)
+
+    @staticmethod
+    def __write_token(destination: Path, token: str):
+        tmp = destination.parent / f".{destination.name}.{uuid.uuid4().hex}.tmp"
+        tmp.write_text(token)
+        os.replace(tmp, destination)
+
+    @staticmethod
+    def __read_token(path: Path) -> Optional[str]:
+        try:
+            return path.read_text()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def __read(path: Path) -> Any:
+        with open(path, 'rb') as f:
+            return dill.loads(f.read())
+
+    def __fs_now(self) -> float:
+        clock = self.path / '.clock'
+        clock.touch()
+        return clock.stat().st_mtime
+
+    # ================================ COORDINATOR ================================
+
+    def reset(self):
+        """Forget all tasks and results of a previous coordinator, and start a new session"""
+        for directory in [self.pending_dir, self.leased_dir, self.results_dir]:
+            for entry in directory.iterdir():
+                entry.unlink()
+        self.stop_file.unlink(missing_ok=True)
+
+        self.session = uuid.uuid4().hex
+        LeaseDirectory.__write_token(self.session_file, self.session)
+
+    def offer(self, task_id: str, task: Any):
+        """Offer a task (`task_id` may not contain dots). Tasks are claimed in the order they are offered."""
+        self.__offered += 1
+        self.__write_atomic(self.pending_dir / f"{self.__offered:09d}.{task_id}.task", task)
+
+    def collect(self) -> List[Tuple[str, Any, Optional[tuple], str]]:
+        """Return (task_id, result, error, worker_id) of all finished tasks, and remove them from the directory"""
+        finished = []
+        for result_file in sorted(self.results_dir.glob('*.result')):
+            task_id = result_file.name[:-len('.result')]
+            result, error, worker_id = LeaseDirectory.__read(result_file)
+            result_file.unlink()
+            finished.append((task_id, result, error, worker_id))
+        return finished
+
+    def requeue_expired(self, lease_timeout_in_ms: int) -> List[str]:
+        """Return tasks whose lease was not renewed in time (e.g. crashed workers) to the pending tasks"""
+        requeued = []
+        now = self.__fs_now()
+        for lease in self.leased_dir.glob('*.task'):
+            try:
+                expired = now - lease.stat().st_mtime > lease_timeout_in_ms / 1000
+                if expired:
+                    task_id = lease.name.split('.')[0]
+                    os.rename(lease, self.pending_dir / f"{0:09d}.{task_id}.task")  # ahead of the queue
+                    requeued.append(task_id)
+            except FileNotFoundError:
+                continue  # completed in the meantime
+        return requeued
+
+    def close(self):
+        """Tell the workers the session has no more tasks"""
+        LeaseDirectory.__write_token(self.stop_file, self.session or self.current_session() or '')
+
+    # ================================== WORKER ===================================
+
+    def current_session(self) -> Optional[str]:
+        return LeaseDirectory.__read_token(self.session_file)
+
+    def closed_session(self) -> Optional[str]:
+        """The session that was closed last (None while a session is open)"""
+        return LeaseDirectory.__read_token(self.stop_file)
+
+    def claim(self, worker_id: str) -> Optional[Tuple[str, Any, Path]]:
+        for pending in sorted(self.pending_dir.glob('*.task')):
+            task_id = pending.name.split('.')[1]
+            lease = self.leased_dir / f"{task_id}.{worker_id}.task"
+            try:
+                os.rename(pending, lease)
+            except FileNotFoundError:
+                continue  # claimed by another worker
+
+            os.utime(lease)
+            return task_id, LeaseDirectory.__read(lease), lease
+        return None
+
+    @staticmethod
+    def heartbeat(lease: Path) -> bool:
+        """Renew the lease. Returns False if the lease was lost (expired and requeued)"""
+        try:
+            os.utime(lease)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, task_id: str, lease: Path, worker_id: str, result: Any, error: Optional[tuple]):
+        self.__write_atomic(self.results_dir / f"{task_id}.result", (result, error, worker_id))
+        lease.unlink(missing_ok=True)
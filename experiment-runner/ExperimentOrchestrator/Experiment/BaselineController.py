@@ -0,0 +1,137 @@
+import json
+import math
+import os
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ConfigValidator.Config.Models.BaselineModel import BaselineCorrection, BaselineModel
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+BASELINE_FILE = 'baseline.json'
+BASELINE_RUN_PREFIX = 'baseline_'
+NET_SUFFIX = '_net'
+
+
+def _value_of(run: Dict, column: str) -> Optional[float]:
+    try:
+        value = float(run[column])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+###     =========================================================
+###     |                                                       |
+###     |                   BaselineController                  |
+###     |       - Schedule idle baseline runs at the start of   |
+###     |         the experiment and after every `interval`     |
+###     |         runs                                          |
+###     |       - Model the overhead of the profilers per data  |
+###     |         column from the last baseline runs            |
+###     |       - Fill in the `<column>_net` columns of runs:   |
+###     |         their value minus the overhead                |
+###     |                                                       |
+###     |       * The baseline runs and the current overhead    |
+###     |         are kept in `baseline.json`, so a restarted   |
+###     |         experiment continues with the same model      |
+###     |                                                       |
+###     =========================================================
+class BaselineController:
+
+    def __init__(self, baseline: BaselineModel, data_columns: List[str], experiment_path: Path):
+        self.baseline = baseline
+        self.path = experiment_path / BASELINE_FILE
+
+        if baseline.columns is None:
+            self.columns = {column: BaselineCorrection.AMOUNT for column in data_columns
+                            if not column.startswith('__')}
+        else:
+            unknown = set(baseline.columns) - set(data_columns)
+            if unknown:
+                raise BaseError(f"Baseline columns {sorted(unknown)} are not data columns of the run table!")
+            self.columns = dict(baseline.columns)
+
+        self.runs: List[Dict] = []
+        self.recent = deque(maxlen=baseline.history)
+        self.runs_since_baseline = 0
+        self.initial_runs_due = baseline.initial_runs
+
+    @property
+    def net_columns(self) -> List[str]:
+        return [f"{column}{NET_SUFFIX}" for column in self.columns]
+
+    def load(self):
+        """Continue with the baseline runs of a restarted experiment"""
+        try:
+            with open(self.path, 'r') as f:
+                self.runs = json.load(f)['runs']
+        except FileNotFoundError:
+            return
+        self.recent.extend(run for run in self.runs if run['values'])
+
+    def is_due(self) -> bool:
+        return self.initial_runs_due > 0 or \
+            (self.baseline.interval > 0 and self.runs_since_baseline >= self.baseline.interval)
+
+    def run_finished(self):
+        self.runs_since_baseline += 1
+
+    def create_run(self, factor_levels: Dict) -> Dict:
+        """The row of the next baseline run: its run id, the factor levels of a representative run (the one that
+        follows), so hooks can read them as in any run, and empty data columns to be filled in by the hooks"""
+        run = {'__run_id': f"{BASELINE_RUN_PREFIX}{len(self.runs)}", '__done': RunProgress.TODO, **factor_levels}
+        for column in self.columns:
+            run[column] = " "
+        return run
+
+    def add_result(self, run_id: str, completed: Optional[Dict], duration_ns: Optional[int]):
+        """Add the data of a baseline run to the model. Failed baseline runs (`completed` is None) are recorded,
+        but not retried."""
+        self.initial_runs_due = max(self.initial_runs_due - 1, 0)
+        self.runs_since_baseline = 0
+
+        values = {}
+        if completed and duration_ns:
+            values = {column: _value_of(completed, column) for column in self.columns}
+        run = {'__run_id': run_id, 'duration_ns': duration_ns,
+               'values': {column: value for column, value in values.items() if value is not None}}
+        self.runs.append(run)
+        if run['values']:
+            self.recent.append(run)
+        self.write()
+
+    def overhead(self, column: str, duration_ns: int) -> Optional[float]:
+        """The overhead in a column of a run measured for `duration_ns`, None without baseline data"""
+        samples = [(run['values'][column], run['duration_ns']) for run in self.recent if column in run['values']]
+        if not samples:
+            return None
+
+        if self.columns[column] is BaselineCorrection.LEVEL:
+            return sum(value for value, _ in samples) / len(samples)
+        rate = sum(value / baseline_ns for value, baseline_ns in samples) / len(samples)
+        return rate * duration_ns
+
+    def correct(self, run: Dict, duration_ns: Optional[int]):
+        """Fill in the `_net` columns of a completed run, measured for `duration_ns`"""
+        for column in self.columns:
+            value = _value_of(run, column)
+            overhead = self.overhead(column, duration_ns) if value is not None and duration_ns else None
+            run[f"{column}{NET_SUFFIX}"] = value - overhead if overhead is not None else " "
+
+    def summary(self) -> Dict:
+        """The current overhead per column: per second of measurement (AMOUNT), or as is (LEVEL)"""
+        overhead = {}
+        for column, correction in self.columns.items():
+            value = self.overhead(column, 10 ** 9)
+            if value is not None:
+                overhead[column] = {'correction': correction.name, 'overhead': value,
+                                    'baseline_runs': sum(1 for run in self.recent if column in run['values'])}
+        return overhead
+
+    def write(self):
+        tmp = self.path.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'overhead': self.summary(), 'runs': self.runs}, f, indent=2)
+        os.replace(tmp, self.path)
@@ -0,0 +1,115 @@
+import glob
+import statistics
+import time
+from typing import Callable
+
+import psutil
+
+from ConfigValidator.Config.Models.CooldownModel import CooldownModel, CooldownSensor
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+RAPL_PACKAGE_GLOB = '/sys/class/powercap/intel-rapl:[0-9]*'
+
+
+def read_cpu_temperature() -> float:
+    temperatures = psutil.sensors_temperatures() if hasattr(psutil, 'sensors_temperatures') else {}
+
+    # Prefer the CPU specific drivers, fall back to whatever the kernel exposes
+    for driver in ['coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'cpu-thermal']:
+        if temperatures.get(driver):
+            return max(t.current for t in temperatures[driver])
+
+    readings = [t.current for sensor in temperatures.values() for t in sensor]
+    if not readings:
+        raise BaseError("No CPU temperature sensors are available on this system!")
+    return max(readings)
+
+
+def read_package_power(interval_in_ms: int) -> float:
+    packages = [p for p in glob.glob(RAPL_PACKAGE_GLOB) if ':' not in p.split('intel-rapl:')[-1]]
+    if not packages:
+        raise BaseError("No RAPL package energy counters are available on this system!")
+
+    def read_uj(path: str) -> int:
+        with open(f"{path}/energy_uj") as f:
+            return int(f.read())
+
+    def read_range_uj(path: str) -> int:
+        with open(f"{path}/max_energy_range_uj") as f:
+            return int(f.read())
+
+    try:
+        start = [read_uj(p) for p in packages]
+        start_t = time.perf_counter()
+        time.sleep(interval_in_ms / 1000)
+        end = [read_uj(p) for p in packages]
+        elapsed = time.perf_counter() - start_t
+
+        delta_uj = 0
+        for path, s, e in zip(packages, start, end):
+            delta_uj += e - s if e >= s else e + read_range_uj(path) - s  # counter wrapped around
+    except PermissionError:
+        raise BaseError("The RAPL energy counters are not readable (root privileges are required)!")
+
+    return delta_uj / 1e6 / elapsed
+
+
+###     =========================================================
+###     |                                                       |
+###     |                  CooldownController                   |
+###     |       - Record an idle baseline of a sensor           |
+###     |       - Wait after a run until the sensor returns     |
+###     |         to that baseline, within min/max bounds       |
+###     |                                                       |
+###     =========================================================
+class CooldownController:
+
+    def __init__(self, cooldown: CooldownModel):
+        self.cooldown = cooldown
+        self.baseline = None
+
+    def read(self) -> float:
+        if self.cooldown.sensor is CooldownSensor.CPU_TEMPERATURE:
+            return read_cpu_temperature()
+        if self.cooldown.sensor is CooldownSensor.PACKAGE_POWER:
+            return read_package_power(self.cooldown.poll_interval_in_ms)
+        return float(self.cooldown.read_sensor())
+
+    def __sleep_poll_interval(self):
+        # Power sampling already spends one poll interval while reading
+        if self.cooldown.sensor is not CooldownSensor.PACKAGE_POWER:
+            time.sleep(self.cooldown.poll_interval_in_ms / 1000)
+
+    def record_baseline(self) -> float:
+        samples = []
+        for i in range(self.cooldown.baseline_samples):
+            if i > 0:
+                self.__sleep_poll_interval()
+            samples.append(self.read())
+
+        self.baseline = statistics.median(samples)
+        return self.baseline
+
+    def is_cooled_down(self, reading: float) -> bool:
+        return reading <= self.baseline + abs(self.baseline) * self.cooldown.tolerance
+
+    def wait(self, log: Callable[[str], None] = None) -> int:
+        """Block until the machine is back at its idle baseline. Returns the actual waiting time in ms."""
+        if self.baseline is None:
+            self.record_baseline()
+
+        start = time.monotonic()
+        min_wait, max_wait = self.cooldown.min_wait_in_ms / 1000, self.cooldown.max_wait_in_ms / 1000
+
+        if min_wait > 0:
+            time.sleep(min_wait)
+
+        while time.monotonic() - start < max_wait:
+            reading = self.read()
+            if self.is_cooled_down(reading):
+                break
+            if log:
+                log(f"Cooling down: {self.cooldown.sensor.name} at {reading:.2f}, baseline {self.baseline:.2f}")
+            self.__sleep_poll_interval()
+
+        return round((time.monotonic() - start) * 1000)
@@ -1,14 +1,27 @@
+import functools
 import time
-import multiprocessing
+from time import perf_counter_ns
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from ConfigValidator.Config.Models.Metadata import Metadata
 from ConfigValidator.CustomErrors.BaseError import BaseError
-from ProgressManager.Output.JSONOutputManager import JSONOutputManager
 from ProgressManager.RunTable.Models.RunProgress import RunProgress
 from ConfigValidator.Config.Models.OperationType import OperationType
 from EventManager.Models.RunnerEvents import RunnerEvents
-from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+from ProgressManager.Output.OutputManagerFactory import create_data_manager, create_metadata_manager
 from ExperimentOrchestrator.Experiment.Run.RunController import RunController
+from ExperimentOrchestrator.Experiment.RunScheduler import RunScheduler
+from ExperimentOrchestrator.Experiment.CooldownController import CooldownController
+from ExperimentOrchestrator.Experiment.SequentialStopping import SequentialStoppingController
+from ExperimentOrchestrator.Experiment.StreamingAggregates import StreamingAggregatesController
+from ExperimentOrchestrator.Experiment.PhaseTimings import PhaseTimer, TimingSummary, read_timings
+from ExperimentOrchestrator.Experiment.BaselineController import BaselineController
+from ConfigValidator.Config.Models.MeasurementWindow import MeasurementWindow
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ExperimentOrchestrator.Architecture.WorkerPool import WorkerPool
+from ExperimentOrchestrator.Architecture.RunProcess import RunProcess, RunTimeoutError, KILL_GRACE_PERIOD_IN_MS
+from ExperimentOrchestrator.Distributed.LeaseDirectory import LeaseDirectory
+from ExperimentOrchestrator.Distributed.DistributedCoordinator import DistributedCoordinator, LeasedRun
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 from EventManager.EventSubscriptionController import EventSubscriptionController
@@ -21,6 +34,11 @@ from ConfigValidator.CustomErrors.ProgressErrors import AllRunsCompletedOnRestar
 ###     |       - Init and perform runs of correct type         |
 ###     |       - Perform experiment overhead                   |
 ###     |       - Perform run overhead (time_btwn_runs)         |
+###     |       - Retry failed and timed out runs               |
+###     |       - Measure the overhead of the profilers in      |
+###     |         idle baseline runs, and subtract it           |
+###     |       - Schedule runs (optionally in parallel)        |
+###     |       - Or lease them to worker nodes (distributed)   |
 ###     |       - Signal experiment end (ClientRunner)          |
 ###     |                                                       |
 ###     |       * Experiment config that should be used         |
@@ -33,10 +51,14 @@ class ExperimentController:
     def __init__(self, config: RunnerConfig, metadata: Metadata):
         self.config = config
         self.metadata = metadata
+        self.worker_pool = None
+        self.timings = TimingSummary()
+        self.run_timers: Dict[int, PhaseTimer] = {}  # phases of the runs in progress, in this process
 
-        self.csv_data_manager = CSVOutputManager(self.config.experiment_path)
-        self.json_data_manager = JSONOutputManager(self.config.experiment_path)
         run_tbl = self.config.create_run_table_model()
+        self.data_manager = create_data_manager(self.config)
+        self.runs_since_compaction = 0
+        self.metadata_manager = create_metadata_manager(self.config)
         
         # Add in the proper data column for energibridge
         if self.config.self_measure:
@@ -45,19 +67,55 @@ class ExperimentController:
 
             run_tbl._RunTableModel__data_columns.append("self-measure")
 
+        # Log the actual cooldown time preceding each run
+        self.cooldown_controller = None
+        self.last_cooldown_ms = 0
+        if self.config.cooldown:
+            if "__cooldown_ms" in run_tbl._RunTableModel__data_columns:
+                raise BaseError("Cannot use __cooldown_ms as data column name if a cooldown is configured")
+
+            run_tbl._RunTableModel__data_columns.append("__cooldown_ms")
+            self.cooldown_controller = CooldownController(self.config.cooldown)
+
+        # Log the attempts and the reason of the last failure of each run
+        self.track_attempts = self.config.run_timeout_in_ms > 0 or self.config.max_run_attempts > 1
+        self.failed_attempts: Dict[str, int] = {}  # run_id -> failed attempts during this invocation
+        if self.track_attempts:
+            for column in ["__attempts", "__error"]:
+                if column in run_tbl._RunTableModel__data_columns:
+                    raise BaseError(f"Cannot use {column} as data column name if a run timeout or retries are configured")
+
+                run_tbl._RunTableModel__data_columns.append(column)
+
+        # Subtract the overhead of the profilers, measured in idle baseline runs, in `<column>_net` columns
+        self.baseline_controller = None
+        if self.config.baseline:
+            self.baseline_controller = BaselineController(self.config.baseline, list(run_tbl.get_data_columns()),
+                                                          self.config.experiment_path)
+            for column in self.baseline_controller.net_columns:
+                if column in run_tbl._RunTableModel__data_columns:
+                    raise BaseError(f"Cannot use {column} as data column name if baselines are configured")
+
+                run_tbl._RunTableModel__data_columns.append(column)
+
         self.run_table = run_tbl.generate_experiment_run_table()
-        
+        # Completed runs are read back from the run table store when needed, instead of being kept in memory
+        self.run_table.completed_row_loader = self.data_manager.read_row
+        tracked_runs = self.run_table
+
         # Create experiment output folder, and in case that it exists, check if we can resume
         self.restarted = False
+        todo_run_found = True
         try:
             self.config.experiment_path.mkdir(parents=True, exist_ok=False)
         except FileExistsError:
             output.console_log_WARNING(f"Reusing already existing experiment path: {self.config.experiment_path}")
-            existing_run_table = self.csv_data_manager.read_run_table()
+            existing_run_table = self.data_manager.read_run_table()
 
             # First sanity check. If there is no "TODO" in the __done column, simply abort.
-            todo_run_found = any([current_run['__done'] != RunProgress.DONE for current_run in existing_run_table])
-            if not todo_run_found:
+            # (With a stopping rule, completed treatments may still need more runs, see below.)
+            todo_run_found = any(current_run['__done'] != RunProgress.DONE for current_run in existing_run_table)
+            if not todo_run_found and not run_tbl.get_stopping_rule():
                 raise BaseError("The experiment was restarted, but all runs have already been completed.")
 
             # The experiment has been restarted as there is >=1 "TODO" variations in the CSV file
@@ -71,7 +129,7 @@ class ExperimentController:
                                 "the experiment output path, do not define the same columns!"
                                 )
             # check md5sum
-            existing_metadata = self.json_data_manager.read_metadata()
+            existing_metadata = self.metadata_manager.read_metadata()
             if existing_metadata.md5sum != self.metadata.md5sum:  # check md5sum
                 cont = output.query_yes_no("md5sum mismatch! This can occur if the configuration code "
                                            "has changed since the last run. Continue anyway?", default=None)
@@ -79,77 +137,360 @@ class ExperimentController:
                     raise BaseError("Aborting due to md5sum mismatch.")
 
                 output.console_log_WARNING(f"Updating md5sum from {existing_metadata.md5sum.hex()} to {self.metadata.md5sum.hex()}")
-                self.json_data_manager.write_metadata(self.metadata)
+                self.metadata_manager.write_metadata(self.metadata)
 
             self.restarted = True
-            assert(len(existing_run_table) == len(self.run_table))
-
-            # Re-order the generated run table to match the already existing one
-            tmp_run_table = []
-            for existing_var in existing_run_table:
-                for generated_var in self.run_table:
-                    if existing_var['__run_id'] == generated_var['__run_id']:
-                        tmp_run_table.append(generated_var)
-                        break
-            self.run_table = tmp_run_table
-            for existing_var, generated_var in zip(existing_run_table, self.run_table):
-                assert(existing_var['__run_id'] == generated_var['__run_id'])
-
-            # Fill in the run_table.
-            # Note that the stored run_table has only a str() representation of the factor treatment levels.
-            # The generated one can have arbitrary python objects.
-            for existing_var, generated_var in zip(existing_run_table, self.run_table):
-                assert (existing_var['__run_id'] == generated_var['__run_id'])
-
-                for k in map(lambda factor: factor.factor_name,
-                             self.config.run_table_model.get_factors()):  # treatment levels remain the same
-                    assert (str(generated_var[k]) == str(existing_var[k]))
-
-                for k in set(self.config.run_table_model.get_data_columns()).union(
-                        ['__done']):  # update data columns and __done column
-                    generated_var[k] = existing_var[k]
+            tracked_runs = self.__resume_run_table(run_tbl, existing_run_table)
+            if self.baseline_controller:
+                self.baseline_controller.load()
 
             output.console_log_WARNING(">> WARNING << -- Experiment is restarted!")
         if not self.restarted:
-            self.csv_data_manager.write_run_table(self.run_table)
-            self.json_data_manager.write_metadata(self.metadata)
+            self.data_manager.write_run_table(self.run_table)
+            self.metadata_manager.write_metadata(self.metadata)
+
+        # Adaptive number of repetitions
+        self.stopping_controller = None
+        if run_tbl.get_stopping_rule():
+            self.stopping_controller = SequentialStoppingController(run_tbl)
+            # Treatments that were completed before a restart, without satisfying the rule, continue now
+            for new_run in self.stopping_controller.track(tracked_runs):
+                self.__schedule_repetition(new_run)
+                todo_run_found = True
+
+        if self.restarted and not todo_run_found:
+            raise BaseError("The experiment was restarted, but all runs have already been completed.")
+
+        # Live per-treatment aggregates of the results, in summary.json
+        self.aggregates_controller = StreamingAggregatesController(run_tbl, self.config.experiment_path)
+        if self.restarted:
+            self.aggregates_controller.track(tracked_runs)
 
         output.console_log_WARNING("Experiment run table created...")
 
+    def __resume_run_table(self, run_tbl: RunTableModel, existing_run_table: List[Dict]) -> List[Dict]:
+        """Order the generated run table like the stored one, and fill in the stored progress and data.
+        Runs are matched by their run_id in constant time, so resuming takes linear time. Returns the resumed
+        rows, including the data of the completed runs (which the run table itself does not keep)."""
+        run_table = self.run_table
+        factor_names = [factor.factor_name for factor in run_tbl.get_factors()]
+        data_columns = run_tbl.get_data_columns()
+        verified_treatments = set()
+
+        order, resumed_runs = [], []
+        for existing_var in existing_run_table:
+            run_number = run_table.run_number_of(existing_var['__run_id'])
+
+            # With a stopping rule, the stored run table may have grown beyond the generated (minimal) one
+            if run_number is None and run_tbl.get_stopping_rule():
+                treatment, repetition = RunTableModel.split_run_id(existing_var['__run_id'])
+                template = run_table.run_number_of(f'{treatment}_repetition_0')
+                if template is not None:
+                    run_table.append(run_tbl.generate_repetition(run_table.run(template), repetition))
+                    run_number = len(run_table) - 1
+
+            if run_number is None:
+                raise BaseError(f"The stored run {existing_var['__run_id']} is not defined by the config file!")
+            generated_var = run_table.run(run_number)
+
+            # Note that the stored run_table has only a str() representation of the factor treatment levels.
+            # The generated one can have arbitrary python objects. All repetitions of a treatment share the same
+            # levels, so checking one of them suffices.
+            treatment, _ = RunTableModel.split_run_id(existing_var['__run_id'])
+            if treatment not in verified_treatments:
+                if any(str(generated_var[k]) != str(existing_var[k]) for k in factor_names):
+                    raise BaseError(f"The treatment levels of {treatment} in the stored run table do not match the "
+                                    f"ones generated from the config file!")
+                verified_treatments.add(treatment)
+
+            # Runs that were not started yet are simply generated again
+            if existing_var['__done'] != RunProgress.TODO or \
+                    any(existing_var[k] not in (" ", "", None) for k in data_columns):
+                generated_var['__done'] = existing_var['__done']
+                for k in data_columns:
+                    generated_var[k] = existing_var[k]
+                run_table.store(run_number, generated_var)
+
+            order.append(run_number)
+            resumed_runs.append(generated_var)
+
+        if len(order) != len(run_table):
+            raise BaseError("The generated run table from the config file, and the found run table in the CSV in "
+                            "the experiment output path, do not define the same number of runs!")
+        run_table.reorder(order)
+        return resumed_runs
+
+    def __pending_runs(self) -> Iterator[Tuple[int, Dict]]:
+        return self.run_table.pending()
+
     def do_experiment(self):
         output.console_log_OK("Experiment setup completed...")
 
+        if self.config.distributed_lease_dir:
+            self.__do_distributed_experiment()
+            return
+
+        # -- Idle baseline (before any config hook can put load on the system)
+        if self.cooldown_controller:
+            baseline = self.cooldown_controller.record_baseline()
+            output.console_log_WARNING(f"Recorded idle {self.config.cooldown.sensor.name} baseline: {baseline:.2f}")
+
         # -- Before experiment
         # TODO: From a user perspective, it would be nice to know if this is a restarted experiment or not (in case something failed)
         output.console_log_WARNING("Calling before_experiment config hook")
-        EventSubscriptionController.raise_event(RunnerEvents.BEFORE_EXPERIMENT)
+        with self.timings.experiment.phase('BEFORE_EXPERIMENT', RunnerEvents.BEFORE_EXPERIMENT):
+            EventSubscriptionController.raise_event(RunnerEvents.BEFORE_EXPERIMENT)
 
         # -- Experiment
-        for current_run in self.run_table:
-            if current_run['__done'] == RunProgress.DONE:
-                continue
+        pending_runs = self.__pending_runs()
 
-            output.console_log_WARNING("Calling before_run config hook")
-            EventSubscriptionController.raise_event(RunnerEvents.BEFORE_RUN)
+        if self.config.max_parallel_runs > 1:
+            output.console_log_WARNING(f"Running up to {self.config.max_parallel_runs} runs in parallel")
 
-            run_controller = RunController(current_run, self.config, (self.run_table.index(current_run) + 1), len(self.run_table))
-            perform_run = multiprocessing.Process(
-                target=run_controller.do_run,
-                args=[]
-            )
-            perform_run.start()
-            perform_run.join()
+        # Parallel runs wait the time between runs per slot, so a finished run does not hold back the others
+        scheduler = RunScheduler(self.config.max_parallel_runs, self.config.get_run_resources,
+                                 self.config.run_timeout_in_ms, KILL_GRACE_PERIOD_IN_MS,
+                                 self.config.time_between_runs_in_ms if self.config.max_parallel_runs > 1 else 0)
 
-            time_btwn_runs = self.config.time_between_runs_in_ms
-            if time_btwn_runs > 0:
-                output.console_log_bold(f"Run fully ended, waiting for: {time_btwn_runs}ms == {time_btwn_runs / 1000}s")
-                time.sleep(time_btwn_runs / 1000)
+        if self.config.use_worker_pool:
+            # Workers are forked after before_experiment, so they see any state it has set up
+            self.worker_pool = WorkerPool(self.__execute_run_task, self.config.worker_recycle_after_runs)
+            for cpu_set in scheduler.cpu_sets:
+                self.worker_pool.start_worker(cpu_set)
 
-            if self.config.operation_type is OperationType.SEMI:
-                EventSubscriptionController.raise_event(RunnerEvents.CONTINUE)
+        try:
+            with self.timings.experiment.phase('runs'):
+                scheduler.run(pending_runs, self.__start_run, self.__finish_run)
+        finally:
+            if self.worker_pool:
+                self.worker_pool.shutdown()
 
+        with self.timings.experiment.phase('compact'):
+            self.data_manager.compact()
+        self.aggregates_controller.write_summary(force=True)
         output.console_log_OK("Experiment completed...")
 
         # -- After experiment
         output.console_log_WARNING("Calling after_experiment config hook")
-        EventSubscriptionController.raise_event(RunnerEvents.AFTER_EXPERIMENT)
+        with self.timings.experiment.phase('AFTER_EXPERIMENT', RunnerEvents.AFTER_EXPERIMENT):
+            EventSubscriptionController.raise_event(RunnerEvents.AFTER_EXPERIMENT)
+        self.__write_timings()
+
+    def __write_timings(self):
+        self.timings.write(self.config.experiment_path)
+        if self.timings.run_phases:
+            output.console_log_bold(f"Duration of the phases of the runs:\n{self.timings.table()}")
+
+    def __add_run_timings(self, current_run: Dict, timer: Optional[PhaseTimer] = None):
+        """Add the phases of a finished run, as timed by the run itself (in its `timings.json`) and by this process"""
+        stored = read_timings(self.config.experiment_path / current_run['__run_id'])
+        phases = stored['phases_ns'] if stored else {}
+        if timer is not None:
+            phases = {**phases, **timer.phases}
+        self.timings.add_run(phases)
+
+    def __do_distributed_experiment(self):
+        # All config hooks are executed by the worker nodes, this process only maintains the run table.
+        # Leases are read by other processes (and hosts), which do not share the layout of RunRows.
+        pending_runs = [(run_nr, dict(run)) for run_nr, run in self.__pending_runs()]
+
+        lease_dir = LeaseDirectory(self.config.distributed_lease_dir)
+        output.console_log_WARNING(f"Leasing {len(pending_runs)} runs to the workers of {lease_dir.path}")
+        output.console_log_WARNING(f"Start workers with: python experiment-runner/ worker <config.py> [worker_id]")
+
+        coordinator = DistributedCoordinator(lease_dir, self.config.lease_timeout_in_ms)
+        with self.timings.experiment.phase('runs'):
+            coordinator.run(pending_runs, lambda: len(self.run_table), self.__process_leased_run,
+                            self.__count_attempt)
+
+        with self.timings.experiment.phase('compact'):
+            self.data_manager.compact()
+        self.aggregates_controller.write_summary(force=True)
+        output.console_log_OK("Experiment completed...")
+        self.__write_timings()
+
+    def __process_leased_run(self, run_nr: int, current_run: Dict, handle: LeasedRun) -> List[Tuple[int, Dict]]:
+        timer = PhaseTimer()
+        with timer.phase('process_result'):
+            new_runs = self.__process_run_result(run_nr, current_run, handle)
+
+        # Workers do not write the run table, so the (shared) results stay consistent
+        if current_run['__done'] == RunProgress.DONE:
+            with timer.phase('update_row_data'):
+                self.data_manager.update_row_data(dict(current_run))
+        with timer.phase('compaction'):
+            self.__compact_run_table_periodically()
+        self.__add_run_timings(current_run, timer)
+        return new_runs
+
+    def __compact_run_table_periodically(self):
+        # Runs are persisted to the journal of the run table, keep the CSV itself reasonably up to date
+        self.runs_since_compaction += 1
+        interval = self.config.run_table_compaction_interval
+        if interval and self.runs_since_compaction >= interval:
+            self.data_manager.compact()
+            self.runs_since_compaction = 0
+
+    def __count_attempt(self, current_run: Dict):
+        if self.track_attempts:
+            previous = current_run['__attempts']
+            current_run['__attempts'] = (previous if isinstance(previous, int) else 0) + 1
+
+    def __run_baseline(self, next_run: Dict):
+        """Execute an idle baseline run (in its own process, like any run) with the factor levels of the next run,
+        and add it to the overhead model"""
+        factor_names = [factor.factor_name for factor in self.config.run_table_model.get_factors()]
+        baseline_run = self.baseline_controller.create_run({name: next_run[name] for name in factor_names})
+        run_controller = RunController(baseline_run, self.config, 0, len(self.run_table), is_baseline=True)
+        handle = RunProcess(functools.partial(run_controller.do_run, False))
+        handle.wait(self.config.run_timeout_in_ms)
+
+        completed = self.__completed_run_data(handle)
+        if not completed:
+            output.console_log_FAIL(f"Baseline run {baseline_run['__run_id']} failed: {self.__failure_reason(handle)}")
+
+        window = MeasurementWindow.read(run_controller.run_dir)
+        self.baseline_controller.add_result(baseline_run['__run_id'], completed,
+                                            window.duration_ns if window and window.stopped else None)
+        for column, overhead in self.baseline_controller.summary().items():
+            unit = "/s" if overhead['correction'] == 'AMOUNT' else ""
+            output.console_log_OK(f"Overhead of {column}: {overhead['overhead']:.4g}{unit} "
+                                  f"({overhead['baseline_runs']} baseline runs)")
+
+    def __start_run(self, run_nr: int, current_run: Dict, cpu_set: Optional[Set[int]]):
+        # Baseline runs are executed between runs, when nothing else is running (see the ConfigValidator)
+        while self.baseline_controller and self.baseline_controller.is_due():
+            self.__run_baseline(current_run)
+
+        timer = self.run_timers[run_nr] = PhaseTimer()
+        output.console_log_WARNING("Calling before_run config hook")
+        with timer.phase('BEFORE_RUN', RunnerEvents.BEFORE_RUN):
+            EventSubscriptionController.raise_event(RunnerEvents.BEFORE_RUN)
+
+        if self.cooldown_controller:
+            current_run['__cooldown_ms'] = self.last_cooldown_ms
+        self.__count_attempt(current_run)
+
+        # The time until the run starts in its own process is timed by the run ('startup')
+        with timer.phase('dispatch'):
+            dispatched_at = perf_counter_ns()
+            if self.worker_pool:
+                return self.worker_pool.submit((run_nr, current_run, dispatched_at), cpu_set)
+
+            run_controller = RunController(current_run, self.config, run_nr, len(self.run_table), dispatched_at)
+            return RunProcess(run_controller.do_run, cpu_set)
+
+    def __execute_run_task(self, task: Tuple[int, Dict, int]) -> Dict:
+        # Executed inside a (persistent) worker of the worker pool
+        run_nr, current_run, dispatched_at = task
+        return RunController(current_run, self.config, run_nr, len(self.run_table), dispatched_at).run()
+
+    @staticmethod
+    def __completed_run_data(handle) -> Optional[Dict]:
+        """The row of a finished run, as returned by the run process (None if it did not complete)"""
+        if not handle.result:
+            return None
+
+        completed = dict(handle.result)
+        if isinstance(completed['__done'], str):
+            completed['__done'] = RunProgress[completed['__done']]
+        return completed if completed['__done'] == RunProgress.DONE else None
+
+    def __finish_run(self, run_nr: int, current_run: Dict, handle) -> List[Tuple[int, Dict]]:
+        timer = self.run_timers.pop(run_nr, None) or PhaseTimer()
+        with timer.phase('process_result'):
+            new_runs = self.__process_run_result(run_nr, current_run, handle)
+        with timer.phase('compaction'):
+            self.__compact_run_table_periodically()
+        if self.baseline_controller:
+            self.baseline_controller.run_finished()
+        if self.config.max_parallel_runs == 1:
+            with timer.phase('cooldown'):
+                self.last_cooldown_ms = pause_between_runs(self.config, self.cooldown_controller)
+
+        if self.config.operation_type is OperationType.SEMI:
+            with timer.phase('CONTINUE', RunnerEvents.CONTINUE):
+                EventSubscriptionController.raise_event(RunnerEvents.CONTINUE)
+
+        self.__add_run_timings(current_run, timer)
+        return new_runs
+
+    def __failure_reason(self, handle) -> str:
+        if getattr(handle, 'terminated', False):
+            return f"{RunTimeoutError.__name__}: exceeded the run timeout of {self.config.run_timeout_in_ms}ms"
+        if handle.error:
+            ex_name, ex_value, tb_str = handle.error
+            output.console_log_FAIL(f"{ex_name}: {ex_value}\n{tb_str}")
+            return f"{ex_name}: {ex_value.splitlines()[0] if ex_value else ''}"
+        return "The run did not complete"
+
+    def __process_failed_run(self, run_nr: int, current_run: Dict, handle) -> List[Tuple[int, Dict]]:
+        run_id = current_run['__run_id']
+        reason = self.__failure_reason(handle)
+        failed_attempts = self.failed_attempts[run_id] = self.failed_attempts.get(run_id, 0) + 1
+        output.console_log_FAIL(f"Run {run_id} failed (attempt {failed_attempts}/{self.config.max_run_attempts}): "
+                                f"{reason}")
+
+        retry = failed_attempts < self.config.max_run_attempts
+        current_run['__done'] = RunProgress.TODO if retry else RunProgress.FAILED
+        if self.track_attempts:
+            current_run['__error'] = reason
+        self.data_manager.update_row_data(dict(current_run))
+        self.run_table[run_nr - 1] = current_run
+
+        if retry:
+            output.console_log_WARNING(f"Retrying run {run_id} at the end of the queue")
+            return [(run_nr, current_run)]
+
+        # A treatment with a failed run may still need more repetitions to reach the stopping rule
+        if self.stopping_controller:
+            new_run = self.stopping_controller.add_result(current_run)
+            if new_run:
+                return [self.__schedule_repetition(new_run)]
+        return []
+
+    def __process_run_result(self, run_nr: int, current_run: Dict, handle) -> List[Tuple[int, Dict]]:
+        completed = self.__completed_run_data(handle)
+        if not completed:
+            return self.__process_failed_run(run_nr, current_run, handle)
+
+        for k in set(self.config.run_table_model.get_data_columns()).union(['__done']):
+            current_run[k] = completed.get(k, current_run[k])
+
+        if self.baseline_controller:
+            window = MeasurementWindow.read(self.config.experiment_path / current_run['__run_id'])
+            self.baseline_controller.correct(current_run, window.duration_ns if window and window.stopped else None)
+            self.data_manager.update_row_data(dict(current_run))
+        self.run_table[run_nr - 1] = current_run
+
+        self.aggregates_controller.add_result(current_run)
+        self.aggregates_controller.write_summary()
+
+        if self.stopping_controller:
+            new_run = self.stopping_controller.add_result(completed)
+            if new_run:
+                return [self.__schedule_repetition(new_run)]
+        return []
+
+    def __schedule_repetition(self, new_run: Dict) -> Tuple[int, Dict]:
+        """Add a repetition required by the stopping rule to the run table, returns its (run_nr, run)"""
+        output.console_log_WARNING(f"Confidence interval not yet reached, scheduling {new_run['__run_id']}")
+        self.run_table.append(new_run)
+        self.data_manager.append_rows([new_run])
+        return len(self.run_table), new_run
+
+
+def pause_between_runs(config: RunnerConfig, cooldown_controller: Optional[CooldownController]) -> int:
+    """Wait the configured cooldown or fixed time between runs. Returns the cooldown time in ms (0 if fixed)."""
+    time_btwn_runs = config.time_between_runs_in_ms
+    if cooldown_controller:
+        output.console_log_bold("Run fully ended, waiting for the system to cool down")
+        cooldown_ms = cooldown_controller.wait(output.console_log)
+        output.console_log_bold(f"Cooled down after: {cooldown_ms}ms")
+        return cooldown_ms
+
+    if time_btwn_runs > 0:
+        output.console_log_bold(f"Run fully ended, waiting for: {time_btwn_runs}ms == {time_btwn_runs / 1000}s")
+        time.sleep(time_btwn_runs / 1000)
+    return 0
+
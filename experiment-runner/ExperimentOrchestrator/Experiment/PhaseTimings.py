@@ -0,0 +1,81 @@
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, Optional
+
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+from ExperimentOrchestrator.Experiment.StreamingAggregates import ColumnAggregate
+
+TIMINGS_FILE = 'timings.json'
+
+
+class PhaseTimer:
+    """The durations (in ns, by `perf_counter_ns`) of the phases of a run or experiment, and of the subscribers of
+    the events raised in them. `perf_counter_ns` is monotonic and shared by all processes of a host, so timestamps
+    taken in one process (e.g. when a run is dispatched) can be compared in another."""
+
+    def __init__(self):
+        self.phases: Dict[str, int] = {}
+        self.subscribers: Dict[str, Dict[str, int]] = {}
+
+    def add(self, name: str, duration_ns: int):
+        self.phases[name] = self.phases.get(name, 0) + duration_ns
+
+    @contextmanager
+    def phase(self, name: str, event: Optional[RunnerEvents] = None):
+        started = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter_ns() - started)
+            if event is not None:
+                self.subscribers[name] = EventSubscriptionController.get_timings(event)
+
+    def to_dict(self) -> Dict:
+        return {'phases_ns': self.phases, 'subscribers_ns': self.subscribers}
+
+    def write(self, directory: Path):
+        with open(directory / TIMINGS_FILE, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def read_timings(directory: Path) -> Optional[Dict]:
+    try:
+        with open(directory / TIMINGS_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class TimingSummary:
+    """The count, mean, spread and quantiles (in ms) of the duration of every phase over all runs, in constant
+    memory, plus the phases of the experiment itself"""
+
+    def __init__(self):
+        self.experiment = PhaseTimer()
+        self.run_phases: Dict[str, ColumnAggregate] = {}
+
+    def add_run(self, phases_ns: Dict[str, int]):
+        for name, duration_ns in phases_ns.items():
+            self.run_phases.setdefault(name, ColumnAggregate()).add(duration_ns / 1e6)
+
+    def to_dict(self) -> Dict:
+        return {'experiment_ns': self.experiment.phases,
+                'experiment_subscribers_ns': self.experiment.subscribers,
+                'run_phases_ms': {name: aggregate.to_dict() for name, aggregate in self.run_phases.items()}}
+
+    def write(self, directory: Path):
+        with open(directory / TIMINGS_FILE, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def table(self) -> str:
+        """A table of the mean, 90th percentile and total duration of every run phase"""
+        rows = [(name, aggregate.to_dict()) for name, aggregate in self.run_phases.items()]
+        width = max([len(name) for name, _ in rows] + [5])
+        lines = [f"{'phase':<{width}}  {'runs':>6}  {'mean ms':>10}  {'p90 ms':>10}  {'total s':>10}"]
+        for name, stats in rows:
+            lines.append(f"{name:<{width}}  {stats['count']:>6}  {stats['mean']:>10.2f}  {stats['p90']:>10.2f}  "
+                         f"{stats['mean'] * stats['count'] / 1000:>10.2f}")
+        return '\n'.join(lines)
@@ -1,12 +1,14 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+from ProgressManager.Output.BaseOutputManager import BaseOutputManager
+from ProgressManager.Output.OutputManagerFactory import create_data_manager
 from pathlib import Path
 from abc import ABC, abstractmethod
 from multiprocessing import Event
 
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
 from ConfigValidator.Config.Models.RunnerContext import RunnerContext
+from ExperimentOrchestrator.Experiment.PhaseTimings import PhaseTimer
 
 class IRunController(ABC):
     run_dir: Path = None
@@ -14,21 +16,31 @@ class IRunController(ABC):
     variation: Dict = None
     config: RunnerConfig = None
     run_context: RunnerContext = None
-    data_manager: CSVOutputManager = None
+    data_manager: BaseOutputManager = None
+    timer: PhaseTimer = None
 
-    def __init__(self, variation: Dict, config: RunnerConfig, current_run: int, total_runs: int):
+    def __init__(self, variation: Dict, config: RunnerConfig, current_run: int, total_runs: int,
+                 dispatched_at_ns: Optional[int] = None, is_baseline: bool = False):
+        """`dispatched_at_ns` is the `perf_counter_ns` at which the experiment started the run, so the time it takes
+        to start the run process is part of its timings. A baseline run is idle while it is measured."""
         self.run_dir = config.experiment_path / variation['__run_id']
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
         self.variation = variation
         self.config = config
         self.current_run = current_run
-        self.run_context = RunnerContext(self.variation, self.current_run, self.run_dir)
-        self.data_manager = CSVOutputManager(self.config.experiment_path)
+        self.is_baseline = is_baseline
+        self.run_context = RunnerContext(self.variation, self.current_run, self.run_dir, is_baseline)
+        self.data_manager = create_data_manager(self.config)
+        self.dispatched_at_ns = dispatched_at_ns
+        self.timer = PhaseTimer()
 
         self.run_completed_event = Event()
 
-        print(f"\n-----------------NEW RUN [{current_run} / {total_runs}]-----------------\n")
+        if is_baseline:
+            print(f"\n-----------------BASELINE RUN [{variation['__run_id']}]-----------------\n")
+        else:
+            print(f"\n-----------------NEW RUN [{current_run} / {total_runs}]-----------------\n")
 
     @abstractmethod
     def do_run(self):
@@ -1,13 +1,40 @@
+import asyncio
 import subprocess
+import threading
+import signal
+import sys
 import os
+import time
+from time import perf_counter_ns
+from typing import Dict
 
 from ProgressManager.RunTable.Models.RunProgress import RunProgress
 from EventManager.Models.RunnerEvents import RunnerEvents
 from EventManager.EventSubscriptionController import EventSubscriptionController
 from ExperimentOrchestrator.Architecture.Processify import processify
+from ExperimentOrchestrator.Architecture.RunProcess import RunTerminatedError
 from ExperimentOrchestrator.Experiment.Run.IRunController import IRunController
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 
+RUN_EVENTS = [RunnerEvents.START_RUN, RunnerEvents.START_MEASUREMENT, RunnerEvents.INTERACT,
+              RunnerEvents.STOP_MEASUREMENT, RunnerEvents.STOP_RUN, RunnerEvents.POPULATE_RUN_DATA]
+
+
+async def _raise_event_sync(event: RunnerEvents, runner_context=None):
+    return EventSubscriptionController.raise_event(event, runner_context)
+
+
+def _complete_without_event_loop(coroutine):
+    """Run a coroutine that never suspends (all awaited callbacks are synchronous) to completion"""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+
+    coroutine.close()
+    raise RuntimeError("The run lifecycle unexpectedly suspended outside of an event loop")
+
+
 class RunController(IRunController):
     # Start EnergiBridge measurements
     def start_eb(self):
@@ -51,37 +78,111 @@ class RunController(IRunController):
             output.console_log_FAIL(f"Failed to stop EnergiBridge:\n{e}")
 
     @processify
-    def do_run(self):
+    def do_run(self, persist: bool = True):
+        return self.run(persist)
+
+    def run(self, persist: bool = True) -> Dict:
+        """Perform the whole run lifecycle in the current process, and return the updated run data.
+        Unless `persist` is False (the caller stores the data), the run table is updated as well."""
+        def on_terminate(signum, frame):
+            raise RunTerminatedError(f"Run {self.variation['__run_id']} was terminated by the watchdog")
+
+        if threading.current_thread() is not threading.main_thread():
+            return self.__run_lifecycle(persist)  # Signal handlers can only be installed by the main thread
+
+        # Installed before anything is started, so started processes do not inherit an ignored SIGTERM
+        previous_handler = signal.signal(signal.SIGTERM, on_terminate)
+        try:
+            return self.__run_lifecycle(persist)
+        except RunTerminatedError:
+            output.console_log_FAIL("Run terminated, stopping all measurements")
+            # DataSources can only have been started if a config imported the plugins
+            data_source_module = sys.modules.get('Plugins.Profilers.DataSource')
+            if data_source_module:
+                data_source_module.DataSource.stop_active_sources()
+            if getattr(self, 'eb_proc', None):
+                self.stop_eb()
+            raise
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    def __run_lifecycle(self, persist: bool) -> Dict:
+        if any(EventSubscriptionController.is_async_event(event) for event in RUN_EVENTS):
+            # One event loop for the whole run, so tasks started by a hook (e.g. the target, or DataSources
+            # started concurrently) keep running while the next hooks execute
+            return asyncio.run(self.__run_lifecycle_async(persist, EventSubscriptionController.raise_event_async))
+
+        # Without async hooks, no event loop is running, so hooks can still use asyncio.run() themselves
+        return _complete_without_event_loop(self.__run_lifecycle_async(persist, _raise_event_sync))
+
+    async def __run_lifecycle_async(self, persist: bool, raise_event) -> Dict:
+        started = perf_counter_ns()
+        if self.dispatched_at_ns is not None:
+            self.timer.add('startup', started - self.dispatched_at_ns)
+        try:
+            return await self.__run_phases_async(persist, raise_event)
+        finally:
+            self.timer.add('run', perf_counter_ns() - started)
+            self.timer.write(self.run_dir)
+
+    async def __idle(self, raise_event):
+        duration = self.config.baseline.duration_in_ms / 1000
+        if raise_event is _raise_event_sync:
+            time.sleep(duration)  # no event loop is running
+        else:
+            await asyncio.sleep(duration)
+
+    async def __run_phases_async(self, persist: bool, raise_event) -> Dict:
+        timer = self.timer
+
         # Start EnergiBridge
-        self.start_eb()
+        with timer.phase('start_eb'):
+            self.start_eb()
 
-        # -- Start run
-        output.console_log_WARNING("Calling start_run config hook")
-        EventSubscriptionController.raise_event(RunnerEvents.START_RUN, self.run_context)
+        # -- Start run (a baseline run does not start the target)
+        if not self.is_baseline:
+            output.console_log_WARNING("Calling start_run config hook")
+            with timer.phase('START_RUN', RunnerEvents.START_RUN):
+                await raise_event(RunnerEvents.START_RUN, self.run_context)
 
         # -- Start measurement
         output.console_log_WARNING("... Starting measurement ...")
-        EventSubscriptionController.raise_event(RunnerEvents.START_MEASUREMENT, self.run_context)
-
-        # -- Start interaction
-        output.console_log_WARNING("Calling interaction config hook")
-        EventSubscriptionController.raise_event(RunnerEvents.INTERACT, self.run_context)
+        with timer.phase('START_MEASUREMENT', RunnerEvents.START_MEASUREMENT):
+            await raise_event(RunnerEvents.START_MEASUREMENT, self.run_context)
+        self.run_context.measurement_window.mark_start()
+
+        # -- Start interaction (or measure the idle system, in a baseline run)
+        if self.is_baseline:
+            output.console_log_WARNING(f"Idling for {self.config.baseline.duration_in_ms}ms")
+            with timer.phase('IDLE'):
+                await self.__idle(raise_event)
+        else:
+            output.console_log_WARNING("Calling interaction config hook")
+            with timer.phase('INTERACT', RunnerEvents.INTERACT):
+                await raise_event(RunnerEvents.INTERACT, self.run_context)
         output.console_log_OK("... Run completed ...")
 
         # -- Stop measurement
         output.console_log_WARNING("... Stopping measurement ...")
-        EventSubscriptionController.raise_event(RunnerEvents.STOP_MEASUREMENT, self.run_context)
+        self.run_context.measurement_window.mark_stop()
+        self.run_context.measurement_window.write(self.run_dir)
+        with timer.phase('STOP_MEASUREMENT', RunnerEvents.STOP_MEASUREMENT):
+            await raise_event(RunnerEvents.STOP_MEASUREMENT, self.run_context)
 
         # -- Stop run
-        output.console_log_WARNING("Calling stop_run config hook")
-        EventSubscriptionController.raise_event(RunnerEvents.STOP_RUN, self.run_context)
+        if not self.is_baseline:
+            output.console_log_WARNING("Calling stop_run config hook")
+            with timer.phase('STOP_RUN', RunnerEvents.STOP_RUN):
+                await raise_event(RunnerEvents.STOP_RUN, self.run_context)
 
         # -- Collect data from measurements
         output.console_log_WARNING("Calling populate_run_data config hook")
-        user_run_data = EventSubscriptionController.raise_event(RunnerEvents.POPULATE_RUN_DATA, self.run_context)
+        with timer.phase('POPULATE_RUN_DATA', RunnerEvents.POPULATE_RUN_DATA):
+            user_run_data = await raise_event(RunnerEvents.POPULATE_RUN_DATA, self.run_context)
         
         # Stop EnergiBridge
-        self.stop_eb()
+        with timer.phase('stop_eb'):
+            self.stop_eb()
 
         if user_run_data:
             # TODO: check if data columns exist and if yes, if they match
@@ -91,4 +192,7 @@ class RunController(IRunController):
             updated_run_data = self.run_context.execute_run
 
         updated_run_data['__done'] = RunProgress.DONE
-        self.data_manager.update_row_data(updated_run_data)
+        if persist:
+            with timer.phase('update_row_data'):
+                self.data_manager.update_row_data(updated_run_data)
+        return updated_run_data
@@ -0,0 +1,184 @@
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def partition_cpus(nr_of_sets: int) -> List[Set[int]]:
+    """Split the CPUs this process may run on into `nr_of_sets` disjoint, equally sized cpusets.
+    Left-over CPUs (when the CPU count is not divisible by `nr_of_sets`) are left idle for the runner itself."""
+    available = sorted(os.sched_getaffinity(0))
+    set_size = len(available) // nr_of_sets
+    if set_size < 1:
+        raise ValueError(f"Cannot create {nr_of_sets} disjoint cpusets from {len(available)} available CPUs")
+
+    return [set(available[i * set_size:(i + 1) * set_size]) for i in range(nr_of_sets)]
+
+
+###     =========================================================
+###     |                                                       |
+###     |                      RunScheduler                     |
+###     |       - Keep up to `max_parallel_runs` runs active    |
+###     |       - Give every active run its own cpuset          |
+###     |       - Serialize runs that share a resource          |
+###     |         (e.g. a measurement device)                   |
+###     |       - Terminate runs exceeding the run timeout      |
+###     |       - Reuse the slot of a finished run only after   |
+###     |         the time between runs, without delaying the   |
+###     |         runs in other slots                           |
+###     |                                                       |
+###     |       * With max_parallel_runs == 1 the behaviour     |
+###     |         is identical to a plain sequential loop       |
+###     |                                                       |
+###     =========================================================
+class RunScheduler:
+
+    def __init__(self,
+                 max_parallel_runs: int = 1,
+                 get_run_resources: Optional[Callable[[Dict], List[str]]] = None,
+                 run_timeout_in_ms: int = 0,
+                 kill_grace_period_in_ms: int = 5000,
+                 time_between_runs_in_ms: int = 0):
+        self.max_parallel_runs = max_parallel_runs
+        self.get_run_resources = get_run_resources
+        self.run_timeout_in_ms = run_timeout_in_ms
+        self.kill_grace_period_in_ms = kill_grace_period_in_ms
+        self.time_between_runs_in_ms = time_between_runs_in_ms
+
+        # Pinning only makes sense if runs can actually interfere with each other
+        if max_parallel_runs > 1:
+            self.cpu_sets = partition_cpus(max_parallel_runs)
+        else:
+            self.cpu_sets = [None]
+
+    def __resources_of(self, run: Dict) -> Set[str]:
+        if self.get_run_resources is None:
+            return set()
+        return set(self.get_run_resources(run) or [])
+
+    def run(self,
+            pending: Iterable[Tuple[int, Dict]],
+            start_run: Callable[[int, Dict, Optional[Set[int]]], object],
+            on_run_finished: Callable[[int, Dict, object], Optional[List[Tuple[int, Dict]]]]):
+        """Execute all `pending` (run_nr, run) pairs. They are consumed as slots become free, so `pending` can be
+        a generator (e.g. of a lazy run table).
+        `start_run` must start the run asynchronously and return a handle exposing a `sentinel` and a `join()`
+        (e.g. a started `multiprocessing.Process`). `on_run_finished` is called with the joined handle, in the
+        scheduler's process, after a run's handle has been joined. It may return new (run_nr, run) pairs,
+        which are appended to the pending runs (e.g. extra repetitions or retries).
+        With a run timeout, handles must also provide `terminate()` (graceful, the run may clean up) and `kill()`.
+        Runs that do not finish within the grace period after being terminated are killed."""
+        queue = _RunQueue(pending)
+        active = {}  # sentinel -> (handle, slot, run_nr, run, resources)
+
+        try:
+            self.__run(queue, active, start_run, on_run_finished)
+        except BaseException:
+            # Do not leave runs behind when the experiment is interrupted (e.g. Ctrl+C)
+            for handle, *_ in active.values():
+                if hasattr(handle, 'kill'):
+                    handle.kill()
+            raise
+
+    def __run(self, queue: '_RunQueue', active: Dict, start_run: Callable, on_run_finished: Callable):
+        free_slots = list(range(len(self.cpu_sets)))
+        slot_ready_at = {}  # slot -> monotonic time from which its next run may start
+        held_resources: Set[str] = set()
+        deadlines = {}  # sentinel -> (monotonic deadline, action to take when it passes)
+
+        while queue or active:
+            # Fill free (and ready) slots with the first queued runs whose resources are not in use
+            now = time.monotonic()
+            ready_slots = [slot for slot in free_slots if slot_ready_at.get(slot, now) <= now]
+            while ready_slots and queue:
+                startable = queue.take_first(lambda queued: not (self.__resources_of(queued[1]) & held_resources))
+                if startable is None:
+                    break  # every queued run waits on a resource held by an active run
+
+                run_nr, run = startable
+                resources = self.__resources_of(run)
+                slot = ready_slots.pop(0)
+                free_slots.remove(slot)
+                held_resources |= resources
+
+                handle = start_run(run_nr, run, self.cpu_sets[slot])
+                active[handle.sentinel] = (handle, slot, run_nr, run, resources)
+                if self.run_timeout_in_ms:
+                    deadlines[handle.sentinel] = (time.monotonic() + self.run_timeout_in_ms / 1000, 'terminate')
+
+            wake_ups = [deadline for deadline, _ in deadlines.values()]
+            if queue:
+                wake_ups += [slot_ready_at[slot] for slot in free_slots if slot_ready_at.get(slot, now) > now]
+            timeout = max(0, min(wake_ups) - time.monotonic()) if wake_ups else None
+            if not active:
+                time.sleep(timeout)  # every free slot waits for the time between runs
+                continue
+            finished = wait(list(active.keys()), timeout)
+
+            if not finished:
+                now = time.monotonic()
+                for sentinel, (deadline, action) in list(deadlines.items()):
+                    if deadline > now:
+                        continue
+                    handle = active[sentinel][0]
+                    if action == 'terminate':
+                        handle.terminate()
+                        deadlines[sentinel] = (now + self.kill_grace_period_in_ms / 1000, 'kill')
+                    else:
+                        handle.kill()
+                        del deadlines[sentinel]
+
+            for sentinel in finished:
+                handle, slot, run_nr, run, resources = active.pop(sentinel)
+                deadlines.pop(sentinel, None)
+                handle.join()
+
+                held_resources -= resources
+                free_slots.append(slot)
+                free_slots.sort()
+
+                queue.extend(on_run_finished(run_nr, run, handle) or [])
+                if self.time_between_runs_in_ms:
+                    slot_ready_at[slot] = time.monotonic() + self.time_between_runs_in_ms / 1000
+
+
+class _RunQueue:
+    """The queue of runs to start: the runs taken from `pending` that had to wait for a resource, the rest of
+    `pending` (taken only when needed), and the runs added while running, in that order."""
+
+    def __init__(self, pending: Iterable[Tuple[int, Dict]]):
+        self.__waiting = deque()
+        self.__pending = iter(pending)
+        self.__next_pending = None
+        self.__added = deque()
+        self.__peek()
+
+    def __peek(self):
+        self.__next_pending = next(self.__pending, None)
+
+    def __bool__(self) -> bool:
+        return bool(self.__waiting) or self.__next_pending is not None or bool(self.__added)
+
+    def extend(self, runs: List[Tuple[int, Dict]]):
+        self.__added.extend(runs)
+
+    def take_first(self, can_start: Callable[[Tuple[int, Dict]], bool]) -> Optional[Tuple[int, Dict]]:
+        """Remove and return the first queued run for which `can_start` holds, None if there is none"""
+        for idx, queued in enumerate(self.__waiting):
+            if can_start(queued):
+                del self.__waiting[idx]
+                return queued
+
+        while self.__next_pending is not None:
+            queued = self.__next_pending
+            self.__peek()
+            if can_start(queued):
+                return queued
+            self.__waiting.append(queued)
+
+        for idx, queued in enumerate(self.__added):
+            if can_start(queued):
+                del self.__added[idx]
+                return queued
+        return None
@@ -0,0 +1,111 @@
+import math
+import statistics
+from typing import Dict, List, Optional
+
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.Config.Models.StoppingRule import StoppingRule
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+def t_quantile(p: float, df: int) -> float:
+    """Quantile of Student's t-distribution. Exact for 1 and 2 degrees of freedom,
+    a fourth order Cornish-Fisher expansion around the normal quantile otherwise."""
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = statistics.NormalDist().inv_cdf(p)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
+
+def relative_ci_width(values: List[float], confidence: float) -> float:
+    """Width of the t-based confidence interval of the mean, relative to the mean"""
+    n = len(values)
+    mean = statistics.fmean(values)
+    if n < 2:
+        return math.inf
+    if mean == 0:
+        return 0 if statistics.stdev(values) == 0 else math.inf
+
+    half_width = t_quantile(1 - (1 - confidence) / 2, n - 1) * statistics.stdev(values) / math.sqrt(n)
+    return 2 * half_width / abs(mean)
+
+
+###     =========================================================
+###     |                                                       |
+###     |               SequentialStoppingController            |
+###     |       - Track the results of every treatment          |
+###     |       - Decide, once all scheduled repetitions of a   |
+###     |         treatment are done, if another one is needed  |
+###     |                                                       |
+###     =========================================================
+class SequentialStoppingController:
+
+    def __init__(self, run_table_model: RunTableModel):
+        self.run_table_model = run_table_model
+        self.rule: StoppingRule = run_table_model.get_stopping_rule()
+
+        self.scheduled: Dict[str, int] = {}         # treatment -> nr of scheduled repetitions
+        self.completed: Dict[str, int] = {}         # treatment -> nr of completed repetitions
+        self.values: Dict[str, List[float]] = {}    # treatment -> numeric results of the data column
+        self.last_run: Dict[str, Dict] = {}         # treatment -> template for new repetitions
+
+    def __value_of(self, run: Dict) -> Optional[float]:
+        try:
+            value = float(run[self.rule.data_column])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return value if math.isfinite(value) else None
+
+    def track(self, run_table: List[Dict]) -> List[Dict]:
+        """Register the (possibly partially completed, when resuming) run table. Returns the new repetitions to
+        schedule for treatments whose runs are all done, but do not satisfy the stopping rule yet.
+        Failed runs are executed again when resuming, so they are not counted as completed."""
+        for run in run_table:
+            treatment, _ = RunTableModel.split_run_id(run['__run_id'])
+            self.scheduled[treatment] = self.scheduled.get(treatment, 0) + 1
+            self.last_run[treatment] = run
+            self.values.setdefault(treatment, [])
+            self.completed.setdefault(treatment, 0)
+
+            if run['__done'] == RunProgress.DONE:
+                self.completed[treatment] += 1
+                value = self.__value_of(run)
+                if value is not None:
+                    self.values[treatment].append(value)
+
+        return [self.__next_repetition(treatment) for treatment in self.scheduled
+                if self.completed[treatment] == self.scheduled[treatment] and not self.is_satisfied(treatment)]
+
+    def is_satisfied(self, treatment: str) -> bool:
+        values = self.values[treatment]
+        if self.scheduled[treatment] >= self.rule.max_repetitions:
+            return True
+        if len(values) < self.rule.min_repetitions:
+            return False
+        return relative_ci_width(values, self.rule.confidence) <= self.rule.max_relative_ci_width
+
+    def add_result(self, completed_run: Dict) -> Optional[Dict]:
+        """Register a completed run, or a run that failed for good (which counts as completed, without a value).
+        Returns a new repetition to schedule if the treatment needs more runs."""
+        treatment, _ = RunTableModel.split_run_id(completed_run['__run_id'])
+        self.completed[treatment] += 1
+        value = self.__value_of(completed_run) if completed_run['__done'] == RunProgress.DONE else None
+        if value is not None:
+            self.values[treatment].append(value)
+
+        # Other repetitions of this treatment are still pending: decide once they are done
+        if self.completed[treatment] < self.scheduled[treatment] or self.is_satisfied(treatment):
+            return None
+        return self.__next_repetition(treatment)
+
+    def __next_repetition(self, treatment: str) -> Dict:
+        new_run = self.run_table_model.generate_repetition(self.last_run[treatment], self.scheduled[treatment])
+        self.scheduled[treatment] += 1
+        self.last_run[treatment] = new_run
+        return new_run
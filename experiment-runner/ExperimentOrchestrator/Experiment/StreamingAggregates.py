@@ -0,0 +1,201 @@
+import json
+import math
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+SUMMARY_FILE = 'summary.json'
+
+
+class Welford:
+    """Running count, mean and variance (Welford's algorithm), in constant memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """The sample variance (None for less than two values)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+
+class P2Quantile:
+    """Running estimate of the `p`-quantile with the P² algorithm (Jain & Chlamtac, 1985), in constant memory.
+    Exact for the first five values."""
+
+    def __init__(self, p: float):
+        self.p = p
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value: float):
+        q, n = self.heights, self.positions
+        if len(q) < 5:
+            q.append(value)
+            q.sort()
+            return
+
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = max(i for i in range(4) if q[i] <= value)
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    @property
+    def value(self) -> Optional[float]:
+        q = self.heights
+        if not q:
+            return None
+        if self.positions[4] > 4:
+            return q[2]
+
+        # Fewer than six values: interpolate between the (sorted) values themselves
+        rank = self.p * (len(q) - 1)
+        low = math.floor(rank)
+        high = min(low + 1, len(q) - 1)
+        return q[low] + (rank - low) * (q[high] - q[low])
+
+
+class ColumnAggregate:
+    QUANTILES = [0.5, 0.9]
+
+    def __init__(self):
+        self.moments = Welford()
+        self.quantiles = [P2Quantile(p) for p in self.QUANTILES]
+
+    def add(self, value: float):
+        self.moments.add(value)
+        for quantile in self.quantiles:
+            quantile.add(value)
+
+    def to_dict(self) -> Dict:
+        variance = self.moments.variance
+        return {
+            'count': self.moments.count,
+            'mean': self.moments.mean,
+            'variance': variance,
+            'stdev': math.sqrt(variance) if variance is not None else None,
+            'min': self.moments.min,
+            'max': self.moments.max,
+            **{f'p{round(quantile.p * 100)}': quantile.value for quantile in self.quantiles}
+        }
+
+
+###     =========================================================
+###     |                                                       |
+###     |              StreamingAggregatesController            |
+###     |       - Maintain the count, mean, variance and        |
+###     |         quantiles of every numeric data column, per   |
+###     |         treatment, as runs complete                   |
+###     |       - Publish them in `summary.json`, next to the   |
+###     |         run table                                     |
+###     |                                                       |
+###     =========================================================
+class StreamingAggregatesController:
+
+    def __init__(self, run_table_model: RunTableModel, experiment_path: Path, write_interval_in_s: float = 5):
+        self.factor_names = [factor.factor_name for factor in run_table_model.get_factors()]
+        # Columns added by Experiment Runner itself (e.g. __attempts) are not results
+        self.data_columns = [column for column in run_table_model.get_data_columns() if not column.startswith('__')]
+        self.summary_path = experiment_path / SUMMARY_FILE
+        self.write_interval_in_s = write_interval_in_s
+
+        self.runs_done = 0
+        self.levels: Dict[str, Dict[str, str]] = {}                         # treatment -> factor levels
+        self.aggregates: Dict[str, Dict[str, ColumnAggregate]] = {}         # treatment -> column -> aggregate
+        self.last_write = 0.0
+
+    @staticmethod
+    def __value_of(run: Dict, column: str) -> Optional[float]:
+        try:
+            value = float(run[column])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return value if math.isfinite(value) else None
+
+    def track(self, run_table: List[Dict]):
+        """Aggregate the runs that were already completed (when resuming)"""
+        for run in run_table:
+            if run['__done'] == RunProgress.DONE:
+                self.add_result(run)
+
+    def add_result(self, completed_run: Dict):
+        treatment, _ = RunTableModel.split_run_id(completed_run['__run_id'])
+        if treatment not in self.aggregates:
+            self.levels[treatment] = {factor: str(completed_run[factor]) for factor in self.factor_names}
+            self.aggregates[treatment] = {column: ColumnAggregate() for column in self.data_columns}
+
+        self.runs_done += 1
+        for column, aggregate in self.aggregates[treatment].items():
+            value = self.__value_of(completed_run, column)
+            if value is not None:
+                aggregate.add(value)
+
+    def summary(self) -> Dict:
+        return {
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'runs_done': self.runs_done,
+            'treatments': {
+                treatment: {
+                    'factors': self.levels[treatment],
+                    'columns': {column: aggregate.to_dict() for column, aggregate in columns.items()
+                                if aggregate.moments.count > 0}
+                } for treatment, columns in self.aggregates.items()
+            }
+        }
+
+    def write_summary(self, force: bool = False):
+        """Write `summary.json`, at most once per `write_interval_in_s` unless forced"""
+        if not force and time.monotonic() - self.last_write < self.write_interval_in_s:
+            return
+
+        tmp = self.summary_path.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+        os.replace(tmp, self.summary_path)
+        self.last_write = time.monotonic()
+
+
+def read_summary(experiment_path: Path) -> Dict:
+    with open(Path(experiment_path) / SUMMARY_FILE, 'r') as f:
+        return json.load(f)
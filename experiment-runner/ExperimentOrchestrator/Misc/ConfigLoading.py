@@ -0,0 +1,12 @@
+import sys
+from importlib import util
+
+
+def load_config_module(config_path: str):
+    """Import the config file at `config_path` as a module (registered in sys.modules under its file name)"""
+    module_name = config_path.split('/')[-1].replace('.py', '')
+    spec = util.spec_from_file_location(module_name, config_path)
+    config_file = util.module_from_spec(spec)
+    sys.modules[module_name] = config_file
+    spec.loader.exec_module(config_file)
+    return config_file
@@ -9,6 +9,12 @@ import re
 
 from ConfigValidator.Config.Models.RunnerContext import RunnerContext
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+
+# The emission tracker is started before the START_MEASUREMENT config hook, and stopped and read after the
+# STOP_MEASUREMENT and POPULATE_RUN_DATA config hooks (which have priority 0)
+TRACKER_PRIORITY = 100
 
 class DataColumns(Enum):
     """For the description of data columns, see
@@ -29,17 +35,47 @@ class DataColumns(Enum):
         return f'codecarbon__{super().name.lower()}'
 
 def emission_tracker(online=False, *decargs, **deckwargs):
+    """Class decorator: add the data columns to the run table model, and track the emissions of every run by
+    subscribing the tracker to the measurement events when the config is created (see `subscribe`)"""
     def emission_tracker_decorator(cls: RunnerConfig.__class__):
         data_columns =  deckwargs.pop('data_columns', [DataColumns.EMISSIONS])
 
         cls.create_run_table_model  = add_data_columns(data_columns)(cls.create_run_table_model)
-        cls.start_measurement       = start_emission_tracker(online=online, *decargs, **deckwargs)(cls.start_measurement)
-        cls.stop_measurement        = stop_emission_tracker(cls.stop_measurement)
-        cls.populate_run_data       = populate_data_columns(cls.populate_run_data)
+
+        init = cls.__init__
+        def __init__(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            subscribe(self, online, *decargs, **deckwargs)
+        cls.__init__ = __init__
 
         return cls
     return emission_tracker_decorator
 
+def subscribe(config: RunnerConfig, online=False, *trackerargs, priority: int = TRACKER_PRIORITY, **trackerkwargs):
+    """Start a codecarbon emission tracker with the measurement of every run (START_MEASUREMENT), stop it after
+    the measurement (STOP_MEASUREMENT), and add its data columns to the run data (POPULATE_RUN_DATA), next to
+    the config hooks. The tracker starts before, and stops after, subscribers of a lower `priority`."""
+    def start(context: RunnerContext = None):
+        kwargs = dict(trackerkwargs)
+        kwargs.setdefault('project_name', config.name)
+        if 'output_dir' not in kwargs:
+            kwargs['output_dir'] = str(context.run_dir.resolve())
+        codecarbon_cls = codecarbon.EmissionsTracker if online else codecarbon.OfflineEmissionsTracker
+
+        config.__emission_tracker__ = codecarbon_cls(*trackerargs, **kwargs)
+        config.__emission_tracker__.start()
+
+    def stop(context: RunnerContext = None):
+        config.__emission_tracker__.stop()
+
+    def populate(context: RunnerContext = None):
+        return read_data_columns(config)
+
+    EventSubscriptionController.subscribe(RunnerEvents.START_MEASUREMENT, start, priority, key='codecarbon.start')
+    EventSubscriptionController.subscribe(RunnerEvents.STOP_MEASUREMENT, stop, -priority, key='codecarbon.stop')
+    EventSubscriptionController.subscribe(RunnerEvents.POPULATE_RUN_DATA, populate, -priority,
+                                          key='codecarbon.populate')
+
 def start_emission_tracker(online=False, *decargs, **deckwargs):
     def start_emission_tracker_decorator(func):
         def wrapper(*args, **kwargs):
@@ -79,6 +115,22 @@ def add_data_columns(data_cols: Iterable[DataColumns]):
         return wrapper
     return add_data_columns_decorator
 
+def read_data_columns(config: RunnerConfig) -> dict:
+    """The values of the codecarbon data columns of the run table, from the output of the last tracker"""
+    tracker = config.__emission_tracker__
+    with open(Path(tracker._output_dir) / Path(tracker._output_file)) as csvfile:
+        reader = csv.DictReader(csvfile)
+        rows = [row for row in reader]
+        assert(len(rows) == 1)
+        data = rows[0]
+
+    values = {}
+    for dc in config.run_table_model.get_data_columns():
+        m = DataColumns._PATTERN.value.match(dc)
+        if m:
+            values[dc] = float(data[m.group(2)])
+    return values
+
 def populate_data_columns(func):
     def wrapper(*args, **kwargs):
         self: RunnerConfig = args[0]
@@ -86,14 +138,6 @@ def populate_data_columns(func):
         ret_val = func(*args, **kwargs)
         if ret_val is None:
             ret_val = {}
-        with open(Path(self.__emission_tracker__._output_dir) / Path(self.__emission_tracker__._output_file)) as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = [row for row in reader]
-            assert(len(rows) == 1)
-            data = rows[0]
-            for dc in self.run_table_model.get_data_columns():
-                m = DataColumns._PATTERN.value.match(dc)
-                if m:
-                    ret_val[dc] = float(data[m.group(2)])
+        ret_val.update(read_data_columns(self))
         return ret_val
     return wrapper
@@ -14,6 +14,13 @@ import os
 import subprocess
 import threading
 import queue
+import weakref
+import asyncio
+import time
+
+from ConfigValidator.Config.Models.MeasurementWindow import MeasurementWindow
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
 
 class ParameterDict(UserDict):
     def valid_key(self, key):
@@ -73,9 +80,26 @@ class ValueRef:
         self.value = value
 
 class DataSource(ABC):
+    # Sources that are started but not stopped yet, so they can be stopped when a run is aborted
+    active_sources = weakref.WeakSet()
+
+    # How the samples of the log of this source are timed, see `clip`
+    timestamp_column: str = None
+    time_unit: str = 'ms'
+
     def __init__(self):
+        self.started_at_ns = None
         self._validate_platform()
 
+    @staticmethod
+    def stop_active_sources():
+        for source in list(DataSource.active_sources):
+            try:
+                source.stop()
+            except Exception as e:
+                print(f"[WARNING] Could not stop {source.source_name}: {e}")
+            DataSource.active_sources.discard(source)
+
     def _validate_platform(self):
         if platform.system() in self.supported_platforms:
             return
@@ -94,6 +118,60 @@ class DataSource(ABC):
         except:
             return ctypes.windll.shell32.IsUserAdmin() == 1
 
+    # Use these from `async def` config hooks, so the event loop (and other sources) keep going while starting
+    async def start_async(self):
+        await asyncio.to_thread(self.start)
+
+    async def stop_async(self, *args, **kwargs):
+        return await asyncio.to_thread(self.stop, *args, **kwargs)
+
+    @staticmethod
+    async def start_concurrently(sources: list["DataSource"]) -> int:
+        """Start all sources at the same time. Returns the skew in ns between the first and the last source
+        being started."""
+        started_at = []
+
+        async def start(source):
+            await source.start_async()
+            started_at.append(time.perf_counter_ns())
+
+        await asyncio.gather(*map(start, sources))
+        return max(started_at) - min(started_at) if started_at else 0
+
+    @staticmethod
+    async def stop_concurrently(sources: list["DataSource"]) -> list:
+        """Stop all sources at the same time. Returns the results of their `stop()`, in order."""
+        return await asyncio.gather(*(source.stop_async() for source in sources))
+
+    def subscribe(self, priority: int = 0):
+        """Start and stop this source with the measurement of every run (START_MEASUREMENT and STOP_MEASUREMENT),
+        instead of from the config hooks. Subscribed sources are started and stopped concurrently with each other;
+        config hooks of a lower priority run after them."""
+        async def start(context):
+            await self.start_async()
+
+        async def stop(context):
+            await self.stop_async()
+
+        EventSubscriptionController.subscribe(RunnerEvents.START_MEASUREMENT, start, priority, concurrent=True,
+                                              key=f"{self.source_name}.start")
+        EventSubscriptionController.subscribe(RunnerEvents.STOP_MEASUREMENT, stop, priority, concurrent=True,
+                                              key=f"{self.source_name}.stop")
+
+    def store_samples(self, writer, data, timestamp_column: str = None, time_unit: str = 'ms'):
+        """Add the numeric columns of a parsed log (e.g. of `parse_log`) to the unified time-series store of the
+        run, a `ProgressManager.Output.SampleStore.SampleWriter`, as metrics of this source"""
+        writer.ingest(data, self.source_name, timestamp_column, time_unit)
+
+    def sample_interval(self) -> float | None:
+        """The time between two samples in `time_unit`, for logs without timestamps"""
+        return None
+
+    def clip(self, data, window: MeasurementWindow):
+        """The samples of a parsed log (e.g. of `parse_log`) taken within the measurement window of the run
+        (`context.measurement_window`), leaving out those of starting and stopping this source"""
+        return window.clip(data, self.timestamp_column, self.time_unit, self.started_at_ns, self.sample_interval())
+
     @property
     @abstractmethod
     def supported_platforms(self) -> list[str]:
@@ -226,6 +304,7 @@ class CLISource(DataSource):
         self._validate_parameters(self.args)
 
     def start(self):
+        self.started_at_ns = time.time_ns()
         try:
             self.process = subprocess.Popen(shlex.split(self._format_cmd()), 
                                             stdout=subprocess.PIPE, 
@@ -234,12 +313,14 @@ class CLISource(DataSource):
             self.process.kill()
             raise RuntimeError(f"{self.source_name} process could not start: {e}")
         
+        DataSource.active_sources.add(self)
         self._validate_start()
 
     def stop(self, wait=False):
         if not self.process:
             return
 
+        DataSource.active_sources.discard(self)
         try:
             if not wait:
                 self.process.terminate()
@@ -297,6 +378,7 @@ class DeviceSource(DataSource):
         if self.process:
             raise RuntimeError("This module has already been started. Call stop() to start again")
 
+        self.started_at_ns = time.time_ns()
         try:
             self.process = threading.Thread(target=self.log,
                                             name="DeviceWorker")
@@ -306,10 +388,13 @@ class DeviceSource(DataSource):
             self.process.terminate()
             raise RuntimeError(f"Could not start logging process: {e}")
 
+        DataSource.active_sources.add(self)
+
     def stop(self):
         if not self.process:
             return
 
+        DataSource.active_sources.discard(self)
         if not self.process.is_alive():
             raise RuntimeError("Process terminated early, check configuration")
         
@@ -18,6 +18,8 @@ class EnergiBridge(CLISource):
     parameters = ParameterDict(ENERGIBRIDGE_PARAMETERS)
     source_name = "energibridge"
     supported_platforms = ["Linux", "Darwin", "Windows"]
+    timestamp_column = "Time"
+    time_unit = "ms"
 
     """An integration of PowerJoular into experiment-runner as a data source plugin"""
     def __init__(self,
@@ -19,6 +19,8 @@ class PowerJoular(CLISource):
     parameters = ParameterDict(POWERJOULAR_PARAMETERS)
     source_name = "powerjoular"
     supported_platforms = ["Linux"]
+    timestamp_column = "Date"
+    time_unit = "s"
 
     """An integration of PowerJoular into experiment-runner as a data source plugin"""
     def __init__(self,
@@ -69,6 +69,7 @@ class Ps(CLISource):
     parameters = ParameterDict(PS_PARAMTERS)
     source_name = "ps"
     supported_platforms = ["Linux"]
+    time_unit = "s"
 
     """An integration of the Linux ps utility into experiment-runner as a data source plugin"""
     def __init__(self,
@@ -108,6 +109,10 @@ class Ps(CLISource):
         # This wraps the ps utility so that it runs continously and also outputs into a csv like format
         return f'''sh -c "while true; do {cmd} | awk '{{$1=$1}};1' | tr ' ' ','{output_cmd}; sleep {self.sleep_interval}; done"'''
 
+    # ps has no timestamps: its samples are taken every sleep_interval (plus the time ps takes) from the start
+    def sample_interval(self):
+        return self.sleep_interval
+
     # The csv saved by default has no header, this must be provided by the user
     @staticmethod
     def parse_log(logfile: Path, column_names: list[str]):
@@ -1,7 +1,52 @@
+import json
+import os
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 
 class BaseOutputManager:
 
     def __init__(self, experiment_path: Path):
         self._experiment_path = experiment_path
+        self.__row_index: Optional[Dict[str, Dict]] = None
+        self.__table_signature = None
+        self.__journal_offset = 0
+
+    def _read_indexed_row(self, run_id: str, table_file: str, journal_file: str,
+                          read_table: Callable[[], List[Dict]], parse_entry: Callable[[Dict], Dict]) -> Optional[Dict]:
+        """A row of a run table stored as a file plus a journal of updated rows, by its run id. The file is parsed
+        once into an index of the rows by run id, later reads only replay the journal entries appended since (by
+        any process), so reading all rows one by one takes linear time. The index is rebuilt when the file is
+        rewritten (e.g. compacted)."""
+        try:
+            stat = os.stat(self._experiment_path / table_file)
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        try:
+            journal_size = os.stat(self._experiment_path / journal_file).st_size
+        except FileNotFoundError:
+            journal_size = 0
+
+        if self.__row_index is None or signature is None or signature != self.__table_signature \
+                or journal_size < self.__journal_offset:
+            self.__row_index = {row['__run_id']: row for row in read_table()}
+            self.__table_signature = signature
+            self.__journal_offset = 0
+
+        if journal_size > self.__journal_offset:
+            with open(self._experiment_path / journal_file, 'rb') as journal:
+                journal.seek(self.__journal_offset)
+                tail = journal.read()
+
+            # An entry that is still being appended is read once it is terminated
+            complete = tail.rfind(b'\n') + 1
+            for line in tail[:complete].splitlines():
+                try:
+                    row = parse_entry(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+                self.__row_index[row['__run_id']] = row
+            self.__journal_offset += complete
+
+        return self.__row_index.get(run_id)
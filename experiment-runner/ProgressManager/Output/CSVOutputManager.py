@@ -4,71 +4,156 @@ from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 from ProgressManager.Output.BaseOutputManager import BaseOutputManager
 
 from tempfile import NamedTemporaryFile
-import shutil
+from pathlib import Path
 import csv
+import fcntl
+import json
 import os
 import pwd
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class CSVOutputManager(BaseOutputManager):
-    def read_run_table(self) -> List[Dict]:
+    """Stores the run table in `run_table.csv`. Updated rows are appended to a journal (`run_table.journal.jsonl`),
+    so persisting a run takes constant time regardless of the size of the run table. Reads replay the journal on
+    top of the CSV, `compact()` folds the journal into the CSV."""
+
+    JOURNAL_FILE = 'run_table.journal.jsonl'
+
+    def __init__(self, experiment_path: Path, fsync_journal: bool = True):
+        super().__init__(experiment_path)
+        self.fsync_journal = fsync_journal
+
+    @staticmethod
+    def __parse_row(row: Dict) -> Dict:
+        # if value was integer, stored as string by CSV writer, then convert back to integer.
+        row = {key: int(value) if value.isnumeric() else value for key, value in row.items()}
+        row['__done'] = RunProgress[row['__done']]
+        return row
+
+    @staticmethod
+    def __serialize_row(row: Dict) -> Dict:
+        # Journal entries store the same (human-readable) strings as the CSV writer, so both read back alike
+        return {key: value.name if key == '__done' else '' if value is None else str(value)
+                for key, value in row.items()}
+
+    def __read_journal(self) -> List[Dict]:
+        try:
+            with open(self._experiment_path / self.JOURNAL_FILE, 'r') as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A crash while appending leaves a partial entry behind, the run it belonged to is simply redone
+                if line.strip():
+                    output.console_log_WARNING("CSVManager: Skipping an incomplete run table journal entry")
+        return entries
+
+    def __append_to_journal(self, rows: List[Dict]):
+        with open(self._experiment_path / 'run_table.csv.lock', 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+
+            with open(self._experiment_path / self.JOURNAL_FILE, 'ab') as journal:
+                if journal.tell() == 0:
+                    # Change permissions so the files can be accessed if run as root (needed for some plugins)
+                    user = pwd.getpwnam(os.getlogin())
+                    os.chown(self._experiment_path / self.JOURNAL_FILE, user.pw_uid, user.pw_gid)
+                else:
+                    # Terminate a partial entry left behind by a crash, so it does not swallow the new one
+                    with open(self._experiment_path / self.JOURNAL_FILE, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            journal.write(b'\n')
+
+                journal.write(b''.join(json.dumps(self.__serialize_row(row)).encode() + b'\n' for row in rows))
+                journal.flush()
+                if self.fsync_journal:
+                    os.fsync(journal.fileno())
+
+    def __write_csv(self, run_table: List[Dict]):
+        # The new table is written next to the old one and atomically moved into place, so a crash at any point
+        # leaves either the old or the new run table behind, never a mix.
+        tempfile = NamedTemporaryFile(mode='w', delete=False, dir=self._experiment_path, newline='')
+        with tempfile:
+            writer = csv.DictWriter(tempfile, fieldnames=list(run_table[0].keys()))
+            writer.writeheader()
+            for data in run_table:
+                writer.writerow({**data, '__done': data['__done'].name})
+            tempfile.flush()
+            os.fsync(tempfile.fileno())
+
+        os.chmod(tempfile.name, 0o644)
+        os.replace(tempfile.name, self._experiment_path / 'run_table.csv')
+
+    def __read_csv(self) -> List[Dict]:
         read_run_table = []
         try:
             with open(self._experiment_path / 'run_table.csv', 'r') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # if value was integer, stored as string by CSV writer, then convert back to integer.
-                    for key, value in row.items():
-                        if value.isnumeric():
-                            row[key] = int(value)
-
-                        if key == '__done':
-                            row[key] = RunProgress[value]
-
-                    read_run_table.append(row)
-            
-            return read_run_table
+                reader = csv.reader(csvfile)
+                fieldnames = next(reader)
+                for values in reader:
+                    read_run_table.append(self.__parse_row(dict(zip(fieldnames, values))))
         except:
             raise ExperimentOutputFileDoesNotExistError
+        return read_run_table
+
+    def read_run_table(self) -> List[Dict]:
+        read_run_table = self.__read_csv()
+
+        # Replay the journal: the last entry of a run wins, entries of runs not in the CSV are appended rows
+        run_index = {row['__run_id']: i for i, row in enumerate(read_run_table)}
+        for entry in self.__read_journal():
+            row = self.__parse_row(entry)
+            if row['__run_id'] in run_index:
+                read_run_table[run_index[row['__run_id']]] = row
+            else:
+                run_index[row['__run_id']] = len(read_run_table)
+                read_run_table.append(row)
+
+        return read_run_table
 
     def write_run_table(self, run_table: List[Dict]):
         try:
-            with open(self._experiment_path / 'run_table.csv', 'w', newline='') as myfile:
-                writer = csv.DictWriter(myfile, fieldnames=list(run_table[0].keys()))
-                writer.writeheader()
-                for data in run_table:
-                    data['__done'] = data['__done'].name
-                    writer.writerow(data)
+            with open(self._experiment_path / 'run_table.csv.lock', 'w') as lockfile:
+                fcntl.flock(lockfile, fcntl.LOCK_EX)
+                self.__write_csv(run_table)
+                (self._experiment_path / self.JOURNAL_FILE).unlink(missing_ok=True)
         except:
             raise ExperimentOutputFileDoesNotExistError
 
-    # TODO: Nice To have
-    def shuffle_experiment_run_table(self):
-        pass
-    
-    def update_row_data(self, updated_row: dict):
-        tempfile = NamedTemporaryFile(mode='w', delete=False)
-
-        with open(self._experiment_path / 'run_table.csv', 'r') as csvfile, tempfile:
-            reader = csv.DictReader(csvfile, fieldnames=list(updated_row.keys()))
-            writer = csv.DictWriter(tempfile, fieldnames=list(updated_row.keys()))
-
-            for row in reader:
-                if row['__run_id'] == updated_row['__run_id']:
-                    # When the row is updated, it is an ENUM value again.
-                    # Write as human-readable: enum_value.name
-                    updated_row['__done'] = updated_row['__done'].name
-                    writer.writerow(updated_row)
-                else:
-                    writer.writerow(row)
+    def compact(self):
+        """Fold the journal into `run_table.csv`. A crash before the journal is removed is harmless,
+        as replaying it on top of the compacted run table yields the same rows."""
+        with open(self._experiment_path / 'run_table.csv.lock', 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            if not (self._experiment_path / self.JOURNAL_FILE).exists():
+                return
+
+            self.__write_csv(self.read_run_table())
+            (self._experiment_path / self.JOURNAL_FILE).unlink()
 
-        shutil.move(tempfile.name, self._experiment_path / 'run_table.csv')
-        
         # Change permissions so the files can be accessed if run as root (needed for some plugins)
         user = pwd.getpwnam(os.getlogin())
         os.chown(self._experiment_path / "run_table.csv", user.pw_uid, user.pw_gid)
 
+    def read_row(self, run_id: str) -> Optional[Dict]:
+        return self._read_indexed_row(run_id, 'run_table.csv', self.JOURNAL_FILE, self.__read_csv, self.__parse_row)
+
+    def append_rows(self, rows: List[Dict]):
+        self.__append_to_journal(rows)
+
+    # TODO: Nice To have
+    def shuffle_experiment_run_table(self):
+        pass
+    
+    def update_row_data(self, updated_row: dict):
+        # Runs may finish concurrently (max_parallel_runs > 1), appends to the journal are serialized with a lock.
+        self.__append_to_journal([updated_row])
         output.console_log_WARNING(f"CSVManager: Updated row {updated_row['__run_id']}")
 
         # with open(self.experiment_path + '/run_table.csv', 'w', newline='') as myfile:
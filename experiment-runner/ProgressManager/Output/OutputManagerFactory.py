@@ -0,0 +1,23 @@
+from ConfigValidator.Config.RunnerConfig import RunnerConfig
+from ConfigValidator.Config.Models.RunTableStore import RunTableStore
+from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+from ProgressManager.Output.JSONOutputManager import JSONOutputManager
+from ProgressManager.Output.SQLiteOutputManager import SQLiteOutputManager
+from ProgressManager.Output.ParquetOutputManager import ParquetOutputManager
+
+
+def create_data_manager(config: RunnerConfig):
+    """The output manager storing the run table, as configured by `config.run_table_store`"""
+    if config.run_table_store is RunTableStore.SQLITE:
+        return SQLiteOutputManager(config.experiment_path, config.run_table_journal_fsync)
+    if config.run_table_store is RunTableStore.PARQUET:
+        # The column types are derived from the run table model
+        return ParquetOutputManager(config.experiment_path, config.run_table_model, config.run_table_journal_fsync)
+    return CSVOutputManager(config.experiment_path, config.run_table_journal_fsync)
+
+
+def create_metadata_manager(config: RunnerConfig):
+    """The output manager storing the metadata. The SQLite store keeps it in the same database as the run table."""
+    if config.run_table_store is RunTableStore.SQLITE:
+        return SQLiteOutputManager(config.experiment_path, config.run_table_journal_fsync)
+    return JSONOutputManager(config.experiment_path)
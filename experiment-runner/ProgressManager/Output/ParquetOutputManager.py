@@ -0,0 +1,218 @@
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+from ConfigValidator.CustomErrors.ExperimentOutputErrors import ExperimentOutputFileDoesNotExistError
+from ProgressManager.Output.OutputProcedure import OutputProcedure as output
+from ProgressManager.Output.BaseOutputManager import BaseOutputManager
+from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+
+from pathlib import Path
+import fcntl
+import json
+import numbers
+import os
+import pwd
+import uuid
+from typing import Any, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+class ParquetOutputManager(BaseOutputManager):
+    """Stores the run table in `run_table.parquet`, with a column type per factor (derived from its treatments)
+    and per data column (as declared by `RunTableModel.data_column_types`, str otherwise). Values, including
+    floats, negative numbers and booleans, are read back with their own type.
+    Like the `CSVOutputManager`, updated rows are appended to a journal that `compact()` folds into the
+    Parquet file, which also exports the run table to `run_table.csv`. Requires pyarrow."""
+
+    TABLE_FILE = 'run_table.parquet'
+    JOURNAL_FILE = 'run_table.parquet.journal.jsonl'
+
+    # Columns added by Experiment Runner itself
+    RESERVED_COLUMN_TYPES = {'__run_id': str, '__done': str, '__attempts': int, '__cooldown_ms': int, '__error': str}
+
+    def __init__(self, experiment_path: Path, run_table_model: Optional[RunTableModel] = None,
+                 fsync_journal: bool = True):
+        if pa is None:
+            raise BaseError("The Parquet run table store requires pyarrow, install it with: pip install pyarrow")
+
+        super().__init__(experiment_path)
+        self.run_table_model = run_table_model
+        self.fsync_journal = fsync_journal
+        self.__schema = None
+
+    @staticmethod
+    def __arrow_type(values: List[Any]):
+        """The narrowest column type of the (python) values, str if they do not share one"""
+        present = [value for value in values if value is not None]
+        if not present or any(isinstance(value, bool) for value in present):
+            return pa.bool_() if present and all(isinstance(value, bool) for value in present) else pa.string()
+        if all(isinstance(value, numbers.Integral) for value in present):
+            return pa.int64()
+        if all(isinstance(value, numbers.Real) for value in present):
+            return pa.float64()
+        return pa.string()
+
+    def __derive_schema(self, columns: List[str]):
+        declared = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.string()}
+        types = {column: declared[column_type] for column, column_type in self.RESERVED_COLUMN_TYPES.items()}
+        if self.run_table_model:
+            for factor in self.run_table_model.get_factors():
+                types[factor.factor_name] = self.__arrow_type(factor.treatments)
+            for column, column_type in self.run_table_model.get_data_column_types().items():
+                types[column] = declared[column_type]
+
+        return pa.schema([(column, types.get(column, pa.string())) for column in columns])
+
+    @property
+    def schema(self):
+        if self.__schema is None:
+            try:
+                self.__schema = pq.read_schema(self._experiment_path / self.TABLE_FILE)
+            except (FileNotFoundError, OSError):
+                raise ExperimentOutputFileDoesNotExistError(self.TABLE_FILE)
+        return self.__schema
+
+    @staticmethod
+    def __coerce(value: Any, arrow_type) -> Any:
+        if value is None:
+            return None
+        if pa.types.is_string(arrow_type):
+            return value if isinstance(value, str) else str(value)
+        if isinstance(value, str):
+            # Data columns hold a placeholder until the run populated them
+            if not value.strip():
+                return None
+            if pa.types.is_boolean(arrow_type):
+                return value.strip().lower() in ('true', '1')
+        if pa.types.is_boolean(arrow_type):
+            return bool(value)
+        if pa.types.is_integer(arrow_type):
+            return int(value)
+        return float(value)
+
+    def __to_record(self, row: Dict) -> Dict:
+        record = {}
+        for column, value in row.items():
+            if column == '__done':
+                record[column] = value.name
+            else:
+                field = self.schema.field(column) if column in self.schema.names else None
+                record[column] = self.__coerce(value, field.type if field else pa.string())
+        return record
+
+    @staticmethod
+    def __from_record(record: Dict) -> Dict:
+        record['__done'] = RunProgress[record['__done']]
+        return record
+
+    def __write_table(self, records: List[Dict]):
+        # Written next to the old table and atomically moved into place
+        tempfile = self._experiment_path / f".{self.TABLE_FILE}.{uuid.uuid4().hex}.tmp"
+        pq.write_table(pa.Table.from_pylist(records, schema=self.schema), tempfile)
+        os.chmod(tempfile, 0o644)
+        os.replace(tempfile, self._experiment_path / self.TABLE_FILE)
+
+    def __read_table_records(self) -> List[Dict]:
+        try:
+            return pq.read_table(self._experiment_path / self.TABLE_FILE).to_pylist()
+        except (FileNotFoundError, OSError):
+            raise ExperimentOutputFileDoesNotExistError(self.TABLE_FILE)
+
+    def __read_records(self) -> List[Dict]:
+        records = self.__read_table_records()
+
+        try:
+            with open(self._experiment_path / self.JOURNAL_FILE, 'r') as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            lines = []
+
+        # Replay the journal: the last entry of a run wins, entries of runs not in the table are appended rows
+        run_index = {record['__run_id']: i for i, record in enumerate(records)}
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if line.strip():
+                    output.console_log_WARNING("ParquetManager: Skipping an incomplete run table journal entry")
+                continue
+
+            if record['__run_id'] in run_index:
+                records[run_index[record['__run_id']]] = record
+            else:
+                run_index[record['__run_id']] = len(records)
+                records.append(record)
+        return records
+
+    def __append_to_journal(self, rows: List[Dict]):
+        records = [self.__to_record(row) for row in rows]  # fails on values that do not match the column types
+        with open(self._experiment_path / 'run_table.parquet.lock', 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+
+            with open(self._experiment_path / self.JOURNAL_FILE, 'ab') as journal:
+                if journal.tell() == 0:
+                    # Change permissions so the files can be accessed if run as root (needed for some plugins)
+                    user = pwd.getpwnam(os.getlogin())
+                    os.chown(self._experiment_path / self.JOURNAL_FILE, user.pw_uid, user.pw_gid)
+                else:
+                    # Terminate a partial entry left behind by a crash, so it does not swallow the new one
+                    with open(self._experiment_path / self.JOURNAL_FILE, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            journal.write(b'\n')
+
+                journal.write(b''.join(json.dumps(record).encode() + b'\n' for record in records))
+                journal.flush()
+                if self.fsync_journal:
+                    os.fsync(journal.fileno())
+
+    def read_run_table(self) -> List[Dict]:
+        return [self.__from_record(record) for record in self.__read_records()]
+
+    def read_table(self) -> 'pa.Table':
+        """The run table (including the journal) as an Arrow table, e.g. for analysis"""
+        return pa.Table.from_pylist(self.__read_records(), schema=self.schema)
+
+    def write_run_table(self, run_table: List[Dict]):
+        columns = list(run_table[0].keys())
+        # Without a run table model (e.g. when rewriting a stored run table), the stored column types are kept
+        if self.run_table_model is not None or not (self._experiment_path / self.TABLE_FILE).exists() \
+                or self.schema.names != columns:
+            self.__schema = self.__derive_schema(columns)
+        with open(self._experiment_path / 'run_table.parquet.lock', 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            self.__write_table([self.__to_record(row) for row in run_table])
+            (self._experiment_path / self.JOURNAL_FILE).unlink(missing_ok=True)
+
+    def compact(self):
+        """Fold the journal into `run_table.parquet`, and export the run table to `run_table.csv`"""
+        with open(self._experiment_path / 'run_table.parquet.lock', 'w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            records = self.__read_records()
+            if (self._experiment_path / self.JOURNAL_FILE).exists():
+                self.__write_table(records)
+                (self._experiment_path / self.JOURNAL_FILE).unlink()
+
+        CSVOutputManager(self._experiment_path).write_run_table([self.__from_record(record) for record in records])
+
+        # Change permissions so the files can be accessed if run as root (needed for some plugins)
+        user = pwd.getpwnam(os.getlogin())
+        os.chown(self._experiment_path / "run_table.csv", user.pw_uid, user.pw_gid)
+
+    def read_row(self, run_id: str) -> Optional[Dict]:
+        return self._read_indexed_row(run_id, self.TABLE_FILE, self.JOURNAL_FILE,
+                                      lambda: [self.__from_record(record) for record in self.__read_table_records()],
+                                      self.__from_record)
+
+    def append_rows(self, rows: List[Dict]):
+        self.__append_to_journal(rows)
+
+    def update_row_data(self, updated_row: dict):
+        # Runs may finish concurrently (max_parallel_runs > 1), appends to the journal are serialized with a lock.
+        self.__append_to_journal([updated_row])
+        output.console_log_WARNING(f"ParquetManager: Updated row {updated_row['__run_id']}")
@@ -0,0 +1,135 @@
+from ConfigValidator.Config.Models.Metadata import Metadata
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+from ConfigValidator.CustomErrors.ExperimentOutputErrors import ExperimentOutputFileDoesNotExistError
+from ProgressManager.Output.OutputProcedure import OutputProcedure as output
+from ProgressManager.Output.BaseOutputManager import BaseOutputManager
+from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+
+from contextlib import closing
+from pathlib import Path
+import numbers
+import os
+import pwd
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+import jsonpickle
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+class SQLiteOutputManager(BaseOutputManager):
+    """Stores the run table and the metadata of an experiment in a single SQLite database (`run_table.db`).
+    The database is in WAL mode, so it can be queried (e.g. for the progress) while runs update it, and every
+    update is a transaction on a row indexed by its `__run_id`. `compact()` exports the run table to
+    `run_table.csv`, in the same layout as the `CSVOutputManager`."""
+
+    DATABASE_FILE = 'run_table.db'
+
+    def __init__(self, experiment_path: Path, fsync: bool = True):
+        super().__init__(experiment_path)
+        self.fsync = fsync
+
+    def __connect(self, create: bool = False) -> sqlite3.Connection:
+        database = self._experiment_path / self.DATABASE_FILE
+        if not create and not database.exists():
+            raise ExperimentOutputFileDoesNotExistError(self.DATABASE_FILE)
+
+        # A connection can not be shared with forked processes (runs), so each operation opens its own.
+        # Concurrent writers wait for each other's transactions.
+        connection = sqlite3.connect(database, timeout=60)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(f"PRAGMA synchronous={'FULL' if self.fsync else 'NORMAL'}")
+        return connection
+
+    @staticmethod
+    def __to_sql(column: str, value: Any) -> Any:
+        if column == '__done':
+            return value.name
+        if value is None or isinstance(value, str):
+            return value
+        # Booleans are stored like the CSV does, so factor levels keep the same str() representation
+        if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+            return int(value)
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            return float(value)
+        return str(value)
+
+    @staticmethod
+    def __from_sql(columns: List[str], values: tuple) -> Dict:
+        row = dict(zip(columns, values))
+        row['__done'] = RunProgress[row['__done']]
+        return row
+
+    def __insert(self, connection: sqlite3.Connection, rows: List[Dict]):
+        columns = list(rows[0].keys())
+        connection.executemany(
+            f"INSERT INTO run_table ({', '.join(map(_quote, columns))}) VALUES ({', '.join('?' * len(columns))})",
+            ([self.__to_sql(column, row[column]) for column in columns] for row in rows)
+        )
+
+    def read_run_table(self) -> List[Dict]:
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute('SELECT * FROM run_table ORDER BY rowid')
+            columns = [description[0] for description in cursor.description]
+            return [self.__from_sql(columns, values) for values in cursor]
+
+    def write_run_table(self, run_table: List[Dict]):
+        columns = list(run_table[0].keys())
+        with closing(self.__connect(create=True)) as connection, connection:
+            connection.execute('DROP TABLE IF EXISTS run_table')
+            connection.execute(f"CREATE TABLE run_table ({', '.join(map(_quote, columns))})")
+            connection.execute('CREATE UNIQUE INDEX run_table_run_id ON run_table ("__run_id")')
+            self.__insert(connection, run_table)
+
+    def read_row(self, run_id: str) -> Optional[Dict]:
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute('SELECT * FROM run_table WHERE "__run_id" = ?', [run_id])
+            columns = [description[0] for description in cursor.description]
+            values = cursor.fetchone()
+            return self.__from_sql(columns, values) if values else None
+
+    def read_progress(self) -> Dict[RunProgress, int]:
+        """The number of runs per state, e.g. to follow an experiment that is running"""
+        with closing(self.__connect()) as connection:
+            return {RunProgress[done]: count for done, count in
+                    connection.execute('SELECT "__done", COUNT(*) FROM run_table GROUP BY "__done"')}
+
+    def append_rows(self, rows: List[Dict]):
+        with closing(self.__connect()) as connection, connection:
+            self.__insert(connection, rows)
+
+    def update_row_data(self, updated_row: dict):
+        columns = [column for column in updated_row.keys() if column != '__run_id']
+        with closing(self.__connect()) as connection, connection:
+            connection.execute(
+                f"UPDATE run_table SET {', '.join(f'{_quote(column)} = ?' for column in columns)} "
+                f"WHERE \"__run_id\" = ?",
+                [self.__to_sql(column, updated_row[column]) for column in columns] + [updated_row['__run_id']]
+            )
+
+        output.console_log_WARNING(f"SQLiteManager: Updated row {updated_row['__run_id']}")
+
+    def compact(self):
+        """Export the run table to `run_table.csv`, and fold the write-ahead log into the database"""
+        CSVOutputManager(self._experiment_path).write_run_table(self.read_run_table())
+
+        with closing(self.__connect()) as connection:
+            connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+        # Change permissions so the files can be accessed if run as root (needed for some plugins)
+        user = pwd.getpwnam(os.getlogin())
+        os.chown(self._experiment_path / "run_table.csv", user.pw_uid, user.pw_gid)
+
+    def write_metadata(self, metadata: Metadata):
+        with closing(self.__connect(create=True)) as connection, connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)')
+            connection.execute('INSERT OR REPLACE INTO metadata VALUES (?, ?)',
+                               ['metadata', jsonpickle.encode(metadata)])
+
+    def read_metadata(self) -> Metadata:
+        with closing(self.__connect()) as connection:
+            return jsonpickle.decode(connection.execute(
+                "SELECT value FROM metadata WHERE key = 'metadata'").fetchone()[0])
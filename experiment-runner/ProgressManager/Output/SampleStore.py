@@ -0,0 +1,190 @@
+from pathlib import Path
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ConfigValidator.Config.Models.TimeUnits import TIME_UNITS_IN_NS
+
+# Column name -> dtype of the column files. Sources and metrics are stored as codes into `dictionary.json`.
+SAMPLE_COLUMNS = {'timestamp': np.int64, 'source': np.uint16, 'metric': np.uint16, 'value': np.float64}
+
+
+class Samples:
+    """The samples of a run, as NumPy arrays (memory-mapped, unless the store was compressed)"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], sources: List[str], metrics: List[str]):
+        self.timestamp = columns['timestamp']
+        self.source = columns['source']
+        self.metric = columns['metric']
+        self.value = columns['value']
+        self.sources = sources
+        self.metrics = metrics
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def select(self, source: Optional[str] = None, metric: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """The (timestamps, values) of the samples of a source and/or metric, in the order they were written"""
+        mask = np.ones(len(self), dtype=bool)
+        for codes, names, name in [(self.source, self.sources, source), (self.metric, self.metrics, metric)]:
+            if name is not None:
+                mask &= (codes == names.index(name)) if name in names else False
+        return self.timestamp[mask], self.value[mask]
+
+    def within(self, window) -> 'Samples':
+        """The samples taken within the `MeasurementWindow` of the run (see `MeasurementWindow.read`)"""
+        mask = window.contains(self.timestamp)
+        return Samples({'timestamp': self.timestamp[mask], 'source': self.source[mask], 'metric': self.metric[mask],
+                        'value': self.value[mask]}, self.sources, self.metrics)
+
+
+###     =========================================================
+###     |                                                       |
+###     |                      SampleWriter                     |
+###     |       - Unified store of the raw (time-series)        |
+###     |         samples of DataSources during a run           |
+###     |       - One file per column in `run_dir/samples`,     |
+###     |         appended in chunks, so they can be            |
+###     |         memory-mapped by `read_samples`               |
+###     |       - Optionally compressed into one .npz file      |
+###     |         once the run is done                          |
+###     |                                                       |
+###     |       * A writer may be shared by the threads of a    |
+###     |         run, not by multiple processes                |
+###     |                                                       |
+###     =========================================================
+class SampleWriter:
+    DIRECTORY = 'samples'
+
+    def __init__(self, run_dir: Path, chunk_size: int = 65536):
+        self.path = Path(run_dir) / self.DIRECTORY
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+
+        self.__lock = threading.Lock()
+        self.__buffer = {column: [] for column in SAMPLE_COLUMNS}
+        self.__sources, self.__metrics = _read_dictionary(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def __code(names: List[str], name: str) -> int:
+        if name not in names:
+            names.append(name)
+        return names.index(name)
+
+    def append(self, source: str, metric: str, value: float, timestamp_ns: Optional[int] = None):
+        """Add one sample, taken now unless a timestamp (in ns since the epoch) is given"""
+        self.extend(source, metric, [value], [time.time_ns() if timestamp_ns is None else timestamp_ns])
+
+    def extend(self, source: str, metric: str, values: Iterable[float], timestamps_ns: Iterable[int]):
+        """Add a series of samples of one metric"""
+        values = np.asarray(values, dtype=np.float64)
+        timestamps_ns = np.asarray(timestamps_ns, dtype=np.int64)
+        if values.shape != timestamps_ns.shape:
+            raise ValueError("Every sample needs exactly one timestamp")
+
+        with self.__lock:
+            self.__buffer['timestamp'].append(timestamps_ns)
+            self.__buffer['source'].append(np.full(len(values), self.__code(self.__sources, source), np.uint16))
+            self.__buffer['metric'].append(np.full(len(values), self.__code(self.__metrics, metric), np.uint16))
+            self.__buffer['value'].append(values)
+
+            if sum(map(len, self.__buffer['value'])) >= self.chunk_size:
+                self.__flush()
+
+    def ingest(self, data, source: str, timestamp_column: Optional[str] = None, time_unit: str = 'ms'):
+        """Add all numeric columns of a parsed log (a pandas DataFrame, or anything it can be constructed from,
+        e.g. the result of a DataSource's `parse_log`) as metrics of `source`. Without a timestamp column,
+        the row number is used as timestamp."""
+        import pandas as pd
+
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        if timestamp_column is None:
+            timestamps = np.arange(len(frame), dtype=np.int64)
+        else:
+            timestamps = (pd.to_numeric(frame[timestamp_column]).to_numpy(np.float64)
+                          * TIME_UNITS_IN_NS[time_unit]).astype(np.int64)
+
+        for column in frame.columns:
+            if column == timestamp_column:
+                continue
+            values = pd.to_numeric(frame[column], errors='coerce')
+            if values.notna().any():
+                self.extend(source, str(column), values.to_numpy(np.float64), timestamps)
+
+    def __flush(self):
+        if not self.__buffer['value']:
+            return
+
+        # The dictionary is written first, so every code in the column files can be resolved
+        _write_dictionary(self.path, self.__sources, self.__metrics)
+        for column, dtype in SAMPLE_COLUMNS.items():
+            with open(self.path / f"{column}.bin", 'ab') as f:
+                np.concatenate(self.__buffer[column]).astype(dtype, copy=False).tofile(f)
+            self.__buffer[column] = []
+
+    def flush(self):
+        with self.__lock:
+            self.__flush()
+
+    def close(self, compress: bool = False):
+        """Write the remaining samples. With `compress`, the column files are replaced by one compressed
+        `samples.npz` (which is loaded, instead of memory-mapped, when read)."""
+        with self.__lock:
+            self.__flush()
+            if compress:
+                columns = _map_columns(self.path)
+                np.savez_compressed(self.path / 'samples.npz', **{c: np.array(v) for c, v in columns.items()})
+                for column in SAMPLE_COLUMNS:
+                    (self.path / f"{column}.bin").unlink(missing_ok=True)
+
+
+def _read_dictionary(path: Path) -> Tuple[List[str], List[str]]:
+    try:
+        with open(path / 'dictionary.json', 'r') as f:
+            dictionary = json.load(f)
+        return dictionary['sources'], dictionary['metrics']
+    except FileNotFoundError:
+        return [], []
+
+
+def _write_dictionary(path: Path, sources: List[str], metrics: List[str]):
+    tmp = path / 'dictionary.json.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'sources': sources, 'metrics': metrics}, f)
+    os.replace(tmp, path / 'dictionary.json')
+
+
+def _map_columns(path: Path) -> Dict[str, np.ndarray]:
+    columns = {}
+    for column, dtype in SAMPLE_COLUMNS.items():
+        file = path / f"{column}.bin"
+        length = file.stat().st_size // np.dtype(dtype).itemsize if file.exists() else 0
+        if length == 0:
+            columns[column] = np.empty(0, dtype)
+        else:
+            columns[column] = np.memmap(file, dtype=dtype, mode='r', shape=(length,))
+
+    # A crash while appending a chunk can leave the column files with different lengths
+    length = min(map(len, columns.values()))
+    return {column: values[:length] for column, values in columns.items()}
+
+
+def read_samples(run_dir: Path) -> Samples:
+    """The samples written to the SampleWriter of a run"""
+    path = Path(run_dir) / SampleWriter.DIRECTORY
+    sources, metrics = _read_dictionary(path)
+
+    if (path / 'samples.npz').exists():
+        with np.load(path / 'samples.npz') as npz:
+            return Samples({column: npz[column] for column in SAMPLE_COLUMNS}, sources, metrics)
+    return Samples(_map_columns(path), sources, metrics)
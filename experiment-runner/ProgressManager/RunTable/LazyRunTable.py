@@ -0,0 +1,223 @@
+import random
+from array import array
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+from ProgressManager.RunTable.RunRow import RowLayout, RunRow
+
+
+class RandomPermutation:
+    """A uniformly random permutation of range(size), evaluated per index. Large permutations are not stored but
+    computed in constant time and memory, by a keyed Feistel network with cycle walking."""
+
+    MAX_STORED_SIZE = 1 << 20                   # 4 MB
+    ROUNDS = 6
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        rng = random.Random(random.getrandbits(64) if seed is None else seed)
+        self.size = size
+        self.__stored = None
+        if size <= self.MAX_STORED_SIZE:
+            self.__stored = array('I', range(size))
+            rng.shuffle(self.__stored)
+            return
+
+        self.__half_bits = ((size - 1).bit_length() + 1) // 2
+        self.__half_mask = (1 << self.__half_bits) - 1
+        self.__keys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    def __call__(self, index: int) -> int:
+        if self.__stored is not None:
+            return self.__stored[index]
+
+        # The network permutes the smallest power of four >= size; values outside range(size) are permuted again
+        # until they fall inside it, which keeps the result a permutation of range(size)
+        half_bits, half_mask = self.__half_bits, self.__half_mask
+        value = index
+        while True:
+            left, right = value >> half_bits, value & half_mask
+            for key in self.__keys:
+                # Round function: the hash of a tuple of ints is deterministic (unlike the one of str), and fast
+                left, right = right, left ^ (hash((right, key)) & half_mask)
+            value = (left << half_bits) | right
+            if value < self.size:
+                return value
+
+
+###     =========================================================
+###     |                                                       |
+###     |                      LazyRunTable                     |
+###     |       - The run table of a RunTableModel, computing   |
+###     |         rows on demand instead of storing them        |
+###     |       - Treatment levels follow from the mixed-radix  |
+###     |         digits of the treatment number                |
+###     |       - The run at a position follows from the        |
+###     |         scheduling order, in constant time            |
+###     |       - Progress is kept in a (chunked) bitmap of the |
+###     |         done runs, plus the rows that were otherwise  |
+###     |         updated (e.g. failed or retried runs)         |
+###     |                                                       |
+###     |       * Rows are RunRows (behaving like dicts); only  |
+###     |         the updates stored with `run_table[i] = row`  |
+###     |         are kept (completed ones without a loader)    |
+###     |                                                       |
+###     =========================================================
+class LazyRunTable(Sequence):
+    DONE_CHUNK_BITS = 1 << 16                   # bitmap chunks are allocated once a run in them is done
+
+    def __init__(self,
+                 factors: List[FactorModel],
+                 data_columns: List[str],
+                 repetitions: int,
+                 treatments: Optional[Sequence] = None,
+                 order: Optional[Callable[[int], int]] = None):
+        """`treatments` are the (mixed-radix) numbers of the included combinations of factor levels, all of them if
+        None. `order` maps a position in the run table to the run with number `repetition * nr_of_treatments +
+        treatment`, in that order if None."""
+        self.factor_names = [factor.factor_name for factor in factors]
+        self.data_columns = list(data_columns)
+        self.repetitions = repetitions
+        self.__levels = [factor.treatments for factor in factors]
+        self.__radices = [len(levels) for levels in self.__levels]
+        self.__layout = RowLayout(self.factor_names, self.__levels, self.data_columns)
+        self.__blank_data = [" "] * len(self.data_columns)
+
+        nr_of_combinations = 1
+        for radix in self.__radices:
+            nr_of_combinations *= radix
+        self.__treatments = treatments
+        self.nr_of_treatments = nr_of_combinations if treatments is None else len(treatments)
+        self.nr_of_base_runs = self.nr_of_treatments * repetitions
+
+        self.__order = order                                        # position -> run number, None for identity
+        self.__stored_order: Optional[array] = None                 # explicit order (e.g. of a resumed run table)
+        self.__done: Dict[int, bytearray] = {}                      # done bitmap of the generated runs, by chunk
+        self.__updated: Dict[int, Dict] = {}                        # run number -> updated row
+        self.__extra_runs: List[Dict] = []                          # appended runs (e.g. by a stopping rule)
+        self.__extra_run_ids: Dict[str, int] = {}
+
+        # Reads the stored row of a completed run by its run id, e.g. `read_row` of an output manager.
+        # Without it, the updated rows of completed runs are kept in memory as well.
+        self.completed_row_loader: Optional[Callable[[str], Optional[Dict]]] = None
+
+    def __len__(self) -> int:
+        return self.nr_of_base_runs + len(self.__extra_runs)
+
+    def levels_of(self, treatment: int) -> Tuple:
+        """The factor levels of a treatment (its index in the run table, i.e. `run_<treatment>`)"""
+        number = treatment if self.__treatments is None else self.__treatments[treatment]
+        digits = []
+        for radix in reversed(self.__radices):
+            number, digit = divmod(number, radix)
+            digits.append(digit)
+        return tuple(levels[digit] for levels, digit in zip(self.__levels, reversed(digits)))
+
+    def __run_number(self, position: int) -> int:
+        if self.__stored_order is not None:
+            return self.__stored_order[position]
+        if self.__order is None or position >= self.nr_of_base_runs:
+            return position
+        return self.__order(position)
+
+    def __is_done(self, run_number: int) -> bool:
+        chunk, bit = divmod(run_number, self.DONE_CHUNK_BITS)
+        bits = self.__done.get(chunk)
+        return bits is not None and bool(bits[bit >> 3] & (1 << (bit & 7)))
+
+    def __set_done(self, run_number: int, done: bool):
+        chunk, bit = divmod(run_number, self.DONE_CHUNK_BITS)
+        if done:
+            bits = self.__done.setdefault(chunk, bytearray(self.DONE_CHUNK_BITS // 8))
+            bits[bit >> 3] |= 1 << (bit & 7)
+        elif chunk in self.__done:
+            self.__done[chunk][bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+
+    def __generate(self, run_number: int) -> RunRow:
+        repetition, treatment = divmod(run_number, self.nr_of_treatments)
+        number = treatment if self.__treatments is None else self.__treatments[treatment]
+        return RunRow(self.__layout, number,
+                      [f'run_{treatment}_repetition_{repetition}', RunProgress.TODO, *self.__blank_data])
+
+    def run(self, run_number: int) -> Dict:
+        """The row of a run by its number (see `run_number_of`), regardless of its position"""
+        if run_number >= self.nr_of_base_runs:
+            return self.__extra_runs[run_number - self.nr_of_base_runs]
+        if run_number in self.__updated:
+            return self.__updated[run_number]
+
+        row = self.__generate(run_number)
+        if self.__is_done(run_number):
+            row['__done'] = RunProgress.DONE
+            stored = self.completed_row_loader(row['__run_id']) if self.completed_row_loader else None
+            if stored:
+                row.update((data_column, stored[data_column]) for data_column in self.data_columns
+                           if data_column in stored)
+        return row
+
+    def run_number_of(self, run_id: str) -> Optional[int]:
+        """The number of a run by its run id, None if the run is not in the run table"""
+        if run_id in self.__extra_run_ids:
+            return self.nr_of_base_runs + self.__extra_run_ids[run_id]
+        try:
+            treatment, repetition = run_id.rsplit('_repetition_', 1)
+            treatment, repetition = int(treatment[len('run_'):]), int(repetition)
+        except ValueError:
+            return None
+        if not (0 <= treatment < self.nr_of_treatments and 0 <= repetition < self.repetitions):
+            return None
+        return repetition * self.nr_of_treatments + treatment
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("run table index out of range")
+        return self.run(self.__run_number(position))
+
+    def __setitem__(self, position: int, row: Dict):
+        """Store the updated row of the run at `position`"""
+        self.store(self.__run_number(position), row)
+
+    def store(self, run_number: int, row: Dict):
+        if run_number >= self.nr_of_base_runs:
+            self.__extra_runs[run_number - self.nr_of_base_runs] = row
+            return
+
+        # Done runs that can be read back through the loader (i.e. were persisted) are not kept, only their state
+        done = row['__done'] == RunProgress.DONE
+        self.__set_done(run_number, done)
+        if done and self.completed_row_loader is not None:
+            self.__updated.pop(run_number, None)
+        else:
+            self.__updated[run_number] = row
+
+    def __iter__(self) -> Iterator[Dict]:
+        for position in range(len(self)):
+            yield self.run(self.__run_number(position))
+
+    def append(self, row: Dict):
+        self.__extra_run_ids[row['__run_id']] = len(self.__extra_runs)
+        self.__extra_runs.append(row)
+        if self.__stored_order is not None:
+            self.__stored_order.append(self.nr_of_base_runs + len(self.__extra_runs) - 1)
+
+    def reorder(self, run_numbers: Sequence):
+        """Put the runs in the given order (of run numbers), e.g. the one of a stored run table"""
+        if len(run_numbers) != len(self):
+            raise ValueError("The new order must contain every run exactly once")
+        self.__stored_order = array('q', run_numbers)
+
+    def pending(self) -> Iterator[Tuple[int, Dict]]:
+        """The (1-based position, row) of every run that is not done, in order. Rows are generated as they are
+        consumed; skipping done runs does not generate them."""
+        for position in range(len(self)):
+            run_number = self.__run_number(position)
+            if run_number < self.nr_of_base_runs and self.__is_done(run_number):
+                continue
+            row = self.run(run_number)
+            if row['__done'] != RunProgress.DONE:
+                yield position + 1, row
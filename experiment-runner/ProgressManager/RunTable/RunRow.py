@@ -0,0 +1,162 @@
+import pickle
+import uuid
+import weakref
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+from ExtendedTyping.Typing import SupportsStr
+
+# Layouts by token, so rows can be pickled without their layout (see `RunRow.__reduce__`)
+_LAYOUTS: 'weakref.WeakValueDictionary[str, RowLayout]' = weakref.WeakValueDictionary()
+
+
+class _Deleted:
+    """Marks a deleted column of a row"""
+
+    def __reduce__(self):
+        return '_DELETED'
+
+
+_DELETED = _Deleted()
+
+
+class RowLayout:
+    """The columns of the rows of a run table: the run id, progress, factor levels and data columns. The factor
+    levels of a row are decoded from the (mixed-radix) number of its combination of levels."""
+
+    def __init__(self, factor_names: List[str], levels: List[List[SupportsStr]], data_columns: List[str],
+                 token: Optional[str] = None):
+        self.factor_names = list(factor_names)
+        self.levels = levels
+        self.data_columns = list(data_columns)
+        self.columns = ['__run_id', '__done', *self.factor_names, *self.data_columns]
+
+        self.radices = [len(factor_levels) for factor_levels in levels]
+        self.divisors = [1] * len(levels)
+        for k in reversed(range(len(levels) - 1)):
+            self.divisors[k] = self.divisors[k + 1] * self.radices[k + 1]
+
+        self.value_positions = {column: i for i, column in enumerate(['__run_id', '__done', *self.data_columns])}
+        self.factor_positions = {name: k for k, name in enumerate(self.factor_names)}
+
+        self.token = token or uuid.uuid4().hex[:16]
+        _LAYOUTS[self.token] = self
+
+    def level(self, treatment: int, k: int) -> SupportsStr:
+        return self.levels[k][(treatment // self.divisors[k]) % self.radices[k]]
+
+    def __reduce__(self):
+        return RowLayout._restore, (self.token, self.factor_names, self.levels, self.data_columns)
+
+    @staticmethod
+    def _restore(token: str, factor_names: List[str], levels: List[List[SupportsStr]],
+                 data_columns: List[str]) -> 'RowLayout':
+        return _LAYOUTS.get(token) or RowLayout(factor_names, levels, data_columns, token)
+
+
+def _restore_row(token: str, treatment: int, values: List[Any], extra: Optional[Dict]) -> 'RunRow':
+    layout = _LAYOUTS.get(token)
+    if layout is None:
+        raise pickle.UnpicklingError("The run table of this row is unknown to this process; rows can only be "
+                                     "unpickled where their run table is (e.g. in forked workers)")
+    return RunRow(layout, treatment, values, extra)
+
+
+###     =========================================================
+###     |                                                       |
+###     |                        RunRow                         |
+###     |       - A row of a run table, behaving like the dict  |
+###     |         of its columns (e.g. `context.execute_run`)   |
+###     |       - Factor levels are not stored per row, but     |
+###     |         decoded from the number of the treatment by   |
+###     |         the layout shared by all rows of the table    |
+###     |       - Other columns (set after creation) are kept   |
+###     |         in a dict of extra columns                    |
+###     |                                                       |
+###     |       * Pickled rows refer to their layout by token,  |
+###     |         so (forked) workers receive a few values per  |
+###     |         run instead of every column name and level    |
+###     |                                                       |
+###     =========================================================
+class RunRow(MutableMapping):
+    __slots__ = ('_layout', '_treatment', '_values', '_extra')
+
+    def __init__(self, layout: RowLayout, treatment: int, values: List[Any], extra: Optional[Dict] = None):
+        """`values` are the run id, progress and data columns of the row, in the order of the layout"""
+        self._layout = layout
+        self._treatment = treatment
+        self._values = values
+        self._extra = extra
+
+    def __getitem__(self, column: str) -> Any:
+        extra = self._extra
+        if extra is not None and column in extra:
+            value = extra[column]
+            if value is _DELETED:
+                raise KeyError(column)
+            return value
+
+        layout = self._layout
+        position = layout.value_positions.get(column)
+        if position is not None:
+            return self._values[position]
+        k = layout.factor_positions.get(column)
+        if k is None:
+            raise KeyError(column)
+        return layout.level(self._treatment, k)
+
+    def __setitem__(self, column: str, value: Any):
+        position = self._layout.value_positions.get(column)
+        if position is not None:
+            self._values[position] = value
+            if self._extra is not None:
+                self._extra.pop(column, None)
+            return
+
+        # New columns, and factor levels that are changed, are extra columns
+        if self._extra is None:
+            self._extra = {}
+        self._extra[column] = value
+
+    def __delitem__(self, column: str):
+        self[column]  # raises a KeyError if there is no such column
+        if column in self._layout.value_positions or column in self._layout.factor_positions:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[column] = _DELETED
+        else:
+            del self._extra[column]
+
+    def __iter__(self) -> Iterator[str]:
+        extra = self._extra
+        if not extra:
+            yield from self._layout.columns
+            return
+
+        for column in self._layout.columns:
+            if extra.get(column) is not _DELETED:
+                yield column
+        for column, value in extra.items():
+            if value is not _DELETED and column not in self._layout.value_positions and \
+                    column not in self._layout.factor_positions:
+                yield column
+
+    def __len__(self) -> int:
+        if not self._extra:
+            return len(self._layout.columns)
+        return sum(1 for _ in self)
+
+    def __contains__(self, column) -> bool:
+        if self._extra is not None and column in self._extra:
+            return self._extra[column] is not _DELETED
+        return column in self._layout.value_positions or column in self._layout.factor_positions
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> 'RunRow':
+        return RunRow(self._layout, self._treatment, list(self._values),
+                      dict(self._extra) if self._extra is not None else None)
+
+    def __reduce__(self):
+        return _restore_row, (self._layout.token, self._treatment, self._values, self._extra)
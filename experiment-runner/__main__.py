@@ -4,7 +4,6 @@ import dill as pickle
 import hashlib
 import ast
 from typing import List
-from importlib import util
 import multiprocessing
 
 from ConfigValidator.Config.Models.Metadata import Metadata
@@ -13,16 +12,11 @@ from ConfigValidator.CLIRegister.CLIRegister import CLIRegister
 from ConfigValidator.Config.Validation.ConfigValidator import ConfigValidator
 from ConfigValidator.CustomErrors.ConfigErrors import ConfigInvalidClassNameError
 from ExperimentOrchestrator.Experiment.ExperimentController import ExperimentController
+from ExperimentOrchestrator.Misc.ConfigLoading import load_config_module
 
 def is_no_argument_given(args: List[str]): return (len(args) == 1)
 def is_config_file_given(args: List[str]): return (args[1][-3:] == '.py')
-def load_and_get_config_file_as_module(args: List[str]):
-    module_name = args[1].split('/')[-1].replace('.py', '')
-    spec = util.spec_from_file_location(module_name, args[1]) 
-    config_file = util.module_from_spec(spec)
-    sys.modules[module_name] = config_file
-    spec.loader.exec_module(config_file)
-    return config_file
+def load_and_get_config_file_as_module(args: List[str]): return load_config_module(args[1])
 
 def calc_ast_md5sum(src, name):
     tree = compile(src, name, 'exec', flags=ast.PyCF_ONLY_AST, optimize=0)
@@ -1,136 +1,40 @@
 import subprocess
 import os
+import sys
 
 # ================================ DEFINE YOUR EXPERIMENTS HERE ================================
 
-# Add all the python scripts you want to test to this list.
-SCRIPTS_TO_RUN = [
-    "original/dijkstra_origin.py",
-    "single_guideline/dijkstra_code.py",
-    "single_guideline/dijkstra_multi.py",
-    "single_guideline/dijkstra_native.py",
-    "single_guideline/dijkstra_function.py",
-    "single_guideline/dijkstra_object.py",
-    "single_guideline/dijkstra_network.py",
-    "single_guideline/dijkstra_other.py",
-    "multiple_guideline/dijkstra_mixed.py",
-    "original/floyd_origin.py",
-    "single_guideline/floyd_code.py",
-    "single_guideline/floyd_function.py",
-    "single_guideline/floyd_multi.py",
-    "single_guideline/floyd_native.py",
-    "single_guideline/floyd_object.py",
-    "single_guideline/floyd_other.py",
-    "multiple_guideline/floyd_mixed.py",
-    "multiple_guideline/floyd_code_function.py",
-    "multiple_guideline/floyd_code_native.py",
-    "multiple_guideline/floyd_native_function.py",
-    "original/knapsack_origin.py",
-    "single_guideline/knapsack_code.py",
-    "single_guideline/knapsack_function.py",
-    "single_guideline/knapsack_native.py",
-    "single_guideline/knapsack_object.py",
-    "single_guideline/knapsack_other.py",
-    "multiple_guideline/knapsack_mixed.py",
-    "multiple_guideline/knapsack_code_function.py",
-    "multiple_guideline/knapsack_code_native.py",
-    "multiple_guideline/knapsack_native_function.py",
-    "original/edit_distance_origin.py",
-    "single_guideline/edit_distance_code.py",
-    "single_guideline/edit_distance_function.py",
-    "single_guideline/edit_distance_native.py",
-    "single_guideline/edit_distance_object.py",
-    "single_guideline/edit_distance_other.py",
-    "multiple_guideline/edit_distance_mixed.py",
-    "multiple_guideline/edit_distance_code_function.py",
-    "multiple_guideline/edit_distance_code_native.py",
-    "multiple_guideline/edit_distance_native_function.py",
-    "original/longest_common_subsequence_origin.py",
-    "single_guideline/longest_common_subsequence_code.py",
-    "single_guideline/longest_common_subsequence_function.py",
-    "single_guideline/longest_common_subsequence_native.py",
-    "single_guideline/longest_common_subsequence_object.py",
-    "single_guideline/longest_common_subsequence_other.py",
-    "multiple_guideline/longest_common_subsequence_mixed.py",
-    "original/matrix_chain_multiplication_origin.py",
-    "single_guideline/matrix_chain_multiplication_code.py",
-    "single_guideline/matrix_chain_multiplication_function.py",
-    "single_guideline/matrix_chain_multiplication_native.py",
-    "single_guideline/matrix_chain_multiplication_object.py",
-    "single_guideline/matrix_chain_multiplication_other.py",
-    "multiple_guideline/matrix_chain_multiplication_mixed.py",
-    "original/matrix_chain_order_origin.py",
-    "single_guideline/matrix_chain_order_code.py",
-    "single_guideline/matrix_chain_order_function.py",
-    "single_guideline/matrix_chain_order_native.py",
-    "single_guideline/matrix_chain_order_object.py",
-    "single_guideline/matrix_chain_order_other.py",
-    "multiple_guideline/matrix_chain_order_mixed.py",
-    "original/rod_cutting_origin.py",
-    "single_guideline/rod_cutting_code.py",
-    "single_guideline/rod_cutting_function.py",
-    "single_guideline/rod_cutting_native.py",
-    "single_guideline/rod_cutting_object.py",
-    "single_guideline/rod_cutting_other.py",
-    "multiple_guideline/rod_cutting_mixed.py",
-    "original/fibonacci_origin.py",
-    "single_guideline/fibonacci_code.py",
-    "single_guideline/fibonacci_native.py",
-    "single_guideline/fibonacci_object.py",
-    "single_guideline/fibonacci_other.py",
-    "multiple_guideline/fibonacci_mixed.py",
-    "multiple_guideline/fibonacci_code_func.py",
-    "multiple_guideline/fibonacci_code_native.py",
-    "multiple_guideline/fibonacci_native_function.py",
-    "original/levenshtein_distance_origin.py",
-    "single_guideline/levenshtein_distance_code.py",
-    "single_guideline/levenshtein_distance_function.py",
-    "single_guideline/levenshtein_distance_native.py",
-    "single_guideline/levenshtein_distance_object.py",
-    "single_guideline/levenshtein_distance_other.py",
-    "multiple_guideline/levenshtein_distance_mixed.py"
-]
+# The script suite (the `script` factor) is defined in the config itself, see `SCRIPTS_TO_RUN` in
+# examples/energibridge-profiling/RunnerConfig.py. All scripts run as a single experiment, loading and
+# validating the config once and producing one consolidated run table.
+CONFIG = "examples/energibridge-profiling/RunnerConfig.py"
 
 # ==============================================================================================
 
 
-def run_experiment(script_name: str):
-    """Sets the environment variable and runs the experiment for a single script."""
-    print("="*60)
-    print(f"🚀 Starting experiment for: {script_name}")
-    print("="*60)
-    
-    # Copy the current environment and set the SCRIPT_TO_RUN variable
-    # This tells RunnerConfig.py which script to use.
+def run_suite(scripts: list):
+    """Runs the whole suite (or the given subset of scripts) as one experiment."""
     env = os.environ.copy()
-    env["SCRIPT_TO_RUN"] = script_name
-    
-    # Define the command to run the experiment runner
-    # Make sure this path is correct for your project structure.
-    command = [
-        "python",
-        "experiment-runner/",
-        "examples/energibridge-profiling/RunnerConfig.py"
-    ]
-    
+    if scripts:
+        # Restricts the `script` factor of the config to these treatments
+        env["SCRIPTS"] = ",".join(scripts)
+
+    command = [sys.executable, "experiment-runner/", CONFIG]
+
     try:
-        # Run the command with the modified environment
-        # `check=True` will raise an error if the experiment fails
         subprocess.run(command, env=env, check=True)
-        print(f"\n✅ Experiment for {script_name} completed successfully.")
-        
+        print("\n✅ All experiments have been completed!")
+
     except FileNotFoundError:
         print(f"❌ Error: Could not find the runner script at '{' '.join(command)}'.")
         print("Please check if the path is correct.")
-        
+
     except subprocess.CalledProcessError as e:
-        print(f"\n❌ Experiment for {script_name} failed with exit code {e.returncode}.")
-        
-    print("-" * 60 + "\n")
+        print(f"\n❌ Experiment suite failed with exit code {e.returncode}.")
+        print("Re-run the same command to resume the remaining runs.")
+        sys.exit(e.returncode)
 
 
 if __name__ == "__main__":
-    print("Starting batch of experiments...")
-    for script in SCRIPTS_TO_RUN:
-        run_experiment(script)
-    print("🎉 All experiments have been completed!")
\ No newline at end of file
+    # Usage: python run_experiment.py [script ...]
+    run_suite(sys.argv[1:])
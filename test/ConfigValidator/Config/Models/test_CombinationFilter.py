@@ -0,0 +1,78 @@
+import itertools
+import random
+import time
+import unittest
+
+from ConfigValidator.Config.Models.CombinationFilter import CombinationFilter
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+
+class TestCombinationFilter(unittest.TestCase):
+    def setUp(self):
+        self.threads = FactorModel("threads", [1, 2, 4, 8])
+        self.cores = FactorModel("cores", [2, 4])
+        self.mode = FactorModel("mode", ['fast', 'slow', 'safe'])
+        self.factors = [self.threads, self.cores, self.mode]
+
+    def included(self, exclusions):
+        treatments = CombinationFilter(self.factors, exclusions).included_treatments()
+        combinations = list(itertools.product(*[factor.treatments for factor in self.factors]))
+        return [combinations[number] for number in treatments]
+
+    def brute_force(self, exclusions):
+        names = [factor.factor_name for factor in self.factors]
+        included = []
+        for combination in itertools.product(*[factor.treatments for factor in self.factors]):
+            row = dict(zip(names, combination))
+            if not any(exclusion(row) if callable(exclusion) else
+                       all(row[factor.factor_name] in levels for factor, levels in exclusion.items())
+                       for exclusion in exclusions):
+                included.append(combination)
+        return included
+
+    def test_nothing_excluded(self):
+        self.assertIsNone(CombinationFilter(self.factors, []).included_treatments())
+
+    def test_dict_exclusions(self):
+        exclusions = [{self.threads: [1]}, {self.cores: [4], self.mode: ['safe']}]
+        self.assertEqual(self.included(exclusions), self.brute_force(exclusions))
+
+    def test_predicates(self):
+        exclusions = [lambda row: row['threads'] > row['cores'],
+                      lambda row: row.get('mode') == 'slow' and row['threads'] == 2,
+                      {self.mode: ['fast']}]
+        self.assertEqual(self.included(exclusions), self.brute_force(exclusions))
+        self.assertEqual(self.included([lambda row: True]), [])
+
+    def test_random_exclusions(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            exclusions = [{factor: rng.sample(factor.treatments, rng.randint(1, len(factor.treatments)))
+                           for factor in rng.sample(self.factors, rng.randint(1, 3))}
+                          for _ in range(rng.randint(1, 4))]
+            self.assertEqual(self.included(exclusions), self.brute_force(exclusions))
+
+    def test_excluded_subtrees_are_skipped(self):
+        factors = [FactorModel(f"factor{i}", list(range(10))) for i in range(9)]
+        start = time.monotonic()
+        treatments = CombinationFilter(factors, [{factors[0]: [0, 1]}, {factors[1]: [5], factors[2]: [5]},
+                                                 lambda row: row['factor0'] + row['factor1'] > 14]
+                                       ).included_treatments()
+        self.assertLess(time.monotonic() - start, 1)
+        # 70 of the 80 (factor0, factor1) pairs remain, 8 of which have factor1 = 5
+        self.assertEqual(len(treatments), 70 * 10 ** 7 - 8 * 10 ** 6)
+        self.assertLess(treatments.nr_of_ranges, 100)
+        self.assertEqual(treatments[0], 2 * 10 ** 8)
+
+    def test_unknown_factor(self):
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[self.threads], exclude_combinations=[{self.cores: [2]}])
+        with self.assertRaises(KeyError):
+            RunTableModel(factors=[self.threads], exclude_combinations=[lambda row: row['cores'] > 2]) \
+                .generate_experiment_run_table()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import itertools
+import unittest
+from collections import Counter
+
+from ConfigValidator.Config.Models.ExperimentalDesign import ExperimentalDesign, FractionalFactorial, \
+    LatinHypercube, PlackettBurman, SobolSequence
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.CustomErrors.BaseError import BaseError
+
+
+def two_level_factors(k):
+    return [FactorModel(f"factor{i}", ['low', 'high']) for i in range(k)]
+
+
+def signs(points):
+    return [[1 if level else -1 for level in point] for point in points]
+
+
+def orthogonal(matrix):
+    columns = list(zip(*matrix))
+    return all(sum(column) == 0 for column in columns) and \
+        all(sum(a * b for a, b in zip(x, y)) == 0 for x, y in itertools.combinations(columns, 2))
+
+
+class TestTwoLevelDesigns(unittest.TestCase):
+    def test_half_fraction(self):
+        factors = two_level_factors(5)
+        points = signs(FractionalFactorial(1).points(factors))
+        self.assertEqual(len(points), 16)
+        self.assertEqual(len(set(map(tuple, points))), 16)
+        self.assertTrue(orthogonal(points))
+        self.assertTrue(all(e == a * b * c * d for a, b, c, d, e in points))
+
+    def test_generators(self):
+        a, b, c, d = factors = two_level_factors(4)
+        points = signs(FractionalFactorial(1, {b: [a, c, d]}).points(factors))
+        self.assertEqual(len(points), 8)
+        self.assertTrue(all(y == x * z * w for x, y, z, w in points))
+
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=factors, design=FractionalFactorial(1, {b: [a, FactorModel("other", [0, 1])]}))
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=factors, design=FractionalFactorial(2, {b: [a], c: [b]}))
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=two_level_factors(3), design=FractionalFactorial(3))
+
+    def test_alias_structure(self):
+        a, b, c, d, e, f = factors = [FactorModel(name, [0, 1]) for name in "abcdef"]
+        # 2^(6-2) of minimum aberration: E = ABC, F = BCD
+        design = FractionalFactorial(2)
+        self.assertEqual(design.defining_relation(factors), [('a', 'b', 'c', 'e'), ('a', 'd', 'e', 'f'),
+                                                             ('b', 'c', 'd', 'f')])
+        self.assertEqual(design.resolution(factors), 4)
+        self.assertTrue(orthogonal(signs(design.points(factors))))
+
+        # The highest-order interactions E = ABCD, F = ABC would alias C with DEF, but D with EF (resolution III)
+        self.assertEqual(FractionalFactorial(2, {e: [a, b, c, d], f: [a, b, c]}).resolution(factors), 3)
+        self.assertEqual(FractionalFactorial(3).resolution(two_level_factors(10)), 5)
+        self.assertEqual(FractionalFactorial(1).resolution(two_level_factors(12)), 12)
+        self.assertIsNone(FractionalFactorial(0).resolution(factors))
+
+        # Two main effects would be aliased
+        for generators in [{e: [a], f: [b, c]}, {e: [a, b], f: [b, a]}]:
+            with self.assertRaises(BaseError):
+                RunTableModel(factors=factors, design=FractionalFactorial(2, generators))
+
+    def test_plackett_burman(self):
+        for runs in [4, 8, 12, 16, 20, 24, 32]:
+            matrix = PlackettBurman.matrix(runs)
+            self.assertEqual((len(matrix), len(matrix[0])), (runs, runs - 1))
+            self.assertTrue(orthogonal(matrix), runs)
+
+        self.assertEqual(PlackettBurman().nr_of_runs(7), 8)
+        self.assertEqual(PlackettBurman().nr_of_runs(9), 12)
+        self.assertEqual(PlackettBurman().nr_of_runs(21), 24)
+        self.assertEqual(len(list(PlackettBurman().points(two_level_factors(11)))), 12)
+        with self.assertRaises(BaseError):
+            PlackettBurman(28)
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=two_level_factors(8), design=PlackettBurman(8))
+
+    def test_two_levels_required(self):
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[FactorModel("threads", [1, 2, 4])] + two_level_factors(2),
+                          design=PlackettBurman())
+
+
+class TestSpaceFillingDesigns(unittest.TestCase):
+    def setUp(self):
+        self.factors = [FactorModel("frequency", list(range(3000, 800, -10))), FactorModel("threads", [1, 2, 4, 8]),
+                        FactorModel("load", [0.25, 0.5, 0.75, 1.0])]
+
+    def test_latin_hypercube(self):
+        factors = [FactorModel(f"factor{i}", list(range(20))) for i in range(4)]
+        points = list(LatinHypercube(20, seed=3).points(factors))
+        for k in range(4):
+            self.assertEqual(sorted(point[k] for point in points), list(range(20)))
+        self.assertEqual(points, list(LatinHypercube(20, seed=3).points(factors)))
+
+    def test_sobol_is_balanced(self):
+        factors = [FactorModel(f"factor{i}", list(range(16))) for i in range(21)]
+        for scramble in [False, True]:
+            points = list(SobolSequence(16, scramble=scramble).points(factors))
+            for k in range(21):
+                self.assertEqual(sorted(point[k] for point in points), list(range(16)), k)
+            # The first two dimensions form a (0, 4, 2)-net: every 4x4 grid cell holds exactly one point
+            self.assertEqual(len({(point[0] // 4, point[1] // 4) for point in points}), 16)
+
+        unscrambled = list(SobolSequence(4, scramble=False).points(factors[:2]))
+        self.assertEqual(unscrambled, [(0, 0), (8, 8), (12, 4), (4, 12)])
+
+    def test_levels_are_ordered(self):
+        points = list(LatinHypercube(220).points(self.factors[:1]))
+        # Every stratum of 10 MHz is sampled once, regardless of the (decreasing) order of the levels
+        self.assertEqual(len(set(points)), 220)
+
+    def test_numeric_factors_required(self):
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[FactorModel("cached", [True, False])], design=SobolSequence(8))
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[FactorModel(f"factor{i}", [1, 2]) for i in range(22)], design=SobolSequence(8))
+
+    def test_incomplete_design(self):
+        class Incomplete(ExperimentalDesign):
+            def validate(self, factors):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_run_table(self):
+        model = RunTableModel(factors=self.factors, repetitions=2, data_columns=['energy'],
+                              exclude_combinations=[{self.factors[1]: [8]}], design=SobolSequence(64))
+        run_table = model.generate_experiment_run_table()
+
+        treatments = Counter(tuple(run[factor.factor_name] for factor in self.factors) for run in run_table)
+        self.assertEqual(set(treatments.values()), {2})
+        self.assertTrue(48 - 8 <= len(treatments) <= 48)
+        self.assertNotIn(8, {threads for _, threads, _ in treatments})
+        self.assertEqual(run_table[len(treatments)]['__run_id'], 'run_0_repetition_1')
+
+        # The same design is generated again, e.g. when the experiment is restarted
+        self.assertEqual(list(run_table), list(model.generate_experiment_run_table()))
+
+
+if __name__ == '__main__':
+    unittest.main()
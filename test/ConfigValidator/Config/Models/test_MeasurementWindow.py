@@ -0,0 +1,71 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from ConfigValidator.Config.Models.MeasurementWindow import MeasurementWindow
+from ProgressManager.Output.SampleStore import SampleWriter, read_samples
+
+SECOND = 10 ** 9
+
+
+class TestMeasurementWindow(unittest.TestCase):
+    def setUp(self):
+        # 12:00:00.5 to 12:00:10.5 (UTC) of some day
+        self.start = 1_700_000_000 * SECOND + SECOND // 2
+        self.window = MeasurementWindow(self.start, self.start + 10 * SECOND, 1000, 1000 + 10 * SECOND)
+
+    def test_anchors(self):
+        window = MeasurementWindow()
+        with self.assertRaises(RuntimeError):
+            window.mark_stop()
+
+        window.mark_start()
+        self.assertTrue(window.started and not window.stopped)
+        self.assertLessEqual(abs(window.start_ns - time.time_ns()), SECOND)
+        time.sleep(0.01)
+        window.mark_stop()
+        self.assertGreaterEqual(window.duration_ns, 10 ** 7)
+        self.assertEqual(window.to_wall_ns(window.stop_perf_ns) - window.start_ns, window.duration_ns)
+
+    def test_clip_timestamps(self):
+        # EnergiBridge: milliseconds since the epoch
+        times = [(self.start + i * SECOND // 4) // 10 ** 6 for i in range(-4, 45)]
+        clipped = self.window.clip({'Time': times, 'energy': range(len(times))}, 'Time', 'ms')
+        self.assertEqual(list(clipped['energy']), list(range(4, 45)))
+
+        # NvidiaML: microseconds
+        clipped = self.window.clip({'t': [t * 1000 for t in times], 'power': times}, 't', 'us')
+        self.assertEqual(len(clipped), 41)
+
+    def test_clip_date_times(self):
+        # PicoCM3: local time with a resolution of seconds, so the sample of 12:00:00 may be from 12:00:00.9
+        stamps = [datetime.fromtimestamp(self.start // SECOND + i).isoformat(" ", "seconds") for i in range(-2, 13)]
+        clipped = self.window.clip({'timestamp': stamps, 'channel_1': range(-2, 13)}, 'timestamp', 's')
+        self.assertEqual(list(clipped['channel_1']), list(range(0, 11)))
+
+    def test_clip_sample_interval(self):
+        # ps: no timestamps, a sample every second from the start of the source
+        clipped = self.window.clip({'cpu': range(20)}, time_unit='s', origin_ns=self.start - 3 * SECOND,
+                                   sample_interval=1)
+        self.assertEqual(list(clipped['cpu']), list(range(3, 14)))
+        with self.assertRaises(ValueError):
+            self.window.clip({'cpu': range(20)})
+
+    def test_samples_within_window(self):
+        with tempfile.TemporaryDirectory() as run_dir:
+            self.window.write(Path(run_dir))
+            with SampleWriter(Path(run_dir)) as writer:
+                writer.extend('nvml', 'power', np.arange(20), self.start + (np.arange(20) - 5) * SECOND)
+
+            window = MeasurementWindow.read(Path(run_dir))
+            timestamps, values = read_samples(Path(run_dir)).within(window).select('nvml', 'power')
+            self.assertEqual(list(values), list(range(5, 16)))
+            self.assertIsNone(MeasurementWindow.read(Path(run_dir) / 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import itertools
 
 from ConfigValidator.Config.Models.FactorModel import FactorModel
 from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.Config.Models.SchedulingStrategy import SchedulingStrategy
 from ConfigValidator.CustomErrors.BaseError import BaseError
 from ProgressManager.RunTable.Models.RunProgress import RunProgress
 
@@ -88,5 +89,58 @@ class TestRunTableModelExclusions(unittest.TestCase):
             ])
 
 
+class TestRunTableModelScheduling(unittest.TestCase):
+    def generate(self, scheduling, treatments=4, repetitions=8):
+        return RunTableModel(
+            factors=[FactorModel("example_factor1", list(range(treatments)))],
+            repetitions=repetitions,
+            scheduling=scheduling
+        ).generate_experiment_run_table()
+
+    def blocks(self, table, treatments):
+        return [table[i:i + treatments] for i in range(0, len(table), treatments)]
+
+    def test_sequential(self):
+        table = self.generate(SchedulingStrategy.SEQUENTIAL)
+        self.assertEqual([run['example_factor1'] for run in table[:8]], [0] * 8)
+
+    def test_round_robin_is_default(self):
+        table = RunTableModel(factors=[FactorModel("example_factor1", [0, 1, 2])], repetitions=2) \
+            .generate_experiment_run_table()
+        self.assertEqual([run['example_factor1'] for run in table], [0, 1, 2, 0, 1, 2])
+
+    def test_randomized_blocks(self):
+        table = self.generate(SchedulingStrategy.RANDOMIZED_BLOCKS)
+        for j, block in enumerate(self.blocks(table, 4)):
+            self.assertEqual(sorted(run['example_factor1'] for run in block), [0, 1, 2, 3])
+            self.assertTrue(all(run['__run_id'].endswith(f'_repetition_{j}') for run in block))
+
+    def test_latin_square_balance(self):
+        for treatments in [3, 4, 5]:
+            repetitions = treatments * (2 if treatments % 2 else 1)
+            table = self.generate(SchedulingStrategy.LATIN_SQUARE, treatments, repetitions)
+            blocks = self.blocks(table, treatments)
+
+            # Every treatment takes every position equally often
+            for position in range(treatments):
+                levels = [block[position]['example_factor1'] for block in blocks]
+                for level in range(treatments):
+                    self.assertEqual(levels.count(level), len(blocks) // treatments)
+
+            # Every treatment directly follows every other treatment equally often
+            successions = {}
+            for block in blocks:
+                for a, b in zip(block, block[1:]):
+                    pair = (a['example_factor1'], b['example_factor1'])
+                    successions[pair] = successions.get(pair, 0) + 1
+            self.assertEqual(len(successions), treatments * (treatments - 1))
+            self.assertEqual(len(set(successions.values())), 1)
+
+    def test_shuffle_conflict(self):
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[FactorModel("example_factor1", [0, 1])], shuffle=True,
+                          scheduling=SchedulingStrategy.SEQUENTIAL)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+
+
+class TestEventSubscriptionController(unittest.TestCase):
+    def setUp(self):
+        self.register = dict(EventSubscriptionController._EventSubscriptionController__call_back_register)
+
+    def tearDown(self):
+        EventSubscriptionController._EventSubscriptionController__call_back_register.clear()
+        EventSubscriptionController._EventSubscriptionController__call_back_register.update(self.register)
+
+    def test_sync_callback(self):
+        EventSubscriptionController.subscribe_to_single_event(RunnerEvents.POPULATE_RUN_DATA, lambda ctx: {'a': ctx})
+
+        self.assertFalse(EventSubscriptionController.is_async_event(RunnerEvents.POPULATE_RUN_DATA))
+        self.assertEqual(EventSubscriptionController.raise_event(RunnerEvents.POPULATE_RUN_DATA, 1), {'a': 1})
+        self.assertEqual(asyncio.run(EventSubscriptionController.raise_event_async(RunnerEvents.POPULATE_RUN_DATA, 2)),
+                         {'a': 2})
+
+    def test_async_callback(self):
+        async def populate_run_data(ctx):
+            await asyncio.sleep(0)
+            return {'a': ctx}
+
+        EventSubscriptionController.subscribe_to_single_event(RunnerEvents.POPULATE_RUN_DATA, populate_run_data)
+
+        self.assertTrue(EventSubscriptionController.is_async_event(RunnerEvents.POPULATE_RUN_DATA))
+        self.assertEqual(EventSubscriptionController.raise_event(RunnerEvents.POPULATE_RUN_DATA, 1), {'a': 1})
+        self.assertEqual(asyncio.run(EventSubscriptionController.raise_event_async(RunnerEvents.POPULATE_RUN_DATA, 2)),
+                         {'a': 2})
+
+    def test_unsubscribed_event(self):
+        EventSubscriptionController._EventSubscriptionController__call_back_register.pop(RunnerEvents.CONTINUE, None)
+        self.assertIsNone(EventSubscriptionController.raise_event(RunnerEvents.CONTINUE))
+        self.assertFalse(EventSubscriptionController.is_async_event(RunnerEvents.CONTINUE))
+
+
+    def test_multiple_subscribers(self):
+        calls = []
+        EventSubscriptionController.subscribe_to_single_event(RunnerEvents.POPULATE_RUN_DATA,
+                                                              lambda ctx: calls.append('config') or {'a': 1, 'b': 1})
+        EventSubscriptionController.subscribe(RunnerEvents.POPULATE_RUN_DATA,
+                                              lambda ctx: calls.append('late') or {'b': 2}, priority=-1)
+        EventSubscriptionController.subscribe(RunnerEvents.POPULATE_RUN_DATA,
+                                              lambda ctx: calls.append('early'), priority=1, key='early')
+
+        self.assertEqual(EventSubscriptionController.raise_event(RunnerEvents.POPULATE_RUN_DATA, 1), {'a': 1, 'b': 2})
+        self.assertEqual(calls, ['early', 'config', 'late'])
+        timings = EventSubscriptionController.get_timings(RunnerEvents.POPULATE_RUN_DATA)
+        self.assertEqual(len(timings), 3)
+        self.assertIn('early', timings)
+        self.assertIn('config', timings)
+
+    def test_resubscribing_replaces(self):
+        calls = []
+        EventSubscriptionController.subscribe_to_single_event(RunnerEvents.CONTINUE, lambda: calls.append(1))
+        EventSubscriptionController.subscribe_to_single_event(RunnerEvents.CONTINUE, lambda: calls.append(2))
+        callback = lambda: calls.append(3)
+        EventSubscriptionController.subscribe(RunnerEvents.CONTINUE, callback)
+        EventSubscriptionController.subscribe(RunnerEvents.CONTINUE, callback, priority=1)
+
+        EventSubscriptionController.raise_event(RunnerEvents.CONTINUE)
+        self.assertEqual(calls, [3, 2])
+
+        EventSubscriptionController.unsubscribe(RunnerEvents.CONTINUE, callback)
+        self.assertEqual(len(EventSubscriptionController.get_subscribers(RunnerEvents.CONTINUE)), 1)
+
+    def test_concurrent_subscribers(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait(ctx):
+            barrier.wait()  # only returns once all three subscribers are running
+            return {threading.current_thread().name: ctx}
+
+        async def wait_async(ctx):
+            await asyncio.to_thread(barrier.wait)
+
+        for i in range(2):
+            EventSubscriptionController.subscribe(RunnerEvents.START_MEASUREMENT, wait, concurrent=True, key=i)
+        EventSubscriptionController.subscribe(RunnerEvents.START_MEASUREMENT, wait_async, concurrent=True)
+
+        self.assertEqual(len(EventSubscriptionController.raise_event(RunnerEvents.START_MEASUREMENT, 1)), 2)
+        barrier.reset()
+        self.assertEqual(len(asyncio.run(EventSubscriptionController.raise_event_async(RunnerEvents.START_MEASUREMENT,
+                                                                                      1))), 2)
+        self.assertTrue(EventSubscriptionController.is_async_event(RunnerEvents.START_MEASUREMENT))
+
+    def test_timings(self):
+        EventSubscriptionController.subscribe(RunnerEvents.STOP_RUN, lambda: time.sleep(0.05), key='sleep')
+        EventSubscriptionController.raise_event(RunnerEvents.STOP_RUN)
+        self.assertGreaterEqual(EventSubscriptionController.get_timings(RunnerEvents.STOP_RUN)['sleep'], 50_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ExperimentOrchestrator.Analysis.HypothesisTests import SignedRanks, compare_paired, hypothesis_table, \
+    with_run_id_columns
+
+
+class TestSignedRanks(unittest.TestCase):
+    def test_exact_p_value(self):
+        ranks = SignedRanks([1, 2, 3, 4, 5])
+        self.assertEqual(ranks.wilcoxon_p_value(), 2 / 2 ** 5)
+        self.assertEqual(ranks.rank_biserial(), 1)
+
+        # W+ = 1 + 4 = 5 of 15: P(W+ <= 5) = 10 / 32
+        ranks = SignedRanks([1, -2, -3, 4, -5, 0])
+        self.assertEqual(ranks.n, 5)
+        self.assertEqual(ranks.wilcoxon_p_value(), 2 * 10 / 2 ** 5)
+        self.assertAlmostEqual(ranks.rank_biserial(), (5 - 10) / 15)
+
+    def test_normal_approximation_with_ties(self):
+        ranks = SignedRanks([1, 1, -2, 3, 3, 3])
+        # Ranks: 1.5, 1.5, -3, 5, 5, 5
+        self.assertEqual(ranks.positive_rank_sum, 18)
+        variance = 6 * 7 * 13 / 24 - ((2 ** 3 - 2) + (3 ** 3 - 3)) / 48
+        z = (3 - 21 / 2) / math.sqrt(variance)
+        self.assertAlmostEqual(ranks.wilcoxon_p_value(), math.erfc(abs(z) / math.sqrt(2)))
+
+    def test_bootstrap_ranks_every_resample(self):
+        ranks = SignedRanks(np.round(np.random.default_rng(1).normal(0.2, 1, 60), 1))
+        resampled = ranks.bootstrap_rank_biserial(5, np.random.default_rng(2))
+
+        indices = np.random.default_rng(2).integers(0, ranks.n, size=(5, ranks.n))
+        expected = [SignedRanks(ranks.differences[row]).rank_biserial() for row in indices]
+        np.testing.assert_allclose(resampled, expected)
+
+
+class TestHypothesisTable(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        rows = []
+        for algo in ['dijkstra', 'fibonacci']:
+            for repetition in range(1, 21):
+                base = rng.uniform(50, 100)
+                rows.append((algo, repetition, 'origin', base))
+                rows.append((algo, repetition, 'native', base * 0.5))
+                rows.append((algo, repetition, 'other', base + rng.normal(0, 1)))
+        rows.append(('dijkstra', 99, 'network', 1.0))  # no baseline to pair with
+        self.data = pd.DataFrame(rows, columns=['base_algo', 'repetition', 'optimize_method', 'cpu_energy_j'])
+
+    def test_table(self):
+        table = hypothesis_table(self.data, 'cpu_energy_j', 'optimize_method', 'origin', ['base_algo', 'repetition'],
+                                 n_bootstrap=500, max_workers=1).set_index('optimize_method')
+
+        self.assertEqual(list(table.columns),
+                         ['N', 'mean', 'median', 'std', 'N_pairs', 'p_value', 'rank_biserial_r', 'r_95%CI'])
+        self.assertEqual(table.loc['native', 'N_pairs'], 40)
+        self.assertEqual(table.loc['native', 'rank_biserial_r'], -1)
+        self.assertLess(table.loc['native', 'p_value'], 1e-6)
+        self.assertEqual(table.loc['native', 'r_95%CI'], '[-1.000, -1.000]')
+        self.assertGreater(table.loc['other', 'p_value'], 1e-3)
+        self.assertEqual(table.loc['network', 'r_95%CI'], 'n/a')
+        self.assertTrue(math.isnan(table.loc['origin', 'p_value']))
+
+    def test_run_table(self):
+        # As stored by experiments: the repetition is only part of the run id
+        rows = []
+        for repetition in range(10):
+            for treatment, (algo, method) in enumerate([('dijkstra', 'origin'), ('dijkstra', 'native'),
+                                                        ('fibonacci', 'origin'), ('fibonacci', 'native')]):
+                energy = 100 + 10 * repetition + (0 if method == 'origin' else -5 - treatment)
+                rows.append((f'run_{treatment}_repetition_{repetition}', 'DONE', algo, method, energy))
+        run_table = pd.DataFrame(rows, columns=['__run_id', '__done', 'base_algo', 'optimize_method', 'cpu_energy_j'])
+
+        derived = with_run_id_columns(run_table)
+        self.assertEqual(list(derived.loc[5, ['treatment', 'repetition']]), ['run_1', 1])
+        self.assertNotIn('repetition', run_table.columns)
+
+        table = hypothesis_table(run_table, 'cpu_energy_j', 'optimize_method', 'origin', ['base_algo', 'repetition'],
+                                 n_bootstrap=200, max_workers=1).set_index('optimize_method')
+        self.assertEqual(table.loc['native', 'N_pairs'], 20)
+        self.assertEqual(table.loc['native', 'rank_biserial_r'], -1)
+
+    def test_missing_baseline(self):
+        with self.assertRaises(ValueError):
+            hypothesis_table(self.data, 'cpu_energy_j', 'optimize_method', 'none', ['base_algo'])
+
+    def test_independent_of_process_pool(self):
+        differences = [np.random.default_rng(i).normal(0.1, 1, 30) for i in range(6)]
+        self.assertEqual(compare_paired(differences, n_bootstrap=200, max_workers=1),
+                         compare_paired(differences, n_bootstrap=200, max_workers=3))
+
+
+if __name__ == '__main__':
+    unittest.main()
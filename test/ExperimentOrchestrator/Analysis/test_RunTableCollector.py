@@ -0,0 +1,70 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from ExperimentOrchestrator.Analysis.RunTableCollector import RunTableCollector, experiment_name_of
+
+
+class TestRunTableCollector(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.output_file = self.root / 'combined.csv'
+        self.write_run_table('fibonacci_origin_experiment_20250928_182051', [1.5, 2.5])
+        self.write_run_table('fibonacci_native_experiment_20250928_183000', [0.5])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_run_table(self, folder, energies):
+        (self.root / folder).mkdir(exist_ok=True)
+        pd.DataFrame({'__run_id': [f'run_{i}_repetition_0' for i in range(len(energies))],
+                      'cpu_energy_j': energies}).to_csv(self.root / folder / 'run_table.csv', index=False)
+
+    def test_experiment_name(self):
+        self.assertEqual(experiment_name_of('dijkstra_code_experiment_20250928_124701'), 'dijkstra_code_experiment')
+        self.assertEqual(experiment_name_of('my_experiment'), 'my_experiment')
+
+    def test_collect(self):
+        manifest = RunTableCollector(self.root, self.output_file).collect()
+        self.assertEqual((manifest['rows'], manifest['changed']), (3, 2))
+
+        combined = pd.read_csv(self.output_file)
+        self.assertEqual(list(combined.columns), ['experiment_name', '__run_id', 'cpu_energy_j'])
+        self.assertEqual(sorted(combined['experiment_name'].unique()),
+                         ['fibonacci_native_experiment', 'fibonacci_origin_experiment'])
+
+    def test_incremental(self):
+        RunTableCollector(self.root, self.output_file).collect()
+        self.assertEqual(RunTableCollector(self.root, self.output_file).collect()['changed'], 0)
+
+        self.write_run_table('fibonacci_native_experiment_20250928_183000', [0.5, 0.75])
+        self.write_run_table('fibonacci_other_experiment_20250928_184205', [3.0])
+        manifest = RunTableCollector(self.root, self.output_file).collect()
+        self.assertEqual((manifest['rows'], manifest['changed']), (5, 2))
+        self.assertEqual(len(pd.read_csv(self.output_file)), 5)
+
+        (self.root / 'fibonacci_other_experiment_20250928_184205' / 'run_table.csv').unlink()
+        manifest = RunTableCollector(self.root, self.output_file).collect()
+        self.assertEqual(len(manifest['files']), 2)
+        self.assertEqual(len(pd.read_csv(self.output_file)), 4)
+
+    def test_unreadable_run_table(self):
+        (self.root / 'broken_experiment').mkdir()
+        (self.root / 'broken_experiment' / 'run_table.csv').write_text('')
+        manifest = RunTableCollector(self.root, self.output_file).collect()
+        self.assertEqual((len(manifest['files']), manifest['rows']), (2, 3))
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "requires pyarrow")
+    def test_parquet(self):
+        collector = RunTableCollector(self.root)
+        collector.collect()
+        self.assertEqual(collector.output_file.suffix, '.parquet')
+        self.assertEqual(pd.read_parquet(collector.output_file)['cpu_energy_j'].sum(), 4.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import signal
+import time
+import unittest
+
+from ExperimentOrchestrator.Architecture.RunProcess import RunProcess, RunTerminatedError
+from ExperimentOrchestrator.Architecture.WorkerPool import WorkerDiedError
+
+
+def terminable_sleep(seconds):
+    def on_terminate(signum, frame):
+        raise RunTerminatedError()
+
+    signal.signal(signal.SIGTERM, on_terminate)
+    time.sleep(seconds)
+
+
+class TestRunProcess(unittest.TestCase):
+    def test_result(self):
+        handle = RunProcess(lambda: {'pid': os.getpid(), 'data': 'x' * 1000000})
+        handle.wait()
+
+        self.assertIsNone(handle.error)
+        self.assertNotEqual(handle.result['pid'], os.getpid())
+        self.assertEqual(len(handle.result['data']), 1000000)
+
+    def test_error(self):
+        handle = RunProcess(lambda: 1 / 0)
+        handle.wait()
+
+        self.assertIsNone(handle.result)
+        self.assertEqual(handle.error[0], 'ZeroDivisionError')
+
+    def test_own_process_group(self):
+        handle = RunProcess(lambda: os.getpgrp())
+        handle.wait()
+        self.assertNotEqual(handle.result, os.getpgrp())
+
+    def test_terminate_lets_run_clean_up(self):
+        handle = RunProcess(lambda: terminable_sleep(10))
+        start = time.monotonic()
+        handle.wait(timeout_in_ms=200, kill_grace_period_in_ms=5000)
+
+        self.assertTrue(handle.terminated)
+        self.assertEqual(handle.error[0], 'RunTerminatedError')
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_kill_after_grace_period(self):
+        def ignore_termination():
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            time.sleep(10)
+
+        handle = RunProcess(ignore_termination)
+        start = time.monotonic()
+        handle.wait(timeout_in_ms=100, kill_grace_period_in_ms=100)
+
+        self.assertEqual(handle.error[0], WorkerDiedError.__name__)
+        self.assertLess(time.monotonic() - start, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import unittest
+from multiprocessing.connection import wait
+
+from ExperimentOrchestrator.Architecture.WorkerPool import WorkerPool, WorkerDiedError
+
+
+def execute_task(task):
+    if task == 'raise':
+        raise RuntimeError('xyz')
+    if task == 'exit':
+        os._exit(3)
+    return task, os.getpid()
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(execute_task, recycle_after_tasks=0)
+        self.pool.start_worker()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def run_task(self, task):
+        handle = self.pool.submit(task)
+        wait([handle.sentinel])
+        handle.join()
+        return handle
+
+    def test_worker_is_reused(self):
+        first = self.run_task({'a': 1})
+        second = self.run_task([1, 2])
+
+        self.assertEqual(first.result[0], {'a': 1})
+        self.assertEqual(second.result[0], [1, 2])
+        self.assertEqual(first.result[1], second.result[1])
+        self.assertNotEqual(first.result[1], os.getpid())
+
+    def test_recycle_on_exception(self):
+        before = self.run_task(1).result[1]
+        failed = self.run_task('raise')
+        after = self.run_task(2).result[1]
+
+        self.assertIsNone(failed.result)
+        self.assertEqual(failed.error[0], 'RuntimeError')
+        self.assertNotEqual(before, after)
+
+    def test_recycle_on_crash(self):
+        failed = self.run_task('exit')
+        self.assertEqual(failed.error[0], WorkerDiedError.__name__)
+        self.assertEqual(self.run_task(3).result[0], 3)
+
+    def test_recycle_after_tasks(self):
+        self.pool.shutdown()
+        self.pool = WorkerPool(execute_task, recycle_after_tasks=2)
+
+        pids = [self.run_task(i).result[1] for i in range(4)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertEqual(pids[2], pids[3])
+        self.assertNotEqual(pids[1], pids[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from ExperimentOrchestrator.Distributed.LeaseDirectory import LeaseDirectory
+from ExperimentOrchestrator.Distributed.DistributedCoordinator import DistributedCoordinator
+from ExperimentOrchestrator.Distributed.DistributedWorker import DistributedWorker
+
+
+def runs(n):
+    return [(i + 1, {'__run_id': f'run_{i}_repetition_0', 'x': i}) for i in range(n)]
+
+
+class TestLeaseDirectory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.lease_dir = LeaseDirectory(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_task_is_claimed_once(self):
+        self.lease_dir.offer('run_0_repetition_0', {'x': 1})
+
+        task_id, task, lease = self.lease_dir.claim('a')
+        self.assertEqual((task_id, task), ('run_0_repetition_0', {'x': 1}))
+        self.assertIsNone(self.lease_dir.claim('b'))
+
+        self.lease_dir.complete(task_id, lease, 'a', {'y': 2}, None)
+        self.assertEqual(self.lease_dir.collect(), [('run_0_repetition_0', {'y': 2}, None, 'a')])
+        self.assertEqual(self.lease_dir.collect(), [])
+
+    def test_claim_in_offer_order(self):
+        for run_nr, run in runs(12):
+            self.lease_dir.offer(run['__run_id'], run_nr)
+
+        claimed = [self.lease_dir.claim('a')[1] for _ in range(12)]
+        self.assertEqual(claimed, list(range(1, 13)))
+
+    def test_expired_lease_is_requeued(self):
+        self.lease_dir.offer('run_0_repetition_0', {'x': 1})
+        _, _, lease = self.lease_dir.claim('crashed')
+
+        self.assertEqual(self.lease_dir.requeue_expired(60000), [])
+        old = time.time() - 120
+        os.utime(lease, (old, old))
+        self.assertEqual(self.lease_dir.requeue_expired(60000), ['run_0_repetition_0'])
+
+        self.assertFalse(LeaseDirectory.heartbeat(lease))
+        self.assertEqual(self.lease_dir.claim('b')[0], 'run_0_repetition_0')
+
+    def test_sessions(self):
+        self.lease_dir.reset()
+        session = self.lease_dir.current_session()
+        self.assertIsNone(self.lease_dir.closed_session())
+        self.lease_dir.close()
+        self.assertEqual(self.lease_dir.closed_session(), session)
+
+        self.lease_dir.reset()
+        self.assertNotEqual(self.lease_dir.current_session(), session)
+        self.assertIsNone(self.lease_dir.closed_session())
+
+
+class TestDistributedExecution(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def start_worker(self, worker_id, execute_run, lease_timeout_in_ms=60000):
+        worker = DistributedWorker(LeaseDirectory(self.path), worker_id, execute_run, lease_timeout_in_ms,
+                                   poll_interval_in_ms=10)
+        thread = threading.Thread(target=worker.serve, daemon=True)
+        thread.start()
+        return worker, thread
+
+    @staticmethod
+    def execute_run(run_nr, total_runs, run):
+        time.sleep(0.01)
+        return {**run, 'y': run['x'] * 2, 'total': total_runs}
+
+    def test_loopback_workers(self):
+        workers = [self.start_worker(f'w{i}', self.execute_run) for i in range(3)]
+        finished = {}
+
+        def on_run_finished(run_nr, run, handle):
+            finished[run['__run_id']] = (handle.result, handle.worker_id)
+
+        coordinator = DistributedCoordinator(LeaseDirectory(self.path), 60000, poll_interval_in_ms=10)
+        coordinator.run(runs(12), lambda: 12, on_run_finished)
+
+        for _, thread in workers:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+        self.assertEqual(len(finished), 12)
+        self.assertTrue(all(result['y'] == result['x'] * 2 and result['total'] == 12
+                            for result, _ in finished.values()))
+        self.assertEqual(sum(worker.runs_done for worker, _ in workers), 12)
+
+    def test_new_runs_are_leased(self):
+        self.start_worker('w', self.execute_run)
+        finished = []
+
+        def on_run_finished(run_nr, run, handle):
+            finished.append(run['__run_id'])
+            if run['__run_id'] == 'run_0_repetition_0':
+                return [(2, {'__run_id': 'run_0_repetition_1', 'x': 5})]
+
+        DistributedCoordinator(LeaseDirectory(self.path), 60000, poll_interval_in_ms=10) \
+            .run(runs(1), lambda: 2, on_run_finished)
+        self.assertEqual(finished, ['run_0_repetition_0', 'run_0_repetition_1'])
+
+    def test_crashed_worker_run_is_requeued(self):
+        # A lease that is never renewed, as left behind by a crashed worker
+        lease_dir = LeaseDirectory(self.path)
+        crashed = threading.Event()
+
+        def claim_and_crash():
+            while not lease_dir.claim('crashed'):
+                time.sleep(0.005)
+            crashed.set()
+
+        threading.Thread(target=claim_and_crash, daemon=True).start()
+
+        def start_healthy_worker():
+            crashed.wait(5)
+            self.start_worker('healthy', self.execute_run)
+
+        threading.Thread(target=start_healthy_worker, daemon=True).start()
+
+        finished = []
+        DistributedCoordinator(lease_dir, 200, poll_interval_in_ms=10) \
+            .run(runs(1), lambda: 1, lambda run_nr, run, handle: finished.append(handle.worker_id))
+        self.assertEqual(finished, ['healthy'])
+
+    def test_stale_stop_file(self):
+        # A previous experiment that was completed
+        previous = LeaseDirectory(self.path)
+        previous.reset()
+        previous.close()
+
+        worker, thread = self.start_worker('w', self.execute_run)
+        time.sleep(0.05)
+        self.assertTrue(thread.is_alive())
+
+        finished = []
+        DistributedCoordinator(LeaseDirectory(self.path), 60000, poll_interval_in_ms=10) \
+            .run(runs(3), lambda: 3, lambda run_nr, run, handle: finished.append(run['__run_id']))
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual((len(finished), worker.runs_done), (3, 3))
+
+    def test_failed_run_reports_error(self):
+        def execute_run(run_nr, total_runs, run):
+            raise RuntimeError('xyz')
+
+        self.start_worker('w', execute_run)
+        errors = []
+        DistributedCoordinator(LeaseDirectory(self.path), 60000, poll_interval_in_ms=10) \
+            .run(runs(1), lambda: 1, lambda run_nr, run, handle: errors.append((handle.result, handle.error[:2])))
+        self.assertEqual(errors, [(None, ('RuntimeError', 'xyz'))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ConfigValidator.Config.Models.BaselineModel import BaselineModel
+from ConfigValidator.Config.Models.MeasurementWindow import MeasurementWindow
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+from ExperimentOrchestrator.Experiment.Run.RunController import RunController
+from ConfigValidator.Config.Models.RunTableStore import RunTableStore
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+class Config:
+    self_measure = False
+    run_table_journal_fsync = True
+    run_table_store = RunTableStore.CSV
+
+    def __init__(self, experiment_path: Path):
+        self.experiment_path = experiment_path
+
+
+class TestRunControllerHooks(unittest.TestCase):
+    def setUp(self):
+        self.register = dict(EventSubscriptionController._EventSubscriptionController__call_back_register)
+        EventSubscriptionController._EventSubscriptionController__call_back_register.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run = {'__run_id': 'run_0_repetition_0', '__done': RunProgress.TODO, 'value': ' '}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        EventSubscriptionController._EventSubscriptionController__call_back_register.clear()
+        EventSubscriptionController._EventSubscriptionController__call_back_register.update(self.register)
+
+    def execute(self):
+        return RunController(self.run, Config(Path(self.tmp.name)), 1, 1).run(persist=False)
+
+    def test_async_hooks_share_one_event_loop(self):
+        events = []
+
+        async def start_target():
+            await asyncio.sleep(0.01)
+            events.append('target started')
+
+        async def start_run(context):
+            context.target = asyncio.create_task(start_target())
+
+        async def start_measurement(context):
+            events.append('measurement started')
+
+        async def interact(context):
+            # The target task started by start_run kept running while the measurement started
+            await context.target
+
+        EventSubscriptionController.subscribe_to_multiple_events([
+            (RunnerEvents.START_RUN, start_run),
+            (RunnerEvents.START_MEASUREMENT, start_measurement),
+            (RunnerEvents.INTERACT, interact),
+            (RunnerEvents.POPULATE_RUN_DATA, lambda context: {'value': len(events)}),
+        ])
+
+        result = self.execute()
+        self.assertEqual(events, ['measurement started', 'target started'])
+        self.assertEqual(result['value'], 2)
+        self.assertEqual(result['__done'], RunProgress.DONE)
+
+    def test_sync_hooks_run_without_event_loop(self):
+        async def measure():
+            return 42
+
+        EventSubscriptionController.subscribe_to_multiple_events([
+            (RunnerEvents.INTERACT, lambda context: asyncio.run(measure())),
+            (RunnerEvents.POPULATE_RUN_DATA, lambda context: {'value': asyncio.run(measure())}),
+        ])
+
+        self.assertEqual(self.execute()['value'], 42)
+
+    def test_measurement_window(self):
+        windows = {}
+
+        def interact(context):
+            time.sleep(0.01)
+            windows['interact'] = (context.measurement_window.started, context.measurement_window.stopped)
+
+        def populate_run_data(context):
+            windows['populate'] = context.measurement_window
+            return {'value': context.measurement_window.duration_ns}
+
+        EventSubscriptionController.subscribe_to_multiple_events([
+            (RunnerEvents.START_MEASUREMENT, lambda context: windows.update(start=context.measurement_window.started)),
+            (RunnerEvents.INTERACT, interact),
+            (RunnerEvents.POPULATE_RUN_DATA, populate_run_data),
+        ])
+
+        result = self.execute()
+        self.assertEqual((windows['start'], windows['interact']), (False, (True, False)))
+        self.assertGreaterEqual(result['value'], 10 ** 7)
+
+        stored = MeasurementWindow.read(Path(self.tmp.name) / 'run_0_repetition_0')
+        self.assertEqual(stored.to_dict(), windows['populate'].to_dict())
+
+    def test_baseline_run_is_idle(self):
+        events = []
+        EventSubscriptionController.subscribe_to_multiple_events([
+            (event, lambda context, event=event: events.append((event.name, context.is_baseline)))
+            for event in [RunnerEvents.START_RUN, RunnerEvents.START_MEASUREMENT, RunnerEvents.INTERACT,
+                          RunnerEvents.STOP_MEASUREMENT, RunnerEvents.STOP_RUN]
+        ] + [(RunnerEvents.POPULATE_RUN_DATA, lambda context: {'value': context.measurement_window.duration_ns})])
+
+        config = Config(Path(self.tmp.name))
+        config.baseline = BaselineModel(duration_in_ms=20)
+        run = {'__run_id': 'baseline_0', '__done': RunProgress.TODO, 'value': ' '}
+        result = RunController(run, config, 0, 1, is_baseline=True).run(persist=False)
+
+        self.assertEqual(events, [('START_MEASUREMENT', True), ('STOP_MEASUREMENT', True)])
+        self.assertGreaterEqual(result['value'], 2 * 10 ** 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from ConfigValidator.Config.Models.BaselineModel import BaselineCorrection, BaselineModel
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ExperimentOrchestrator.Experiment.BaselineController import BaselineController
+
+SECOND = 10 ** 9
+
+
+class TestBaselineController(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.model = BaselineModel({'energy': BaselineCorrection.AMOUNT, 'cpu': BaselineCorrection.LEVEL},
+                                   initial_runs=2, interval=3, history=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_model_validation(self):
+        with self.assertRaises(BaseError):
+            BaselineModel(initial_runs=0, interval=0)
+        with self.assertRaises(BaseError):
+            BaselineModel(duration_in_ms=0)
+        with self.assertRaises(BaseError):
+            BaselineModel({'energy': 'amount'})
+        with self.assertRaises(BaseError):
+            BaselineController(self.model, ['energy'], self.path)
+
+        self.assertEqual(BaselineModel(['energy']).columns, {'energy': BaselineCorrection.AMOUNT})
+        controller = BaselineController(BaselineModel(), ['energy', 'time', '__cooldown_ms'], self.path)
+        self.assertEqual(controller.net_columns, ['energy_net', 'time_net'])
+
+    def test_schedule(self):
+        controller = BaselineController(self.model, ['energy', 'cpu'], self.path)
+        schedule = []
+        for _ in range(8):
+            while controller.is_due():
+                run = controller.create_run({'size': 10})
+                controller.add_result(run['__run_id'], None, None)
+                schedule.append(run['__run_id'])
+            schedule.append('run')
+            controller.run_finished()
+
+        self.assertEqual(schedule, ['baseline_0', 'baseline_1', 'run', 'run', 'run', 'baseline_2', 'run', 'run',
+                                    'run', 'baseline_3', 'run', 'run'])
+
+    def test_correction(self):
+        controller = BaselineController(self.model, ['energy', 'cpu'], self.path)
+        run = {'energy': 50.0, 'cpu': '40'}
+        controller.correct(run, 10 * SECOND)
+        self.assertEqual((run['energy_net'], run['cpu_net']), (" ", " "))
+
+        # 2 J/s and 4 J/s of overhead, at 5% and 15% CPU
+        controller.add_result('baseline_0', {'energy': 20.0, 'cpu': 5}, 10 * SECOND)
+        controller.add_result('baseline_1', {'energy': '8', 'cpu': 15}, 2 * SECOND)
+        controller.correct(run, 10 * SECOND)
+        self.assertAlmostEqual(run['energy_net'], 50 - 30)
+        self.assertAlmostEqual(run['cpu_net'], 40 - 10)
+
+        # Only the last `history` baseline runs are used, and failed runs are not
+        controller.add_result('baseline_2', {'energy': 10.0, 'cpu': 10}, 10 * SECOND)
+        controller.add_result('baseline_3', None, None)
+        self.assertAlmostEqual(controller.overhead('energy', SECOND), 2.5)
+
+        run = {'energy': ' ', 'cpu': 20}
+        controller.correct(run, None)
+        self.assertEqual((run['energy_net'], run['cpu_net']), (" ", " "))
+
+    def test_restart(self):
+        controller = BaselineController(self.model, ['energy', 'cpu'], self.path)
+        controller.add_result('baseline_0', {'energy': 20.0, 'cpu': 5}, 10 * SECOND)
+        controller.add_result('baseline_1', None, None)
+
+        with open(self.path / 'baseline.json') as f:
+            stored = json.load(f)
+        self.assertEqual(stored['overhead']['energy'], {'correction': 'AMOUNT', 'overhead': 2.0, 'baseline_runs': 1})
+
+        restarted = BaselineController(self.model, ['energy', 'cpu'], self.path)
+        restarted.load()
+        self.assertEqual(restarted.create_run({})['__run_id'], 'baseline_2')
+        self.assertAlmostEqual(restarted.overhead('energy', SECOND), 2.0)
+        # The system is measured idle again after a restart
+        self.assertTrue(restarted.is_due())
+
+
+if __name__ == '__main__':
+    unittest.main()
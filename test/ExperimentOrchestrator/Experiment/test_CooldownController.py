@@ -0,0 +1,60 @@
+import unittest
+
+from ConfigValidator.Config.Models.CooldownModel import CooldownModel, CooldownSensor
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ExperimentOrchestrator.Experiment.CooldownController import CooldownController
+
+
+class FakeSensor:
+    def __init__(self, readings):
+        self.readings = list(readings)
+
+    def __call__(self):
+        # Keep returning the last reading once the sequence is exhausted
+        return self.readings.pop(0) if len(self.readings) > 1 else self.readings[0]
+
+
+class TestCooldownModel(unittest.TestCase):
+    def test_custom_requires_callable(self):
+        with self.assertRaises(BaseError):
+            CooldownModel(sensor=CooldownSensor.CUSTOM)
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(BaseError):
+            CooldownModel(min_wait_in_ms=100, max_wait_in_ms=50)
+
+
+class TestCooldownController(unittest.TestCase):
+    def controller(self, readings, **kwargs):
+        model = CooldownModel(sensor=CooldownSensor.CUSTOM, read_sensor=FakeSensor(readings),
+                              poll_interval_in_ms=1, baseline_samples=3, **kwargs)
+        return CooldownController(model)
+
+    def test_baseline_is_median(self):
+        controller = self.controller([40, 50, 41])
+        self.assertEqual(controller.record_baseline(), 41)
+
+    def test_wait_until_baseline(self):
+        controller = self.controller([40, 40, 40, 60, 55, 50, 41], tolerance=0.05, max_wait_in_ms=5000)
+        controller.record_baseline()
+        waited = controller.wait()
+
+        self.assertLess(waited, 5000)
+        self.assertTrue(controller.is_cooled_down(41))
+        self.assertFalse(controller.is_cooled_down(50))
+
+    def test_wait_bounds(self):
+        controller = self.controller([40, 40, 40, 80], min_wait_in_ms=20, max_wait_in_ms=60)
+        controller.record_baseline()
+        waited = controller.wait()
+
+        self.assertGreaterEqual(waited, 60)
+        self.assertLess(waited, 1000)
+
+    def test_min_wait_when_idle(self):
+        controller = self.controller([40], min_wait_in_ms=30)
+        self.assertGreaterEqual(controller.wait(), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
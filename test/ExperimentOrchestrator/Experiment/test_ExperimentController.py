@@ -0,0 +1,171 @@
+import importlib.util
+import json
+import os
+import pwd
+import tempfile
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+
+from ConfigValidator.Config.Models.BaselineModel import BaselineCorrection, BaselineModel
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.Metadata import Metadata
+from ConfigValidator.Config.Models.OperationType import OperationType
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.Config.Models.RunTableStore import RunTableStore
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+from ExperimentOrchestrator.Experiment.ExperimentController import ExperimentController
+from ProgressManager.Output.OutputManagerFactory import create_data_manager
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+class Config:
+    operation_type = OperationType.AUTO
+    self_measure = False
+    cooldown = None
+    baseline = None
+    get_run_resources = None
+    run_timeout_in_ms = 0
+    max_run_attempts = 1
+    run_table_compaction_interval = 100
+    run_table_journal_fsync = True
+    run_table_store = RunTableStore.CSV
+
+    def __init__(self, experiment_path: Path, levels: int = 4, repetitions: int = 2):
+        self.experiment_path = experiment_path
+        self.levels = levels
+        self.repetitions = repetitions
+        self.run_table_model = None
+
+    def create_run_table_model(self) -> RunTableModel:
+        self.run_table_model = RunTableModel(
+            factors=[FactorModel("a", list(range(self.levels))), FactorModel("b", ['x', 'y'])],
+            repetitions=self.repetitions,
+            data_columns=['value'],
+            data_column_types={'value': int},
+            shuffle=True
+        )
+        return self.run_table_model
+
+
+class BaselineConfig(Config):
+    baseline = BaselineModel({'value': BaselineCorrection.LEVEL}, initial_runs=1, interval=4, duration_in_ms=10)
+    distributed_lease_dir = None
+    max_parallel_runs = 1
+    use_worker_pool = False
+    time_between_runs_in_ms = 0
+
+    def __init__(self, experiment_path: Path):
+        super().__init__(experiment_path, levels=2, repetitions=2)
+
+
+class SQLiteConfig(Config):
+    run_table_store = RunTableStore.SQLITE
+
+
+class ParquetConfig(Config):
+    run_table_store = RunTableStore.PARQUET
+
+
+class TestResume(unittest.TestCase):
+    config_class = Config
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'experiment'
+        self.metadata = Metadata(b'md5')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def complete_runs(self, run_ids):
+        data_manager = create_data_manager(self.config_class(self.path))
+        rows = data_manager.read_run_table()
+        for row in rows:
+            if row['__run_id'] in run_ids:
+                row.update({'__done': RunProgress.DONE, 'value': 7})
+        data_manager.write_run_table(rows)
+
+    def test_resume_keeps_stored_order_and_progress(self):
+        stored = ExperimentController(self.config_class(self.path), self.metadata).run_table
+        stored_order = [run['__run_id'] for run in stored]
+        self.complete_runs(stored_order[:3])
+
+        # The shuffled table is generated in another order, the stored order is restored
+        controller = ExperimentController(self.config_class(self.path), self.metadata)
+        self.assertTrue(controller.restarted)
+        self.assertEqual([run['__run_id'] for run in controller.run_table], stored_order)
+        self.assertEqual([run['__done'] for run in controller.run_table],
+                         [RunProgress.DONE] * 3 + [RunProgress.TODO] * (len(stored_order) - 3))
+        self.assertEqual(controller.run_table[0]['value'], 7)
+        self.assertIsInstance(controller.run_table[0]['a'], int)  # generated factor objects are kept
+
+    def test_resume_mismatching_levels(self):
+        ExperimentController(self.config_class(self.path), self.metadata)
+
+        with self.assertRaises(BaseError):
+            ExperimentController(self.config_class(self.path, repetitions=3), self.metadata)
+
+    def test_resume_large_run_table(self):
+        config = self.config_class(self.path, levels=25000, repetitions=2)  # 100k runs
+        stored = ExperimentController(config, self.metadata).run_table
+        self.complete_runs({stored[0]['__run_id']})
+
+        start = time.monotonic()
+        ExperimentController(self.config_class(self.path, levels=25000, repetitions=2), self.metadata)
+        self.assertLess(time.monotonic() - start, 30)
+
+
+@mock.patch('os.getlogin', lambda: pwd.getpwuid(os.getuid()).pw_name)
+class TestBaselineRuns(unittest.TestCase):
+    def setUp(self):
+        self.register = dict(EventSubscriptionController._EventSubscriptionController__call_back_register)
+        EventSubscriptionController._EventSubscriptionController__call_back_register.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'experiment'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        EventSubscriptionController._EventSubscriptionController__call_back_register.clear()
+        EventSubscriptionController._EventSubscriptionController__call_back_register.update(self.register)
+
+    def test_hooks_read_factors(self):
+        # Hooks written for normal runs, reading the factor levels of the run
+        def start_measurement(context):
+            context.levels = (context.execute_run['a'], context.execute_run['b'])
+
+        def populate_run_data(context):
+            a, b = context.execute_run['a'], context.execute_run['b']
+            assert context.levels == (a, b)
+            return {'value': 1 if context.is_baseline else 10 + a}
+
+        EventSubscriptionController.subscribe_to_multiple_events([
+            (RunnerEvents.START_MEASUREMENT, start_measurement),
+            (RunnerEvents.POPULATE_RUN_DATA, populate_run_data),
+        ])
+
+        controller = ExperimentController(BaselineConfig(self.path), Metadata(b'md5'))
+        controller.do_experiment()
+
+        rows = create_data_manager(BaselineConfig(self.path)).read_run_table()
+        self.assertEqual(len(rows), 8)
+        self.assertTrue(all(float(row['value_net']) == float(row['value']) - 1 for row in rows))
+        with open(self.path / 'baseline.json') as f:
+            baselines = json.load(f)['runs']
+        self.assertEqual([run['values'] for run in baselines], [{'value': 1.0}] * 2)
+
+
+class TestResumeSQLite(TestResume):
+    config_class = SQLiteConfig
+
+
+@unittest.skipUnless(importlib.util.find_spec('pyarrow'), "requires pyarrow")
+class TestResumeParquet(TestResume):
+    config_class = ParquetConfig
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
+from ExperimentOrchestrator.Experiment.PhaseTimings import PhaseTimer, TimingSummary, read_timings
+
+
+class TestPhaseTimer(unittest.TestCase):
+    def tearDown(self):
+        EventSubscriptionController.unsubscribe(RunnerEvents.START_RUN, 'slow')
+
+    def test_phases(self):
+        timer = PhaseTimer()
+        with timer.phase('setup'):
+            time.sleep(0.01)
+        timer.add('setup', 1000)
+        timer.add('teardown', 500)
+
+        self.assertGreaterEqual(timer.phases['setup'], 10 ** 7 + 1000)
+        self.assertEqual(timer.phases['teardown'], 500)
+        self.assertEqual(list(timer.phases), ['setup', 'teardown'])
+
+    def test_failed_phase_is_recorded(self):
+        timer = PhaseTimer()
+        with self.assertRaises(ValueError):
+            with timer.phase('run'):
+                raise ValueError()
+        self.assertIn('run', timer.phases)
+
+    def test_subscribers(self):
+        EventSubscriptionController.subscribe(RunnerEvents.START_RUN, lambda: time.sleep(0.01), key='slow')
+        timer = PhaseTimer()
+        with timer.phase('START_RUN', RunnerEvents.START_RUN):
+            EventSubscriptionController.raise_event(RunnerEvents.START_RUN)
+
+        self.assertGreaterEqual(timer.subscribers['START_RUN']['slow'], 10 ** 7)
+        self.assertGreaterEqual(timer.phases['START_RUN'], timer.subscribers['START_RUN']['slow'])
+
+    def test_write(self):
+        timer = PhaseTimer()
+        timer.add('run', 2000)
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(read_timings(Path(directory)))
+            timer.write(Path(directory))
+            self.assertEqual(read_timings(Path(directory)), {'phases_ns': {'run': 2000}, 'subscribers_ns': {}})
+
+
+class TestTimingSummary(unittest.TestCase):
+    def test_summary(self):
+        summary = TimingSummary()
+        summary.experiment.add('runs', 5 * 10 ** 9)
+        for i in range(1, 11):
+            summary.add_run({'startup': 10 ** 6, 'run': i * 10 ** 6})
+
+        stats = summary.to_dict()
+        self.assertEqual(stats['experiment_ns'], {'runs': 5 * 10 ** 9})
+        self.assertEqual(stats['run_phases_ms']['startup']['count'], 10)
+        self.assertAlmostEqual(stats['run_phases_ms']['startup']['mean'], 1.0)
+        self.assertAlmostEqual(stats['run_phases_ms']['run']['mean'], 5.5)
+        self.assertEqual(stats['run_phases_ms']['run']['max'], 10.0)
+
+        lines = summary.table().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[1].split()[:3], ['startup', '10', '1.00'])
+        self.assertEqual(lines[2].split()[-1], '0.06')
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary.write(Path(directory))
+            self.assertEqual(read_timings(Path(directory))['experiment_ns'], {'runs': 5 * 10 ** 9})
+
+
+if __name__ == '__main__':
+    unittest.main()
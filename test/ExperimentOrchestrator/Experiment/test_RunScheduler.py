@@ -0,0 +1,114 @@
+import multiprocessing
+import time
+import unittest
+from unittest import mock
+
+from ExperimentOrchestrator.Architecture.RunProcess import RunProcess
+from ExperimentOrchestrator.Experiment.RunScheduler import RunScheduler, partition_cpus
+
+
+@mock.patch('os.sched_getaffinity', return_value={0, 1, 2, 3, 4})
+class TestPartitionCpus(unittest.TestCase):
+    def test_disjoint_sets(self, _):
+        cpu_sets = partition_cpus(2)
+        self.assertEqual(len(cpu_sets), 2)
+        self.assertEqual(cpu_sets[0] & cpu_sets[1], set())
+        self.assertEqual(len(cpu_sets[0]), len(cpu_sets[1]))
+
+    def test_too_many_sets(self, _):
+        with self.assertRaises(ValueError):
+            partition_cpus(6)
+
+
+@mock.patch('os.sched_getaffinity', return_value={0, 1, 2, 3})
+class TestRunScheduler(unittest.TestCase):
+    def setUp(self):
+        self.active = {}
+        self.max_active = 0
+        self.finished = []
+
+    def start_run(self, run_nr, run, cpu_set):
+        # No run may start while another run holding the same device is active
+        for other in self.active.values():
+            self.assertNotEqual(other['device'], run['device'])
+            self.assertNotEqual(other['cpu_set'], cpu_set)
+
+        self.active[run_nr] = {'device': run['device'], 'cpu_set': cpu_set}
+        self.max_active = max(self.max_active, len(self.active))
+
+        proc = multiprocessing.Process(target=time.sleep, args=[0.05])
+        proc.start()
+        return proc
+
+    def test_sequential(self, _):
+        pending = [(i, {'device': None}) for i in range(1, 5)]
+        RunScheduler(1).run(pending, self.start_run, self.on_run_finished)
+
+        self.assertEqual(self.finished, [1, 2, 3, 4])
+        self.assertEqual(self.max_active, 1)
+
+    def test_parallel_with_shared_device(self, _):
+        pending = [(i, {'device': 'rapl' if i % 2 else f'gpu{i}'}) for i in range(1, 7)]
+        scheduler = RunScheduler(2, lambda run: [run['device']])
+        scheduler.run(pending, self.start_run, self.on_run_finished)
+
+        self.assertEqual(sorted(self.finished), list(range(1, 7)))
+        self.assertEqual(self.max_active, 2)
+
+    def test_time_between_runs_per_slot(self, _):
+        started = []
+
+        def start_run(run_nr, run, cpu_set):
+            started.append((time.monotonic(), cpu_set))
+            return self.start_run(run_nr, run, cpu_set)
+
+        pending = [(i, {'device': f'gpu{i}'}) for i in range(1, 5)]
+        RunScheduler(2, time_between_runs_in_ms=1000).run(pending, start_run, self.on_run_finished)
+
+        # Every slot waits after its own run, while the other slot keeps going (a shared pause would take 2s)
+        for cpu_set in {frozenset(cpu_set) for _, cpu_set in started}:
+            first, second = [start for start, run_cpu_set in started if run_cpu_set == cpu_set]
+            self.assertGreaterEqual(second - first, 1)
+        self.assertLess(started[-1][0] - started[0][0], 1.8)
+
+    def test_pending_is_consumed_lazily(self, _):
+        taken = []
+
+        def pending():
+            for i in range(1, 5):
+                taken.append(i)
+                yield i, {'device': None}
+
+        def on_run_finished(run_nr, run, handle):
+            self.on_run_finished(run_nr, run, handle)
+            # Only the next pending run is looked at ahead of time
+            self.assertLessEqual(len(taken), run_nr + 1)
+            return [(10, {'device': None})] if run_nr == 1 else []
+
+        RunScheduler(1).run(pending(), self.start_run, on_run_finished)
+        self.assertEqual(self.finished, [1, 2, 3, 4, 10])
+
+    def test_timeout(self, _):
+        handles = {}
+
+        def start_run(run_nr, run, cpu_set):
+            handles[run_nr] = RunProcess(lambda: time.sleep(run['duration']) or run['duration'])
+            return handles[run_nr]
+
+        pending = [(1, {'duration': 10}), (2, {'duration': 0.01})]
+        start = time.monotonic()
+        RunScheduler(1, run_timeout_in_ms=200, kill_grace_period_in_ms=200).run(pending, start_run, self.on_run_finished)
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(handles[1].terminated)
+        self.assertIsNotNone(handles[1].error)
+        self.assertFalse(handles[2].terminated)
+        self.assertEqual(handles[2].result, 0.01)
+
+    def on_run_finished(self, run_nr, run, handle):
+        self.active.pop(run_nr, None)
+        self.finished.append(run_nr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.Config.Models.StoppingRule import StoppingRule
+from ConfigValidator.CustomErrors.BaseError import BaseError
+from ExperimentOrchestrator.Experiment.SequentialStopping import (SequentialStoppingController, t_quantile,
+                                                                  relative_ci_width)
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+class TestTQuantile(unittest.TestCase):
+    def test_known_values(self):
+        # Reference values of the two-sided 95% critical value
+        for df, expected in [(1, 12.706), (2, 4.303), (3, 3.182), (5, 2.571), (10, 2.228), (30, 2.042)]:
+            self.assertAlmostEqual(t_quantile(0.975, df), expected, delta=0.01)
+
+    def test_relative_ci_width(self):
+        self.assertEqual(relative_ci_width([5.0, 5.0, 5.0], 0.95), 0)
+        self.assertGreater(relative_ci_width([1.0, 9.0, 5.0], 0.95), 1)
+
+
+class TestSequentialStopping(unittest.TestCase):
+    def setUp(self):
+        self.model = RunTableModel(
+            factors=[FactorModel("example_factor1", ['a', 'b'])],
+            data_columns=['energy'],
+            stopping_rule=StoppingRule('energy', max_relative_ci_width=0.05, min_repetitions=2, max_repetitions=4)
+        )
+        self.run_table = self.model.generate_experiment_run_table()
+        self.controller = SequentialStoppingController(self.model)
+        self.controller.track(self.run_table)
+
+    def complete(self, run, value):
+        return {**run, 'energy': value, '__done': RunProgress.DONE}
+
+    def test_minimal_table(self):
+        self.assertEqual(len(self.run_table), 4)
+
+    def test_stops_when_tight(self):
+        runs_a = [run for run in self.run_table if run['example_factor1'] == 'a']
+        self.assertIsNone(self.controller.add_result(self.complete(runs_a[0], 10.0)))
+        self.assertIsNone(self.controller.add_result(self.complete(runs_a[1], 10.01)))
+
+    def test_grows_until_max(self):
+        runs_b = [run for run in self.run_table if run['example_factor1'] == 'b']
+        self.assertIsNone(self.controller.add_result(self.complete(runs_b[0], 1.0)))
+        new_run = self.controller.add_result(self.complete(runs_b[1], 20.0))
+
+        self.assertEqual(new_run['__run_id'], 'run_1_repetition_2')
+        self.assertEqual(new_run['example_factor1'], 'b')
+        self.assertEqual(new_run['energy'], " ")
+        self.assertEqual(new_run['__done'], RunProgress.TODO)
+
+        new_run = self.controller.add_result(self.complete(new_run, 7.0))
+        self.assertEqual(new_run['__run_id'], 'run_1_repetition_3')
+        self.assertIsNone(self.controller.add_result(self.complete(new_run, 13.0)))  # max_repetitions reached
+
+    def test_failed_run_counts_as_completed(self):
+        runs_b = [run for run in self.run_table if run['example_factor1'] == 'b']
+        self.assertIsNone(self.controller.add_result(self.complete(runs_b[0], 1.0)))
+        new_run = self.controller.add_result({**runs_b[1], '__done': RunProgress.FAILED})
+
+        self.assertEqual(new_run['__run_id'], 'run_1_repetition_2')
+        self.assertEqual(self.controller.values['run_1'], [1.0])
+
+    def test_resumed_treatments_continue(self):
+        # Treatment a was completed, but is not tight enough; b is still running
+        resumed = [self.complete(run, value) for run, value in zip(self.run_table, [1.0, 5.0, 20.0])] + \
+                  [self.run_table[3]]
+        controller = SequentialStoppingController(self.model)
+
+        new_runs = controller.track(resumed)
+        self.assertEqual([run['__run_id'] for run in new_runs], ['run_0_repetition_2'])
+        self.assertEqual(new_runs[0]['example_factor1'], 'a')
+        self.assertEqual(controller.scheduled['run_0'], 3)
+
+    def test_invalid_rule(self):
+        with self.assertRaises(BaseError):
+            RunTableModel(factors=[FactorModel("example_factor1", ['a'])], data_columns=['energy'],
+                          stopping_rule=StoppingRule('missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import statistics
+import tempfile
+import unittest
+from pathlib import Path
+
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ExperimentOrchestrator.Experiment.StreamingAggregates import (Welford, P2Quantile,
+                                                                   StreamingAggregatesController, read_summary)
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+class TestStreamingStatistics(unittest.TestCase):
+    def test_welford(self):
+        values = [random.gauss(10, 3) for _ in range(1000)]
+        moments = Welford()
+        for value in values:
+            moments.add(value)
+
+        self.assertEqual(moments.count, 1000)
+        self.assertAlmostEqual(moments.mean, statistics.fmean(values))
+        self.assertAlmostEqual(moments.variance, statistics.variance(values))
+        self.assertEqual((moments.min, moments.max), (min(values), max(values)))
+
+    def test_p2_quantile(self):
+        rng = random.Random(1)
+        values = [rng.expovariate(1) for _ in range(20000)]
+        for p in [0.5, 0.9]:
+            quantile = P2Quantile(p)
+            for value in values:
+                quantile.add(value)
+            exact = statistics.quantiles(values, n=100)[round(p * 100) - 1]
+            self.assertAlmostEqual(quantile.value, exact, delta=0.02 * exact)
+
+    def test_p2_quantile_few_values(self):
+        quantile = P2Quantile(0.5)
+        for value in [5, 1, 3]:
+            quantile.add(value)
+        self.assertEqual(quantile.value, 3)
+
+
+class TestStreamingAggregatesController(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.model = RunTableModel(factors=[FactorModel("size", [1, 2])], repetitions=3,
+                                   data_columns=['energy', '__attempts'])
+        self.run_table = self.model.generate_experiment_run_table()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def complete(self, run, energy):
+        return {**run, '__done': RunProgress.DONE, 'energy': energy, '__attempts': 1}
+
+    def test_summary(self):
+        controller = StreamingAggregatesController(self.model, self.path)
+        # run_0 is the treatment with size=1, the first run is completed before a restart
+        self.run_table[0] = self.complete(self.run_table[0], 4)
+        controller.track(self.run_table)
+
+        for run in self.run_table[1:]:
+            controller.add_result(self.complete(run, ' ' if run['size'] == 2 else 8))
+        controller.write_summary(force=True)
+
+        summary = read_summary(self.path)
+        self.assertEqual(summary['runs_done'], 6)
+        self.assertEqual(summary['treatments']['run_0']['factors'], {'size': '1'})
+        energy = summary['treatments']['run_0']['columns']['energy']
+        self.assertEqual((energy['count'], energy['mean'], energy['p50']), (3, statistics.fmean([4, 8, 8]), 8))
+        self.assertEqual(summary['treatments']['run_1']['columns'], {})  # no numeric results
+        self.assertNotIn('__attempts', summary['treatments']['run_0']['columns'])
+
+    def test_write_interval(self):
+        controller = StreamingAggregatesController(self.model, self.path, write_interval_in_s=60)
+        controller.write_summary()
+        controller.add_result(self.complete(self.run_table[0], 1))
+        controller.write_summary()
+        self.assertEqual(read_summary(self.path)['runs_done'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ from typing import AnyStr
 
 from ConfigValidator.Config.Models.RunnerContext import RunnerContext
 from ConfigValidator.Config.RunnerConfig import RunnerConfig
+from EventManager.EventSubscriptionController import EventSubscriptionController
+from EventManager.Models.RunnerEvents import RunnerEvents
 from ProgressManager.Output.OutputProcedure import OutputProcedure as output
 
 from Plugins.Profilers import CodecarbonWrapper
@@ -101,12 +103,23 @@ class TestEmissionTrackerCombined(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.runner_config.clear()
+        for event, key in [(RunnerEvents.START_MEASUREMENT, 'codecarbon.start'),
+                           (RunnerEvents.STOP_MEASUREMENT, 'codecarbon.stop'),
+                           (RunnerEvents.POPULATE_RUN_DATA, 'codecarbon.populate')]:
+            EventSubscriptionController.unsubscribe(event, key)
 
     def test_config(self):
-        self.runner_config.start_measurement(None)
-        self.runner_config.interact(None)
-        self.runner_config.stop_measurement(None)
-        run_data = self.runner_config.populate_run_data(None)
+        # The tracker is subscribed next to the config hooks: started before them, stopped after them
+        self.assertEqual(EventSubscriptionController.get_subscribers(RunnerEvents.START_MEASUREMENT)[0].key,
+                         'codecarbon.start')
+        self.assertEqual(EventSubscriptionController.get_subscribers(RunnerEvents.STOP_MEASUREMENT)[-1].key,
+                         'codecarbon.stop')
+
+        context = RunnerContext({}, 1, Path(TestEmissionTrackerCombined.tmpdir))
+        EventSubscriptionController.raise_event(RunnerEvents.START_MEASUREMENT, context)
+        EventSubscriptionController.raise_event(RunnerEvents.INTERACT, context)
+        EventSubscriptionController.raise_event(RunnerEvents.STOP_MEASUREMENT, context)
+        run_data = EventSubscriptionController.raise_event(RunnerEvents.POPULATE_RUN_DATA, context)
         self.assertTrue(run_data[CCDataCols.EMISSIONS.name] > 0)
         self.assertTrue(run_data[CCDataCols.ENERGY_CONSUMED.name] > 0)
         self.assertTrue(run_data['avg_cpu'] == 52.3)
@@ -0,0 +1,97 @@
+import os
+import pwd
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ProgressManager.Output.CSVOutputManager import CSVOutputManager
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+def run_table(n):
+    return [{'__run_id': f'run_{i}_repetition_0', '__done': RunProgress.TODO, 'a': i, 'value': ''} for i in range(n)]
+
+
+# The journal is handed to the login user, which is not defined for every test environment
+@mock.patch('os.getlogin', lambda: pwd.getpwuid(os.getuid()).pw_name)
+class TestCSVOutputManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.data_manager = CSVOutputManager(self.path)
+        self.data_manager.write_run_table(run_table(4))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def csv_contents(self):
+        return (self.path / 'run_table.csv').read_text()
+
+    def test_updates_are_journaled(self):
+        before = self.csv_contents()
+        self.data_manager.update_row_data({**run_table(4)[1], '__done': RunProgress.DONE, 'value': 3.5})
+        self.data_manager.update_row_data({**run_table(4)[1], '__done': RunProgress.DONE, 'value': 12})
+
+        self.assertEqual(self.csv_contents(), before)
+        rows = self.data_manager.read_run_table()
+        self.assertEqual([row['__done'] for row in rows],
+                         [RunProgress.TODO, RunProgress.DONE, RunProgress.TODO, RunProgress.TODO])
+        self.assertEqual(rows[1]['value'], 12)
+        self.assertEqual(self.data_manager.read_row('run_1_repetition_0')['a'], 1)
+
+    def test_appended_rows(self):
+        self.data_manager.append_rows([{'__run_id': 'run_0_repetition_1', '__done': RunProgress.TODO,
+                                        'a': 0, 'value': None}])
+        rows = self.data_manager.read_run_table()
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1]['__run_id'], 'run_0_repetition_1')
+        self.assertEqual(rows[-1]['value'], '')
+
+    def test_compact(self):
+        self.data_manager.update_row_data({**run_table(4)[2], '__done': RunProgress.FAILED, 'value': 'x'})
+        journaled = self.data_manager.read_run_table()
+
+        self.data_manager.compact()
+        self.assertFalse((self.path / CSVOutputManager.JOURNAL_FILE).exists())
+        self.assertIn('FAILED', self.csv_contents())
+        self.assertEqual(self.data_manager.read_run_table(), journaled)
+
+    def test_incomplete_entry_is_skipped(self):
+        # A crash halfway through appending an entry
+        with open(self.path / CSVOutputManager.JOURNAL_FILE, 'w') as journal:
+            journal.write('{"__run_id": "run_0_repe')
+
+        self.data_manager.update_row_data({**run_table(4)[3], '__done': RunProgress.DONE, 'value': 1})
+        rows = self.data_manager.read_run_table()
+        self.assertEqual([row['__done'] for row in rows].count(RunProgress.DONE), 1)
+        self.assertEqual(rows[3]['__done'], RunProgress.DONE)
+
+    def test_read_row_parses_the_csv_once(self):
+        with mock.patch.object(CSVOutputManager, '_CSVOutputManager__read_csv',
+                               autospec=True, side_effect=CSVOutputManager._CSVOutputManager__read_csv) as read_csv:
+            self.assertEqual([self.data_manager.read_row(row['__run_id'])['a'] for row in run_table(4)], [0, 1, 2, 3])
+            self.assertEqual(read_csv.call_count, 1)
+
+            # Updates of this or another process are read from the journal
+            CSVOutputManager(self.path).update_row_data({**run_table(4)[2], '__done': RunProgress.DONE, 'value': 7})
+            self.data_manager.append_rows([{'__run_id': 'run_0_repetition_1', '__done': RunProgress.TODO,
+                                            'a': 0, 'value': ''}])
+            self.assertEqual(self.data_manager.read_row('run_2_repetition_0')['value'], 7)
+            self.assertEqual(self.data_manager.read_row('run_0_repetition_1')['a'], 0)
+            self.assertIsNone(self.data_manager.read_row('run_9_repetition_0'))
+            self.assertEqual(read_csv.call_count, 1)
+
+            self.data_manager.compact()
+            self.data_manager.write_run_table(run_table(2))
+            self.assertIsNone(self.data_manager.read_row('run_2_repetition_0'))
+            self.assertEqual(read_csv.call_count, 3)  # once by compact, once for the rewritten table
+
+    def test_write_run_table_discards_journal(self):
+        self.data_manager.update_row_data({**run_table(4)[0], '__done': RunProgress.DONE, 'value': 1})
+        self.data_manager.write_run_table(run_table(2))
+        self.assertEqual([row['__done'] for row in self.data_manager.read_run_table()], [RunProgress.TODO] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
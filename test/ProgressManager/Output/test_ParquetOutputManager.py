@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import pwd
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+@unittest.skipUnless(importlib.util.find_spec('pyarrow'), "requires pyarrow")
+@mock.patch('os.getlogin', lambda: pwd.getpwuid(os.getuid()).pw_name)
+class TestParquetOutputManager(unittest.TestCase):
+    def setUp(self):
+        from ProgressManager.Output.ParquetOutputManager import ParquetOutputManager
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.model = RunTableModel(
+            factors=[FactorModel("size", [-1, 10]), FactorModel("ratio", [0.5, 1]),
+                     FactorModel("cached", [True, False]), FactorModel("name", ['a', 'b'])],
+            data_columns=['energy', 'passed', 'label'],
+            data_column_types={'energy': float, 'passed': bool}
+        )
+        self.run_table = self.model.generate_experiment_run_table()
+        self.data_manager = ParquetOutputManager(self.path, self.model)
+        self.data_manager.write_run_table(self.run_table)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_schema(self):
+        self.assertEqual([str(field.type) for field in self.data_manager.schema],
+                         ['string', 'string', 'int64', 'double', 'bool', 'string', 'double', 'bool', 'string'])
+
+    def test_values_round_trip(self):
+        rows = self.data_manager.read_run_table()
+        self.assertEqual([{k: row[k] for k in ['size', 'ratio', 'cached', 'name']} for row in rows],
+                         [{k: run[k] for k in ['size', 'ratio', 'cached', 'name']} for run in self.run_table])
+        self.assertIsInstance(rows[0]['ratio'], float)
+        self.assertIsNone(rows[0]['energy'])  # placeholder of a run that did not populate its data yet
+
+    def test_journaled_update(self):
+        from ProgressManager.Output.ParquetOutputManager import ParquetOutputManager
+
+        run_id = self.run_table[3]['__run_id']
+        self.data_manager.update_row_data({**self.run_table[3], '__done': RunProgress.DONE,
+                                           'energy': '-12.5', 'passed': True, 'label': 7})
+
+        # Read by another process, which knows the column types from the stored table only
+        for data_manager in [self.data_manager, ParquetOutputManager(self.path)]:
+            row = data_manager.read_row(run_id)
+            self.assertEqual((row['__done'], row['energy'], row['passed'], row['label']),
+                             (RunProgress.DONE, -12.5, True, '7'))
+
+        self.data_manager.compact()
+        self.assertFalse((self.path / ParquetOutputManager.JOURNAL_FILE).exists())
+        self.assertEqual(self.data_manager.read_table().column('energy').to_pylist()[3], -12.5)
+        self.assertTrue((self.path / 'run_table.csv').exists())
+
+    def test_mismatching_type(self):
+        with self.assertRaises(ValueError):
+            self.data_manager.update_row_data({**self.run_table[0], 'energy': 'high'})
+
+
+if __name__ == '__main__':
+    unittest.main()
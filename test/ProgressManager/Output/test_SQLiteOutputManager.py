@@ -0,0 +1,89 @@
+import csv
+import os
+import pwd
+import sqlite3
+import tempfile
+import unittest
+from multiprocessing import Process
+from pathlib import Path
+from unittest import mock
+
+from ConfigValidator.Config.Models.Metadata import Metadata
+from ConfigValidator.CustomErrors.ExperimentOutputErrors import ExperimentOutputFileDoesNotExistError
+from ProgressManager.Output.SQLiteOutputManager import SQLiteOutputManager
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+def run_table(n):
+    return [{'__run_id': f'run_{i}_repetition_0', '__done': RunProgress.TODO, 'a': i, 'flag': i % 2 == 0,
+             'value': ''} for i in range(n)]
+
+
+def complete_runs(path, run_ids):
+    data_manager = SQLiteOutputManager(path)
+    for run_id in run_ids:
+        data_manager.update_row_data({**data_manager.read_row(run_id), '__done': RunProgress.DONE, 'value': 0.5})
+
+
+class TestSQLiteOutputManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.data_manager = SQLiteOutputManager(self.path)
+        self.data_manager.write_run_table(run_table(4))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.data_manager.update_row_data({**run_table(4)[2], '__done': RunProgress.DONE, 'value': 1.25})
+        self.data_manager.append_rows([{**run_table(1)[0], '__run_id': 'run_0_repetition_1', 'value': None}])
+
+        rows = self.data_manager.read_run_table()
+        self.assertEqual([row['__run_id'] for row in rows][-1], 'run_0_repetition_1')
+        self.assertEqual(rows[2]['__done'], RunProgress.DONE)
+        self.assertEqual(rows[2]['value'], 1.25)
+        self.assertEqual(rows[1]['flag'], 'False')  # same str() representation as the CSV
+        self.assertEqual(self.data_manager.read_row('run_3_repetition_0')['a'], 3)
+        self.assertIsNone(self.data_manager.read_row('run_9_repetition_0'))
+        self.assertEqual(self.data_manager.read_progress(), {RunProgress.TODO: 4, RunProgress.DONE: 1})
+
+    def test_wal_mode_and_index(self):
+        with sqlite3.connect(self.path / SQLiteOutputManager.DATABASE_FILE) as connection:
+            self.assertEqual(connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            plan = connection.execute('EXPLAIN QUERY PLAN SELECT * FROM run_table WHERE "__run_id" = ?',
+                                      ['run_1_repetition_0']).fetchall()
+        self.assertIn('run_table_run_id', str(plan))
+
+    def test_concurrent_updates(self):
+        self.data_manager.write_run_table(run_table(40))
+        run_ids = [row['__run_id'] for row in run_table(40)]
+        processes = [Process(target=complete_runs, args=[self.path, run_ids[i::4]]) for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual(self.data_manager.read_progress(), {RunProgress.DONE: 40})
+
+    def test_metadata(self):
+        self.data_manager.write_metadata(Metadata(b'abc'))
+        self.assertEqual(self.data_manager.read_metadata().md5sum, b'abc')
+
+    @mock.patch('os.getlogin', lambda: pwd.getpwuid(os.getuid()).pw_name)
+    def test_compact_exports_csv(self):
+        self.data_manager.update_row_data({**run_table(4)[0], '__done': RunProgress.DONE, 'value': 3})
+        self.data_manager.compact()
+
+        with open(self.path / 'run_table.csv') as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        self.assertEqual([row['__done'] for row in rows], ['DONE', 'TODO', 'TODO', 'TODO'])
+        self.assertEqual(rows[0]['value'], '3')
+
+    def test_missing_database(self):
+        with self.assertRaises(ExperimentOutputFileDoesNotExistError):
+            SQLiteOutputManager(self.path / 'other').read_run_table()
+
+
+if __name__ == '__main__':
+    unittest.main()
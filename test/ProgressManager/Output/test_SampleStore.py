@@ -0,0 +1,87 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ProgressManager.Output.SampleStore import SampleWriter, read_samples
+
+
+class TestSampleStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_chunked_appends_are_memory_mapped(self):
+        with SampleWriter(self.run_dir, chunk_size=100) as writer:
+            for i in range(250):
+                writer.append('EnergiBridge', 'CPU_POWER', i * 0.5, timestamp_ns=i)
+            writer.extend('ps', 'cpu', [1.0, 2.0], [5, 6])
+
+            # Full chunks are readable while the run is still writing
+            self.assertEqual(len(read_samples(self.run_dir)), 200)
+
+        samples = read_samples(self.run_dir)
+        self.assertIsInstance(samples.value, np.memmap)
+        self.assertEqual(len(samples), 252)
+        timestamps, values = samples.select('EnergiBridge', 'CPU_POWER')
+        np.testing.assert_array_equal(timestamps, np.arange(250))
+        np.testing.assert_array_equal(values, np.arange(250) * 0.5)
+        np.testing.assert_array_equal(samples.select(metric='cpu')[1], [1.0, 2.0])
+        self.assertEqual(len(samples.select(source='unknown')[0]), 0)
+
+    def test_compressed(self):
+        writer = SampleWriter(self.run_dir)
+        writer.extend('nvml', 'power', np.arange(1000.0), np.arange(1000))
+        writer.close(compress=True)
+
+        self.assertFalse((self.run_dir / 'samples' / 'value.bin').exists())
+        samples = read_samples(self.run_dir)
+        np.testing.assert_array_equal(samples.select('nvml', 'power')[1], np.arange(1000.0))
+
+    def test_threads_share_a_writer(self):
+        writer = SampleWriter(self.run_dir, chunk_size=64)
+
+        def log(source):
+            for i in range(500):
+                writer.append(source, 'power', i)
+
+        threads = [threading.Thread(target=log, args=[f'source{i}']) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        samples = read_samples(self.run_dir)
+        for i in range(4):
+            self.assertEqual(sorted(samples.select(f'source{i}')[1]), list(range(500)))
+
+    def test_ingest_parsed_log(self):
+        log = pd.DataFrame({'Time': [1000, 1200], 'CPU_POWER': [3.5, 4.5], 'label': ['a', 'b']})
+        with SampleWriter(self.run_dir) as writer:
+            writer.ingest(log, 'EnergiBridge', timestamp_column='Time', time_unit='ms')
+
+        samples = read_samples(self.run_dir)
+        self.assertEqual(samples.metrics, ['CPU_POWER'])
+        timestamps, values = samples.select('EnergiBridge', 'CPU_POWER')
+        np.testing.assert_array_equal(timestamps, [1_000_000_000, 1_200_000_000])
+        np.testing.assert_array_equal(values, [3.5, 4.5])
+
+    def test_partially_written_chunk(self):
+        with SampleWriter(self.run_dir) as writer:
+            writer.extend('ps', 'cpu', [1.0, 2.0, 3.0], [1, 2, 3])
+
+        # A crash halfway through appending the next chunk
+        with open(self.run_dir / 'samples' / 'timestamp.bin', 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        self.assertEqual(len(read_samples(self.run_dir)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import itertools
+import time
+import tracemalloc
+import unittest
+
+from ConfigValidator.Config.Models.FactorModel import FactorModel
+from ConfigValidator.Config.Models.RunTableModel import RunTableModel
+from ConfigValidator.Config.Models.SchedulingStrategy import SchedulingStrategy
+from ProgressManager.RunTable.LazyRunTable import RandomPermutation
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+
+
+class TestRandomPermutation(unittest.TestCase):
+    def test_is_permutation(self):
+        for size in [1, 7, 1000, RandomPermutation.MAX_STORED_SIZE + 3]:
+            permutation = RandomPermutation(size, seed=size)
+            self.assertEqual(sorted(map(permutation, range(size))), list(range(size)))
+
+    def test_seeded(self):
+        size = RandomPermutation.MAX_STORED_SIZE * 2
+        self.assertEqual(RandomPermutation(size, seed=1)(5), RandomPermutation(size, seed=1)(5))
+        self.assertNotEqual([RandomPermutation(size, seed=1)(i) for i in range(5)],
+                            [RandomPermutation(size, seed=2)(i) for i in range(5)])
+
+
+class TestLazyRunTable(unittest.TestCase):
+    def setUp(self):
+        self.factors = [FactorModel("size", [1, 2, 3]), FactorModel("cached", [True, False]),
+                        FactorModel("name", ['a', 'b'])]
+        self.model = RunTableModel(factors=self.factors, repetitions=2, data_columns=['energy'])
+        self.run_table = self.model.generate_experiment_run_table()
+
+    def test_rows_follow_the_factorial_design(self):
+        combinations = list(itertools.product(*[factor.treatments for factor in self.factors]))
+        self.assertEqual(len(self.run_table), 2 * len(combinations))
+        for position, run in enumerate(self.run_table):
+            repetition, treatment = divmod(position, len(combinations))
+            self.assertEqual(run, {'__run_id': f'run_{treatment}_repetition_{repetition}',
+                                   '__done': RunProgress.TODO, 'energy': " ",
+                                   **dict(zip(['size', 'cached', 'name'], combinations[treatment]))})
+        self.assertEqual(self.run_table[-1]['__run_id'], 'run_11_repetition_1')
+        self.assertEqual([run['__run_id'] for run in self.run_table[1:3]], ['run_1_repetition_0',
+                                                                            'run_2_repetition_0'])
+
+    def test_huge_design(self):
+        factors = [FactorModel(f"factor{i}", list(range(10))) for i in range(10)]
+        tracemalloc.start()
+        start = time.monotonic()
+        run_table = RunTableModel(factors=factors, repetitions=3, shuffle=True).generate_experiment_run_table()
+        self.assertEqual(len(run_table), 3 * 10 ** 10)
+        run = run_table[123_456_789]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(peak, 1_000_000)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(run_table.run(run_table.run_number_of(run['__run_id'])), run)
+
+    def test_progress(self):
+        stored = {}
+        self.run_table.completed_row_loader = stored.get
+
+        done = {**self.run_table[3], '__done': RunProgress.DONE, 'energy': 12}
+        stored[done['__run_id']] = done
+        self.run_table[3] = done
+        failed = {**self.run_table[5], '__done': RunProgress.FAILED}
+        self.run_table[5] = failed
+
+        self.assertEqual(self.run_table[3], done)
+        self.assertIsNot(self.run_table[3], done)  # read back through the loader
+        self.assertIs(self.run_table[5], failed)
+        self.assertEqual([position for position, _ in self.run_table.pending()],
+                         [position for position in range(1, 25) if position != 4])
+
+    def test_reorder_and_append(self):
+        order = list(reversed(range(len(self.run_table))))
+        self.run_table.reorder(order)
+        self.assertEqual(self.run_table[0]['__run_id'], 'run_11_repetition_1')
+
+        extra = self.model.generate_repetition(self.run_table[0], 2)
+        self.run_table.append(extra)
+        self.assertIs(self.run_table[24], extra)
+        self.assertEqual(self.run_table.run_number_of('run_11_repetition_2'), 24)
+        self.assertIsNone(self.run_table.run_number_of('run_12_repetition_0'))
+
+    def test_schedules_are_permutations(self):
+        for scheduling in SchedulingStrategy:
+            run_table = RunTableModel(factors=self.factors, repetitions=3, scheduling=scheduling) \
+                .generate_experiment_run_table()
+            run_ids = [run['__run_id'] for run in run_table]
+            self.assertEqual(len(set(run_ids)), 36, scheduling)
+
+
+if __name__ == '__main__':
+    unittest.main()
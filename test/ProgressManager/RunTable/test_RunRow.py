@@ -0,0 +1,70 @@
+import pickle
+import unittest
+
+import dill
+
+from ProgressManager.RunTable.Models.RunProgress import RunProgress
+from ProgressManager.RunTable.RunRow import RowLayout, RunRow
+
+
+class TestRunRow(unittest.TestCase):
+    def setUp(self):
+        self.layout = RowLayout(['size', 'cached'], [[10, 20, 30], [True, False]], ['energy', 'time'])
+        # Combination 3 = (20, False)
+        self.row = RunRow(self.layout, 3, ['run_3_repetition_0', RunProgress.TODO, " ", " "])
+        self.expected = {'__run_id': 'run_3_repetition_0', '__done': RunProgress.TODO, 'size': 20, 'cached': False,
+                         'energy': " ", 'time': " "}
+
+    def test_behaves_like_dict(self):
+        self.assertEqual(self.row, self.expected)
+        self.assertEqual(self.expected, self.row)
+        self.assertEqual(list(self.row), list(self.expected))
+        self.assertEqual({**self.row}, self.expected)
+        self.assertEqual(self.row.get('missing', 1), 1)
+        self.assertNotIn('missing', self.row)
+        with self.assertRaises(KeyError):
+            self.row['missing']
+
+    def test_update(self):
+        self.row['energy'] = 12.5
+        self.row['self-measure'] = 0.25
+        self.row['size'] = 25
+        del self.row['time']
+        self.assertEqual(self.row, {'__run_id': 'run_3_repetition_0', '__done': RunProgress.TODO, 'size': 25,
+                                    'cached': False, 'energy': 12.5, 'self-measure': 0.25})
+        self.assertEqual(list(self.row)[-1], 'self-measure')
+        self.assertEqual(len(self.row), 6)
+
+        self.row['time'] = 3
+        self.assertEqual(self.row['time'], 3)
+        self.assertEqual(len(self.row), 7)
+
+    def test_copy_is_independent(self):
+        copy = self.row.copy()
+        copy['energy'] = 1
+        copy['extra'] = 2
+        self.assertEqual(self.row, self.expected)
+
+    def test_pickle(self):
+        for dumps, loads in [(pickle.dumps, pickle.loads), (dill.dumps, dill.loads)]:
+            self.row['energy'] = 1.5
+            restored = loads(dumps(self.row))
+            self.assertIsInstance(restored, RunRow)
+            self.assertEqual(restored, self.row)
+
+        layout = RowLayout([f'factor{i}' for i in range(6)], [['low', 'medium', 'high']] * 6, ['energy', 'time'])
+        row = RunRow(layout, 500, ['run_500_repetition_0', RunProgress.TODO, " ", " "])
+        self.assertLess(len(pickle.dumps(row)), len(pickle.dumps(dict(row))))
+
+    def test_pickled_layout_is_shared(self):
+        layout = pickle.loads(pickle.dumps(self.layout))
+        self.assertIs(layout, self.layout)
+
+    def test_unknown_layout(self):
+        data = pickle.dumps(RunRow(RowLayout(['size'], [[1]], []), 0, ['run_0_repetition_0', RunProgress.TODO]))
+        with self.assertRaises(pickle.UnpicklingError):
+            pickle.loads(data)
+
+
+if __name__ == '__main__':
+    unittest.main()